@@ -8,12 +8,57 @@ import time
 from typing import Any
 
 import boto3
+from botocore.config import Config
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+
+class _JsonMessage:
+    """Log message that defers JSON encoding until the record is emitted."""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: dict[str, Any]) -> None:
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return json.dumps(self.fields, separators=(",", ":"))
+
+
 DEFAULT_TABLE = "benchmark-test-data"
-dynamodb = boto3.client("dynamodb")
+# Each execution environment serves one request at a time, so a single pooled connection is
+# all the client ever uses. Timeouts and retries stay at SDK defaults, matching the Node.js and
+# Rust handlers.
+dynamodb = boto3.client(
+    "dynamodb",
+    config=Config(max_pool_connections=1, tcp_keepalive=True),
+)
+
+# Resolved once per execution environment instead of on every invocation
+TABLE_NAME = os.environ.get("DYNAMODB_TABLE_NAME") or DEFAULT_TABLE
+ARCHITECTURE = platform.machine()  # aarch64 or x86_64
+PYTHON_VERSION = platform.python_version()
+RUNTIME = f"python{PYTHON_VERSION}"
+
+# Static part of the handler_start record, encoded once; only the request ID varies per call
+START_LOG_PREFIX = json.dumps(
+    {
+        "event": "handler_start",
+        "workloadType": "light",
+        "runtime": RUNTIME,
+        "architecture": ARCHITECTURE,
+    },
+    separators=(",", ":"),
+)[:-1]
+
+# Attributes shared by every test item; only keys, timestamps, and data vary per request
+ITEM_TEMPLATE = {
+    "sk": {"S": "light"},
+    "workload": {"S": "light"},
+    "runtime": {"S": RUNTIME},
+    "architecture": {"S": ARCHITECTURE},
+}
 
 
 def lambda_handler(_event: dict[str, Any] | None, context) -> dict[str, Any]:
@@ -23,29 +68,27 @@ def lambda_handler(_event: dict[str, Any] | None, context) -> dict[str, Any]:
     baseline Lambda invocation and SDK initialization overhead with realistic
     multi-item I/O patterns.
     """
-    logger.info(json.dumps({
-        "event": "handler_start",
-        "workloadType": "light",
-        "runtime": f"python{platform.python_version()}",
-        "architecture": platform.machine(),
-        "requestId": getattr(context, "aws_request_id", "unknown")
-    }))
+    # Request IDs are UUIDs, so they need no JSON escaping
+    logger.info(
+        '%s,"requestId":"%s"}',
+        START_LOG_PREFIX,
+        getattr(context, "aws_request_id", "unknown"),
+    )
 
     try:
         write_result = _write_batch()
 
+        expected = write_result["expected"]
+
         # Batch read back the same items to verify round-trip
-        read_result = _read_batch(write_result["itemIds"])
+        read_result = _read_batch(list(expected))
 
-        # Match items by ID (batch_get_item doesn't guarantee order)
-        all_match = all(
-            read_result["items"].get(item["itemId"]) == item["data"]
-            for item in write_result["items"]
-        )
+        # Compare by ID (batch_get_item doesn't guarantee order)
+        all_match = read_result["items"] == expected
 
-        logger.info(json.dumps({
+        logger.info(_JsonMessage({
             "event": "handler_success",
-            "itemsWritten": len(write_result["items"]),
+            "itemsWritten": len(expected),
             "itemsRead": len(read_result["items"]),
             "writeRequestId": write_result["requestId"],
             "readRequestId": read_result["requestId"],
@@ -55,17 +98,17 @@ def lambda_handler(_event: dict[str, Any] | None, context) -> dict[str, Any]:
         return {
             "success": True,
             "workloadType": "light",
-            "architecture": platform.machine(),
-            "pythonVersion": platform.python_version(),
+            "architecture": ARCHITECTURE,
+            "pythonVersion": PYTHON_VERSION,
             "memoryLimitMB": int(getattr(context, "memory_limit_in_mb", 0) or 0),
-            "itemsWritten": len(write_result["items"]),
+            "itemsWritten": len(expected),
             "itemsRead": len(read_result["items"]),
             "writeRequestId": write_result["requestId"],
             "readRequestId": read_result["requestId"],
             "allDataMatches": all_match,
         }
     except Exception as e:
-        logger.error(json.dumps({
+        logger.error(_JsonMessage({
             "event": "handler_error",
             "errorType": type(e).__name__,
             "errorMessage": str(e)
@@ -75,62 +118,55 @@ def lambda_handler(_event: dict[str, Any] | None, context) -> dict[str, Any]:
 
 def _write_batch() -> dict[str, Any]:
     """Batch write 5 test items to DynamoDB with 24-hour TTL."""
-    table = os.environ.get("DYNAMODB_TABLE_NAME") or DEFAULT_TABLE
-    now_ms = int(time.time() * 1000)
-    arch = platform.machine()  # aarch64 or x86_64
-    python_ver = platform.python_version()
-    ttl = int(time.time()) + 86_400  # 24h in seconds
+    now_ns = time.time_ns()
+    now_ms = now_ns // 1_000_000
+    ttl = str(now_ns // 1_000_000_000 + 86_400)  # 24h in seconds
 
     # Create 5 items with unique IDs
     items = []
     for i in range(5):
         item_id = f"test-{now_ms}-{i}"
-        data = f"benchmark test data - python{python_ver} {arch} - item {i}"
+        data = f"benchmark test data - {RUNTIME} {ARCHITECTURE} - item {i}"
         items.append({
             "itemId": item_id,
             "data": data,
             "item": {
+                **ITEM_TEMPLATE,
                 "pk": {"S": item_id},
-                "sk": {"S": "light"},
                 "timestamp": {"N": str(now_ms + i)},
-                "ttl": {"N": str(ttl)},
-                "workload": {"S": "light"},
-                "runtime": {"S": f"python{python_ver}"},
-                "architecture": {"S": arch},
+                "ttl": {"N": ttl},
                 "data": {"S": data},
             }
         })
 
     # Batch write all items
     request_items = {
-        table: [{"PutRequest": {"Item": item["item"]}} for item in items]
+        TABLE_NAME: [{"PutRequest": {"Item": item["item"]}} for item in items]
     }
     resp = dynamodb.batch_write_item(RequestItems=request_items)
 
     return {
         "requestId": resp["ResponseMetadata"]["RequestId"],
-        "itemIds": [item["itemId"] for item in items],
-        "items": [{"itemId": item["itemId"], "data": item["data"]} for item in items]
+        "expected": {item["itemId"]: item["data"] for item in items},
     }
 
 
 def _read_batch(item_ids: list[str]) -> dict[str, Any]:
     """Batch read 5 test items from DynamoDB to verify write."""
-    table = os.environ.get("DYNAMODB_TABLE_NAME") or DEFAULT_TABLE
 
     # Batch read all items
     keys = [{"pk": {"S": item_id}, "sk": {"S": "light"}} for item_id in item_ids]
     resp = dynamodb.batch_get_item(
         RequestItems={
-            table: {"Keys": keys}
+            TABLE_NAME: {"Keys": keys}
         }
     )
 
-    if table not in resp.get("Responses", {}):
-        msg = f"No responses from table: {table}"
+    if TABLE_NAME not in resp.get("Responses", {}):
+        msg = f"No responses from table: {TABLE_NAME}"
         raise ValueError(msg)
 
-    items = resp["Responses"][table]
+    items = resp["Responses"][TABLE_NAME]
     if len(items) != len(item_ids):
         msg = f"Expected {len(item_ids)} items, got {len(items)}"
         raise ValueError(msg)
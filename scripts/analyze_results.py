@@ -12,15 +12,24 @@ Usage:
     python analyze_results.py <test_run_id>
     python analyze_results.py <test_run_id> --runtime python3.13
     python analyze_results.py <test_run_id> --workload cpu-intensive
+    python analyze_results.py <test_run_id> --refresh
+    python analyze_results.py <test_run_id> --dpi 100
 """
 
 import argparse
+import json
 import logging
+import os
 import re
 import sys
 from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import pairwise
+from operator import itemgetter
 from pathlib import Path
+from statistics import fmean
 from typing import Any
 
 import boto3
@@ -34,12 +43,12 @@ from benchmark_utils import (
     RUNTIME_FAMILIES,
     calculate_cost_per_million,
     calculate_cost_savings,
-    calculate_invocation_cost,
-    decimal_to_float,
     format_workload_name,
-    get_field_name,
 )
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from matplotlib.font_manager import FontProperties
+from matplotlib.ticker import FixedLocator, FuncFormatter
 
 # Configure logging
 logging.basicConfig(
@@ -47,7 +56,13 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
-dynamodb = boto3.client("dynamodb")
+dynamodb = boto3.client(
+    "dynamodb",
+    config=Config(
+        retries={"max_attempts": 5, "mode": "adaptive"},  # Back off client-side when throttled
+        tcp_keepalive=True,
+    ),
+)
 
 # =============================================================================
 # Runtime Sorting Utilities
@@ -106,26 +121,23 @@ def sort_runtimes_newest_first(runtimes: list[str]) -> list[str]:
     return sorted(runtimes, key=extract_runtime_sort_key)
 
 
-def sort_runtime_keys_newest_first(keys: list[str]) -> list[str]:
+def sort_runtime_keys_newest_first(keys: list[tuple[str, str]]) -> list[tuple[str, str]]:
     """
-    Sort runtime-architecture keys (e.g., 'python3.14-arm64') by runtime newest first.
+    Sort (runtime, architecture) keys (e.g., ('python3.14', 'arm64')) by runtime newest first.
 
-    Extracts runtime from key, sorts by newest first, then by architecture (arm64 before x86).
+    Sorts by newest runtime first, then by architecture (arm64 before x86).
 
     Args:
-        keys: List of runtime-architecture keys
+        keys: List of (runtime, architecture) keys
 
     Returns:
         Sorted list with newest runtimes first, arm64 before x86 within each runtime
     """
-    def key_sort_func(key: str) -> tuple[str, float, str]:
-        parts = key.rsplit('-', 1)
-        if len(parts) == 2:
-            runtime, arch = parts
-            lang, neg_version = extract_runtime_sort_key(runtime)
-            # Sort arm64 before x86 (a comes before x)
-            return (lang, neg_version, arch)
-        return ('zzz', 0.0, key)  # Fallback for unexpected format
+    def key_sort_func(key: tuple[str, str]) -> tuple[str, float, str]:
+        runtime, arch = key
+        lang, neg_version = extract_runtime_sort_key(runtime)
+        # Sort arm64 before x86 (a comes before x)
+        return (lang, neg_version, arch)
 
     return sorted(keys, key=key_sort_func)
 
@@ -138,12 +150,55 @@ def sort_runtime_keys_newest_first(keys: list[str]) -> list[str]:
 BAR_WIDTH_STANDARD = 0.35
 BAR_WIDTH_NARROW = 0.25
 FAMILY_SPACING = 1.0
+# Matches published-results/; --dpi lowers it for quick looks (see DECISIONS.md D006)
 CHART_DPI = 300
+# zlib level 1 instead of Pillow's default 6: ~20% faster savefig for ~20% larger PNGs
+CHART_PNG_OPTIONS = {"compress_level": 1}
+
+# Bar value labels: shared font (Text copies it, so no per-label font setup) and the number
+# of runtimes above which per-bar labels are dropped because they would overlap
+VALUE_LABEL_FONT = FontProperties(size=8, weight="bold")
+MAX_VALUE_LABELED_RUNTIMES = 12
+
+# Memory line chart styling: ARM64 solid with circles, x86 dashed with squares
+ARCH_LINE_STYLES = {
+    "arm64": {"linestyle": "-", "marker": "o", "linewidth": 2.5},
+    "x86": {"linestyle": "--", "marker": "s", "linewidth": 2},
+}
+
+# Charts take their resolution from rcParams rather than per-call dpi= arguments, so --dpi
+# can override it once per chart worker (see init_chart_worker)
+plt.rcParams["savefig.dpi"] = CHART_DPI
 
 # =============================================================================
 # DynamoDB Parsing Functions
 # =============================================================================
 
+# Aggregate attributes read by the analysis (both current and legacy stats field names), so
+# queries skip the rest of each item. Names are aliased because projection expressions
+# reject DynamoDB reserved words.
+
+AGGREGATE_ATTRIBUTES = (
+    "runtime",
+    "architecture",
+    "workloadType",
+    "memorySizeMB",
+    "invocationType",
+    "sampleCount",
+    "allSuccessful",
+    "failedCount",
+    "durationMsStats",
+    "durationStats",
+    "billedDurationMsStats",
+    "billedDurationStats",
+    "memoryMBStats",
+    "memoryStats",
+    "initDurationMsStats",
+    "initDurationStats",
+)
+AGGREGATE_ATTRIBUTE_NAMES = {f"#a{i}": name for i, name in enumerate(AGGREGATE_ATTRIBUTES)}
+AGGREGATE_PROJECTION = ", ".join(AGGREGATE_ATTRIBUTE_NAMES)
+
 
 def parse_test_matrix(matrix_item: dict[str, Any]) -> dict[str, Any]:
     """
@@ -158,19 +213,24 @@ def parse_test_matrix(matrix_item: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Dictionary with runtimes, architectures, workloadTypes, and configurations lists
     """
+    get_string = itemgetter("S")
+    get_config_fields = itemgetter("runtime", "architecture", "workloadType", "memorySizes")
+
+    configurations = []
+    for config in matrix_item["configurations"]["L"]:
+        runtime, architecture, workload_type, memory_sizes = get_config_fields(config["M"])
+        configurations.append({
+            "runtime": runtime["S"],
+            "architecture": architecture["S"],
+            "workloadType": workload_type["S"],
+            "memorySizes": [int(m["N"]) for m in memory_sizes["L"]],
+        })
+
     return {
-        "runtimes": [r["S"] for r in matrix_item["runtimes"]["L"]],
-        "architectures": [a["S"] for a in matrix_item["architectures"]["L"]],
-        "workloadTypes": [w["S"] for w in matrix_item["workloadTypes"]["L"]],
-        "configurations": [
-            {
-                "runtime": config["M"]["runtime"]["S"],
-                "architecture": config["M"]["architecture"]["S"],
-                "workloadType": config["M"]["workloadType"]["S"],
-                "memorySizes": [int(m["N"]) for m in config["M"]["memorySizes"]["L"]],
-            }
-            for config in matrix_item["configurations"]["L"]
-        ],
+        "runtimes": list(map(get_string, matrix_item["runtimes"]["L"])),
+        "architectures": list(map(get_string, matrix_item["architectures"]["L"])),
+        "workloadTypes": list(map(get_string, matrix_item["workloadTypes"]["L"])),
+        "configurations": configurations,
     }
 
 
@@ -246,66 +306,164 @@ def parse_stats_map(item: dict[str, Any], preferred: str, fallback: str) -> dict
     (e.g., durationMsStats vs durationStats) and converting DynamoDB format
     to Python-friendly dictionaries.
 
+
     Args:
         item: DynamoDB item containing statistics
         preferred: Preferred field name (new format, e.g., "durationMsStats")
         fallback: Fallback field name (old format, e.g., "durationStats")
 
     Returns:
-        Dictionary with stats converted from Decimal to float, or empty dict if field not found
+        Dictionary with numeric stats as floats, or empty dict if field not found
     """
-    key = get_field_name(item, preferred, fallback)
-    if not key or key not in item:
+    # Prefer the new field name, falling back to the old one
+    stats = item.get(preferred if preferred in item else fallback)
+    if stats is None:
         return {}
 
-    stats_map = dict(item[key]["M"].items())
-    return decimal_to_float({k: parse_stats_value(v) for k, v in stats_map.items()})
+    # Numbers are the common case, so they are converted inline without a function call.
+    # The low-level client returns numbers as strings, so no Decimal values need converting.
+    return {
+        k: float(v["N"]) if "N" in v else parse_stats_value(v) for k, v in stats["M"].items()
+    }
 
 
-def get_all_aggregates(test_run_id: str) -> list[dict[str, Any]]:
+def get_all_aggregates(
+    test_run_id: str,
+    runtime: str | None = None,
+    architecture: str | None = None,
+    workload_type: str | None = None,
+) -> list[dict[str, Any]]:
     """
     Query all aggregate statistics for a test run.
 
-    Returns aggregate items in a Python-friendly format.
-    Cost: ~0.03 RCUs = $0.000004
+    Follows query pagination so runs larger than one 1 MB response page are
+    read completely, and projects only the attributes used by the analysis.
+
+    Optional filters are applied by DynamoDB rather than after the fetch. Aggregate
+    sort keys start with the config ID ({runtime}-{architecture}-...), so a runtime
+    filter (plus architecture) narrows the key condition itself; the remaining
+    filters become a FilterExpression.
+
+    Args:
+        test_run_id: UUID of the test run
+        runtime: Only return aggregates for this runtime (e.g., "python3.13")
+        architecture: Only return aggregates for this architecture ("arm64", "x86")
+        workload_type: Only return aggregates for this workload type
+
+    Returns:
+        Aggregate items in a Python-friendly format (unfiltered cost: ~0.03 RCUs = $0.000004)
     """
-    response = dynamodb.query(
-        TableName=RESULTS_TABLE_NAME,
-        KeyConditionExpression="pk = :pk AND begins_with(sk, :sk_prefix)",
-        ExpressionAttributeValues={
+    sk_prefix = "AGGREGATE#"
+    if runtime:
+        sk_prefix += f"{runtime}-"
+        if architecture:
+            sk_prefix += f"{architecture}-"
+
+    query_args: dict[str, Any] = {
+        "TableName": RESULTS_TABLE_NAME,
+        "KeyConditionExpression": "pk = :pk AND begins_with(sk, :sk_prefix)",
+        "ProjectionExpression": AGGREGATE_PROJECTION,
+        "ExpressionAttributeNames": dict(AGGREGATE_ATTRIBUTE_NAMES),
+        "ExpressionAttributeValues": {
             ":pk": {"S": f"TESTRUN#{test_run_id}"},
-            ":sk_prefix": {"S": "AGGREGATE#"},
+            ":sk_prefix": {"S": sk_prefix},
         },
-    )
+    }
+
+    filters = []
+    if architecture and not runtime:
+        filters.append("#architecture = :architecture")
+        query_args["ExpressionAttributeNames"]["#architecture"] = "architecture"
+        query_args["ExpressionAttributeValues"][":architecture"] = {"S": architecture}
+    if workload_type:
+        filters.append("#workloadType = :workload_type")
+        query_args["ExpressionAttributeNames"]["#workloadType"] = "workloadType"
+        query_args["ExpressionAttributeValues"][":workload_type"] = {"S": workload_type}
+    if filters:
+        query_args["FilterExpression"] = " AND ".join(filters)
+
+    paginator = dynamodb.get_paginator("query")
+    pages = paginator.paginate(**query_args)
 
     aggregates = []
-    for item in response["Items"]:
-        agg = {
-            "runtime": item["runtime"]["S"],
-            "architecture": item["architecture"]["S"],
-            "workloadType": item["workloadType"]["S"],
-            "memorySizeMB": int(item["memorySizeMB"]["N"]),
-            "invocationType": item["invocationType"]["S"],
-            "sampleCount": int(item["sampleCount"]["N"]),
-            "allSuccessful": item["allSuccessful"]["BOOL"],
-            "failedCount": int(item["failedCount"]["N"]),
-            "durationStats": parse_stats_map(item, "durationMsStats", "durationStats"),
-            "billedDurationStats": parse_stats_map(
-                item, "billedDurationMsStats", "billedDurationStats"
-            ),
-            "memoryStats": parse_stats_map(item, "memoryMBStats", "memoryStats"),
-        }
+    for page in pages:
+        for item in page["Items"]:
+            # Stats field names are resolved per item: on current-format items that is a single
+            # membership test, and it keeps runs that mix legacy and current names readable
+            agg = {
+                "runtime": item["runtime"]["S"],
+                "architecture": item["architecture"]["S"],
+                "workloadType": item["workloadType"]["S"],
+                "memorySizeMB": int(item["memorySizeMB"]["N"]),
+                "invocationType": item["invocationType"]["S"],
+                "sampleCount": int(item["sampleCount"]["N"]),
+                "allSuccessful": item["allSuccessful"]["BOOL"],
+                "failedCount": int(item["failedCount"]["N"]),
+                "durationStats": parse_stats_map(item, "durationMsStats", "durationStats"),
+                "billedDurationStats": parse_stats_map(
+                    item, "billedDurationMsStats", "billedDurationStats"
+                ),
+                "memoryStats": parse_stats_map(item, "memoryMBStats", "memoryStats"),
+            }
 
-        # Init duration stats only present for cold starts
-        init_stats = parse_stats_map(item, "initDurationMsStats", "initDurationStats")
-        if init_stats:
-            agg["initDurationStats"] = init_stats
+            # Init duration stats only present for cold starts
+            init_stats = parse_stats_map(item, "initDurationMsStats", "initDurationStats")
+            if init_stats:
+                agg["initDurationStats"] = init_stats
 
-        aggregates.append(agg)
+            aggregates.append(agg)
 
     return aggregates
 
 
+# =============================================================================
+# Local Result Cache
+# =============================================================================
+
+CACHE_DIR = Path("results") / ".cache"
+
+
+def load_cached_results(
+    test_run_id: str,
+) -> tuple[dict[str, Any] | None, list[dict[str, Any]]] | None:
+    """
+    Load previously fetched test run info and aggregates from the local cache.
+
+    Args:
+        test_run_id: UUID of the test run
+
+    Returns:
+        Tuple of (test_run_info, aggregates), or None if there is no usable cache entry
+    """
+    cache_path = CACHE_DIR / f"{test_run_id}.json"
+    if not cache_path.exists():
+        return None
+
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        return cached["testRunInfo"], cached["aggregates"]
+    except (OSError, ValueError, KeyError) as e:
+        log.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+        return None
+
+
+def save_cached_results(
+    test_run_id: str, test_run_info: dict[str, Any] | None, aggregates: list[dict[str, Any]]
+) -> None:
+    """
+    Save fetched test run info and aggregates so later analyses skip DynamoDB.
+
+    Args:
+        test_run_id: UUID of the test run
+        test_run_info: Test run metadata from DynamoDB
+        aggregates: Unfiltered list of aggregate statistics
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path = CACHE_DIR / f"{test_run_id}.json"
+    payload = {"testRunInfo": test_run_info, "aggregates": aggregates}
+    cache_path.write_text(json.dumps(payload), encoding="utf-8")
+
+
 def filter_aggregates(
     aggregates: list[dict[str, Any]],
     runtime: str | None = None,
@@ -318,6 +476,7 @@ def filter_aggregates(
     """
     Filter aggregates by multiple dimensions.
 
+
     Args:
         aggregates: List of aggregate statistics
         runtime: Filter by runtime (e.g., "python3.13", "nodejs20")
@@ -330,22 +489,56 @@ def filter_aggregates(
     Returns:
         Filtered list of aggregates
     """
-    filtered = aggregates
+    # Resolve the active filters once so each row is checked by a single itemgetter comparison
+    criteria = {
+        field: value
+        for field, value in (
+            ("runtime", runtime),
+            ("architecture", architecture),
+            ("workloadType", workload_type),
+            ("invocationType", invocation_type),
+            ("memorySizeMB", memory_size_mb),
+        )
+        if value
+    }
+
+    if not criteria:
+        if not only_successful:
+            return aggregates
+        return [a for a in aggregates if a.get("allSuccessful", False)]
+
+    get_fields = itemgetter(*criteria)
+    # itemgetter returns a bare value for one key and a tuple for several
+    expected = tuple(criteria.values()) if len(criteria) > 1 else next(iter(criteria.values()))
 
-    if runtime:
-        filtered = [a for a in filtered if a["runtime"] == runtime]
-    if architecture:
-        filtered = [a for a in filtered if a["architecture"] == architecture]
-    if workload_type:
-        filtered = [a for a in filtered if a["workloadType"] == workload_type]
-    if invocation_type:
-        filtered = [a for a in filtered if a["invocationType"] == invocation_type]
-    if memory_size_mb:
-        filtered = [a for a in filtered if a["memorySizeMB"] == memory_size_mb]
     if only_successful:
-        filtered = [a for a in filtered if a.get("allSuccessful", False)]
+        return [
+            a for a in aggregates if get_fields(a) == expected and a.get("allSuccessful", False)
+        ]
+    return [a for a in aggregates if get_fields(a) == expected]
 
-    return filtered
+
+def group_aggregates(
+    aggregates: list[dict[str, Any]], *fields: str
+) -> dict[tuple[Any, ...], list[dict[str, Any]]]:
+    """
+    Group aggregates by two or more fields in a single pass.
+
+    Charts that need one subset per combination look groups up here instead of calling
+    filter_aggregates (a full scan) once per combination.
+
+    Args:
+        aggregates: List of aggregate statistics
+        *fields: Aggregate field names to group by (e.g., "runtime", "architecture")
+
+    Returns:
+        Dictionary mapping field-value tuples to aggregates, in their original order
+    """
+    get_key = itemgetter(*fields)
+    groups = defaultdict(list)
+    for agg in aggregates:
+        groups[get_key(agg)].append(agg)
+    return groups
 
 
 def create_output_directory(test_run_id: str, region: str, workloads: list[str]) -> Path:
@@ -364,12 +557,11 @@ def create_output_directory(test_run_id: str, region: str, workloads: list[str])
         Path to the created results directory
     """
     results_dir = Path("results") / f"{test_run_id}-{region}"
-    results_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create subdirectories for each workload type
-    for workload in workloads:
-        (results_dir / "charts" / workload).mkdir(parents=True, exist_ok=True)
-        (results_dir / "tables" / workload).mkdir(parents=True, exist_ok=True)
+    # Create only the leaf directories; mkdir(parents=True) creates results_dir along the way
+    leaves = [results_dir / kind / workload for kind in ("charts", "tables") for workload in workloads]
+    for leaf in leaves or [results_dir]:
+        leaf.mkdir(parents=True, exist_ok=True)
 
     return results_dir
 
@@ -392,80 +584,89 @@ def generate_summary_markdown(
     """
     summary_path = output_dir / "README.md"
 
-    with open(summary_path, "w") as f:
-        f.write("# Benchmark Results Analysis\n\n")
+    parts: list[str] = []
+    parts.append("# Benchmark Results Analysis\n\n")
 
-        # Test run info
-        if test_run_info:
-            f.write("## Test Run Information\n\n")
-            timestamp = datetime.fromtimestamp(test_run_info["timestamp"] / 1000).strftime(
-                "%Y-%m-%d %H:%M:%S"
+    # Test run info
+    if test_run_info:
+        parts.append("## Test Run Information\n\n")
+        timestamp = datetime.fromtimestamp(test_run_info["timestamp"] / 1000).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        parts.append(f"- **Test Run ID**: `{test_run_info['testRunId']}`\n")
+        parts.append(f"- **Timestamp**: {timestamp}\n")
+        parts.append(f"- **Status**: {test_run_info['status']}\n")
+        parts.append(f"- **Mode**: {test_run_info['mode']}\n")
+        parts.append(f"- **Region**: {test_run_info.get('region', 'unknown')}\n")
+        if test_run_info.get("notes"):
+            parts.append(f"- **Notes**: {test_run_info['notes']}\n")
+        parts.append(f"- **Total Configurations**: {test_run_info['totalConfigurations']}\n")
+        parts.append(f"- **Total Invocations**: {test_run_info['totalInvocations']}\n")
+        parts.append(f"- **Cold Starts per Config**: {test_run_info['coldStartsPerConfig']}\n")
+        parts.append(f"- **Warm Starts per Config**: {test_run_info['warmStartsPerConfig']}\n")
+
+        # Display test matrix if present
+        if "testMatrix" in test_run_info:
+            parts.append("\n### Test Matrix\n\n")
+            matrix = test_run_info["testMatrix"]
+            parts.append(f"- **Runtimes**: {', '.join(matrix['runtimes'])}\n")
+            parts.append(f"- **Architectures**: {', '.join(matrix['architectures'])}\n")
+            parts.append(f"- **Workload Types**: {', '.join(matrix['workloadTypes'])}\n")
+            parts.append(f"- **Total Configurations**: {len(matrix['configurations'])}\n")
+
+            parts.append(
+                "\n<details>\n<summary>Click to view full configuration matrix</summary>\n\n"
             )
-            f.write(f"- **Test Run ID**: `{test_run_info['testRunId']}`\n")
-            f.write(f"- **Timestamp**: {timestamp}\n")
-            f.write(f"- **Status**: {test_run_info['status']}\n")
-            f.write(f"- **Mode**: {test_run_info['mode']}\n")
-            f.write(f"- **Region**: {test_run_info.get('region', 'unknown')}\n")
-            if test_run_info.get("notes"):
-                f.write(f"- **Notes**: {test_run_info['notes']}\n")
-            f.write(f"- **Total Configurations**: {test_run_info['totalConfigurations']}\n")
-            f.write(f"- **Total Invocations**: {test_run_info['totalInvocations']}\n")
-            f.write(f"- **Cold Starts per Config**: {test_run_info['coldStartsPerConfig']}\n")
-            f.write(f"- **Warm Starts per Config**: {test_run_info['warmStartsPerConfig']}\n")
-
-            # Display test matrix if present
-            if "testMatrix" in test_run_info:
-                f.write("\n### Test Matrix\n\n")
-                matrix = test_run_info["testMatrix"]
-                f.write(f"- **Runtimes**: {', '.join(matrix['runtimes'])}\n")
-                f.write(f"- **Architectures**: {', '.join(matrix['architectures'])}\n")
-                f.write(f"- **Workload Types**: {', '.join(matrix['workloadTypes'])}\n")
-                f.write(f"- **Total Configurations**: {len(matrix['configurations'])}\n")
-
-                f.write(
-                    "\n<details>\n<summary>Click to view full configuration matrix</summary>\n\n"
-                )
-                f.write("    | Runtime | Architecture | Workload | Memory Sizes (MB) |\n")
-                f.write("    |---------|--------------|----------|-------------------|\n")
-                for config in matrix["configurations"]:
-                    memory_str = ", ".join(str(m) for m in config["memorySizes"])
-                    f.write(
-                        f"    | {config['runtime']} | {config['architecture']} | "
-                        f"{config['workloadType']} | {memory_str} |\n"
-                    )
-                f.write("\n</details>\n\n")
-            else:
-                f.write("\n")
+            parts.append("    | Runtime | Architecture | Workload | Memory Sizes (MB) |\n")
+            parts.append("    |---------|--------------|----------|-------------------|\n")
+            row = "    | {runtime} | {architecture} | {workloadType} | {memory_str} |\n"
+            parts.extend(
+                row.format_map({**config, "memory_str": ", ".join(map(str, config["memorySizes"]))})
+                for config in matrix["configurations"]
+            )
+            parts.append("\n</details>\n\n")
         else:
-            f.write("## Test Run Information\n\n*Test run metadata not available*\n\n")
-
-        # Summary stats
-        f.write("## Summary Statistics\n\n")
-        f.write(f"- **Total Aggregates**: {len(aggregates)}\n")
-
-        runtimes = sort_runtimes_newest_first(list({a["runtime"] for a in aggregates}))
-        workloads = sorted({a["workloadType"] for a in aggregates})
-        architectures = sorted({a["architecture"] for a in aggregates})
-
-        f.write(f"- **Runtimes Tested**: {', '.join(runtimes)}\n")
-        f.write(f"- **Workload Types**: {', '.join(workloads)}\n")
-        f.write(f"- **Architectures**: {', '.join(architectures)}\n\n")
-
-        # Table of contents
-        f.write("## Contents\n\n")
-        f.write("### Comparison Tables\n\n")
-        for workload in workloads:
-            f.write(f"- [{format_workload_name(workload)}](tables/{workload}/)\n")
-            f.write(f"  - [Cold Starts](tables/{workload}/cold.md)\n")
-            f.write(f"  - [Warm Starts](tables/{workload}/warm.md)\n")
-        f.write("\n### Charts\n\n")
-        for workload in workloads:
-            f.write(f"- [{format_workload_name(workload)}](charts/{workload}/)\n")
-            f.write("  - Memory Scaling (cold & warm)\n")
-            f.write("  - P99 Duration Scaling (cold & warm)\n")
-            f.write("  - Cost Effectiveness (cold & warm)\n")
-            f.write("  - Runtime Family P99 Comparison (warm)\n")
-        f.write("- [Cold Start Analysis](charts/cold-start-analysis.png)\n\n")
+            parts.append("\n")
+    else:
+        parts.append("## Test Run Information\n\n*Test run metadata not available*\n\n")
+
+    # Summary stats
+    parts.append("## Summary Statistics\n\n")
+    parts.append(f"- **Total Aggregates**: {len(aggregates)}\n")
+
+    runtimes = sort_runtimes_newest_first(list({a["runtime"] for a in aggregates}))
+    workloads = sorted({a["workloadType"] for a in aggregates})
+    architectures = sorted({a["architecture"] for a in aggregates})
+
+    parts.append(f"- **Runtimes Tested**: {', '.join(runtimes)}\n")
+    parts.append(f"- **Workload Types**: {', '.join(workloads)}\n")
+    parts.append(f"- **Architectures**: {', '.join(architectures)}\n\n")
+
+    # Table of contents
+    parts.append("## Contents\n\n")
+    parts.append("### Comparison Tables\n\n")
+    for workload in workloads:
+        parts.append(f"- [{format_workload_name(workload)}](tables/{workload}/)\n")
+        parts.append(f"  - [Cold Starts](tables/{workload}/cold.md)\n")
+        parts.append(f"  - [Warm Starts](tables/{workload}/warm.md)\n")
+    parts.append("\n### Charts\n\n")
+    for workload in workloads:
+        parts.append(f"- [{format_workload_name(workload)}](charts/{workload}/)\n")
+        parts.append("  - Memory Scaling (cold & warm)\n")
+        parts.append("  - P99 Duration Scaling (cold & warm)\n")
+        parts.append("  - Cost Effectiveness (cold & warm)\n")
+        parts.append("  - Runtime Family P99 Comparison (warm)\n")
+    parts.append("- [Cold Start Analysis](charts/cold-start-analysis.png)\n\n")
+
+    summary_path.write_text("".join(parts), encoding="utf-8", newline="\n")
+
+
+# Comparison table rows where both architectures have data, parsed once by str.format
+PERFORMANCE_ROW = (
+    "| {:>11} | {:>19.2f} | {:>15.2f} | {:>17.2f} | {:>13.2f} | {:>+15.1f}% | {:>14.2f} | {:>12.2f} |\n"
+)
+COST_ROW = "| {:>11} | ${:>12.4f} | ${:>10.4f} | {:>+11.1f}% | {} |\n"
+INIT_ROW = "| {:>11} | {:>15.2f} | {:>13.2f} | {:>+10.1f}% | {:>14.2f} | {:>12.2f} |\n"
 
 
 def generate_comparison_table(
@@ -499,153 +700,262 @@ def generate_comparison_table(
     if not filtered:
         return
 
-    # Group by runtime and memory
-    data = defaultdict(lambda: defaultdict(dict))
+    # Bucket by (runtime, memory), one flat dict per architecture
+    arm_by_key: dict[tuple[str, int], dict[str, Any]] = {}
+    x86_by_key: dict[tuple[str, int], dict[str, Any]] = {}
+    memories_by_runtime: dict[str, set[int]] = defaultdict(set)
     for agg in filtered:
-        runtime = agg["runtime"]
-        memory = agg["memorySizeMB"]
-        arch = agg["architecture"]
-        data[runtime][memory][arch] = agg
+        key = (agg["runtime"], agg["memorySizeMB"])
+        memories_by_runtime[key[0]].add(key[1])
+        if agg["architecture"] == "arm64":
+            arm_by_key[key] = agg
+        elif agg["architecture"] == "x86":
+            x86_by_key[key] = agg
 
     # Create markdown table
     table_path = output_dir / "tables" / workload / f"{invocation_type}.md"
-    with open(table_path, "w") as f:
-        f.write(f"# {format_workload_name(workload)} Starts\n\n")
+    parts: list[str] = []
+    parts.append(f"# {format_workload_name(workload)} Starts\n\n")
+
+    for runtime in sort_runtimes_newest_first(list(memories_by_runtime)):
+        parts.append(f"## {runtime}\n\n")
+
+        # Sort memory sizes once and reuse the (memory, arm64, x86) rows for every sub-table
+        rows = [
+            (memory, arm_by_key.get((runtime, memory)), x86_by_key.get((runtime, memory)))
+            for memory in sorted(memories_by_runtime[runtime])
+        ]
+
+        # Table header with performance columns including init time
+        parts.append("### Performance Comparison\n\n")
+        parts.append(
+            "| Memory (MB) | ARM64 Duration (ms) | ARM64 Init (ms) | x86 Duration (ms) | x86 Init (ms) | Perf Improvement | ARM64 P99 (ms) | x86 P99 (ms) |\n"
+        )
+        parts.append(
+            "|------------:|--------------------:|----------------:|------------------:|--------------:|-----------------:|---------------:|-------------:|\n"
+        )
+
+        # Table rows
+        for memory, arm_agg, x86_agg in rows:
+
+            if arm_agg and x86_agg:
+                arm_mean = arm_agg["durationStats"]["mean"]
+                x86_mean = x86_agg["durationStats"]["mean"]
+                arm_p99 = arm_agg["durationStats"]["p99"]
+                x86_p99 = x86_agg["durationStats"]["p99"]
+
+                # Get init time (0 for warm starts, actual value for cold starts)
+                arm_init = arm_agg.get("initDurationStats", {}).get("mean", 0.0)
+                x86_init = x86_agg.get("initDurationStats", {}).get("mean", 0.0)
+
+                improvement = ((x86_mean - arm_mean) / x86_mean) * 100
+
+                parts.append(PERFORMANCE_ROW.format(
+                    memory, arm_mean, arm_init, x86_mean, x86_init, improvement, arm_p99, x86_p99
+                ))
+            elif arm_agg:
+                arm_mean = arm_agg["durationStats"]["mean"]
+                arm_p99 = arm_agg["durationStats"]["p99"]
+                arm_init = arm_agg.get("initDurationStats", {}).get("mean", 0.0)
+                parts.append(
+                    f"| {memory:>11} | {arm_mean:>19.2f} | {arm_init:>15.2f} | {'N/A':>17} | {'N/A':>13} | "
+                    f"{'N/A':>16} | {arm_p99:>14.2f} | {'N/A':>12} |\n"
+                )
+            elif x86_agg:
+                x86_mean = x86_agg["durationStats"]["mean"]
+                x86_p99 = x86_agg["durationStats"]["p99"]
+                x86_init = x86_agg.get("initDurationStats", {}).get("mean", 0.0)
+                parts.append(
+                    f"| {memory:>11} | {'N/A':>19} | {'N/A':>15} | {x86_mean:>17.2f} | {x86_init:>13.2f} | "
+                    f"{'N/A':>16} | {'N/A':>14} | {x86_p99:>12.2f} |\n"
+                )
 
-        for runtime in sort_runtimes_newest_first(list(data.keys())):
-            f.write(f"## {runtime}\n\n")
+        parts.append("\n")
 
-            # Table header with performance columns including init time
-            f.write("### Performance Comparison\n\n")
-            f.write(
-                "| Memory (MB) | ARM64 Duration (ms) | ARM64 Init (ms) | x86 Duration (ms) | x86 Init (ms) | Perf Improvement | ARM64 P99 (ms) | x86 P99 (ms) |\n"
-            )
-            f.write(
-                "|------------:|--------------------:|----------------:|------------------:|--------------:|-----------------:|---------------:|-------------:|\n"
-            )
+        # Add cost comparison table (scalar per-row math: a runtime has only a few memory sizes)
+        parts.append(f"### Cost Analysis (Region: {region})\n\n")
+        parts.append("| Memory (MB) | ARM64 Cost/1M | x86 Cost/1M | Cost Savings | Winner |\n")
+        parts.append("|------------:|--------------:|------------:|-------------:|:------:|\n")
+
+        for memory, arm_agg, x86_agg in rows:
 
-            # Table rows
-            for memory in sorted(data[runtime].keys()):
-                arm_agg = data[runtime][memory].get("arm64")
-                x86_agg = data[runtime][memory].get("x86")
+            if arm_agg and x86_agg:
+                arm_billed = arm_agg["billedDurationStats"]["mean"]
+                x86_billed = x86_agg["billedDurationStats"]["mean"]
 
-                if arm_agg and x86_agg:
-                    arm_mean = arm_agg["durationStats"]["mean"]
-                    x86_mean = x86_agg["durationStats"]["mean"]
-                    arm_p99 = arm_agg["durationStats"]["p99"]
-                    x86_p99 = x86_agg["durationStats"]["p99"]
+                arm_cost = calculate_cost_per_million(arm_billed, memory, "arm64", region)
+                x86_cost = calculate_cost_per_million(x86_billed, memory, "x86", region)
+                savings = calculate_cost_savings(arm_cost, x86_cost)
 
-                    # Get init time (0 for warm starts, actual value for cold starts)
-                    arm_init = arm_agg.get("initDurationStats", {}).get("mean", 0.0)
-                    x86_init = x86_agg.get("initDurationStats", {}).get("mean", 0.0)
+                # Determine winner (lowest cost for same workload)
+                winner = "🏆 ARM64" if arm_cost < x86_cost else "🏆 x86"
 
-                    improvement = ((x86_mean - arm_mean) / x86_mean) * 100
+                parts.append(
+                    COST_ROW.format(memory, arm_cost, x86_cost, savings["savings_percentage"], winner)
+                )
+            elif arm_agg:
+                arm_billed = arm_agg["billedDurationStats"]["mean"]
+                arm_cost = calculate_cost_per_million(arm_billed, memory, "arm64", region)
+                parts.append(
+                    f"| {memory:>11} | ${arm_cost:>12.4f} | {'N/A':>11} | "
+                    f"{'N/A':>12} | {'ARM64':^6} |\n"
+                )
+            elif x86_agg:
+                x86_billed = x86_agg["billedDurationStats"]["mean"]
+                x86_cost = calculate_cost_per_million(x86_billed, memory, "x86", region)
+                parts.append(
+                    f"| {memory:>11} | {'N/A':>13} | ${x86_cost:>10.4f} | "
+                    f"{'N/A':>12} | {'x86':^6} |\n"
+                )
+
+        parts.append("\n")
+
+        # Add cold start init duration table if applicable
+        if invocation_type == "cold":
+            parts.append(f"### {runtime} - Init Duration (Cold Starts)\n\n")
+            parts.append(
+                "| Memory (MB) | ARM64 Init (ms) | x86 Init (ms) | Improvement | ARM64 P99 (ms) | x86 P99 (ms) |\n"
+            )
+            parts.append(
+                "|------------:|----------------:|--------------:|------------:|---------------:|-------------:|\n"
+            )
 
-                    f.write(
-                        f"| {memory:>11} | {arm_mean:>19.2f} | {arm_init:>15.2f} | {x86_mean:>17.2f} | {x86_init:>13.2f} | "
-                        f"{improvement:>+15.1f}% | {arm_p99:>14.2f} | {x86_p99:>12.2f} |\n"
+            for memory, arm_agg, x86_agg in rows:
+
+                if arm_agg and x86_agg and "initDurationStats" in arm_agg:
+                    arm_init = arm_agg["initDurationStats"]["mean"]
+                    x86_init = x86_agg["initDurationStats"]["mean"]
+                    arm_p99 = arm_agg["initDurationStats"]["p99"]
+                    x86_p99 = x86_agg["initDurationStats"]["p99"]
+                    improvement = ((x86_init - arm_init) / x86_init) * 100
+
+                    parts.append(
+                        INIT_ROW.format(memory, arm_init, x86_init, improvement, arm_p99, x86_p99)
                     )
-                elif arm_agg:
-                    arm_mean = arm_agg["durationStats"]["mean"]
-                    arm_p99 = arm_agg["durationStats"]["p99"]
-                    arm_init = arm_agg.get("initDurationStats", {}).get("mean", 0.0)
-                    f.write(
-                        f"| {memory:>11} | {arm_mean:>19.2f} | {arm_init:>15.2f} | {'N/A':>17} | {'N/A':>13} | "
-                        f"{'N/A':>16} | {arm_p99:>14.2f} | {'N/A':>12} |\n"
+                elif arm_agg and "initDurationStats" in arm_agg:
+                    arm_init = arm_agg["initDurationStats"]["mean"]
+                    arm_p99 = arm_agg["initDurationStats"]["p99"]
+                    parts.append(
+                        f"| {memory:>11} | {arm_init:>15.2f} | {'N/A':>13} | "
+                        f"{'N/A':>11} | {arm_p99:>14.2f} | {'N/A':>12} |\n"
                     )
-                elif x86_agg:
-                    x86_mean = x86_agg["durationStats"]["mean"]
-                    x86_p99 = x86_agg["durationStats"]["p99"]
-                    x86_init = x86_agg.get("initDurationStats", {}).get("mean", 0.0)
-                    f.write(
-                        f"| {memory:>11} | {'N/A':>19} | {'N/A':>15} | {x86_mean:>17.2f} | {x86_init:>13.2f} | "
-                        f"{'N/A':>16} | {'N/A':>14} | {x86_p99:>12.2f} |\n"
+                elif x86_agg and "initDurationStats" in x86_agg:
+                    x86_init = x86_agg["initDurationStats"]["mean"]
+                    x86_p99 = x86_agg["initDurationStats"]["p99"]
+                    parts.append(
+                        f"| {memory:>11} | {'N/A':>15} | {x86_init:>13.2f} | "
+                        f"{'N/A':>11} | {'N/A':>14} | {x86_p99:>12.2f} |\n"
                     )
 
-            f.write("\n")
+            parts.append("\n")
 
-            # Add cost comparison table
-            f.write(f"### Cost Analysis (Region: {region})\n\n")
-            f.write("| Memory (MB) | ARM64 Cost/1M | x86 Cost/1M | Cost Savings | Winner |\n")
-            f.write("|------------:|--------------:|------------:|-------------:|:------:|\n")
+    table_path.write_text("".join(parts), encoding="utf-8", newline="\n")
 
-            for memory in sorted(data[runtime].keys()):
-                arm_agg = data[runtime][memory].get("arm64")
-                x86_agg = data[runtime][memory].get("x86")
 
-                if arm_agg and x86_agg:
-                    arm_billed = arm_agg["billedDurationStats"]["mean"]
-                    x86_billed = x86_agg["billedDurationStats"]["mean"]
+# =============================================================================
+# Chart Series Helpers
+# =============================================================================
 
-                    arm_cost = calculate_cost_per_million(arm_billed, memory, "arm64", region)
-                    x86_cost = calculate_cost_per_million(x86_billed, memory, "x86", region)
-                    savings = calculate_cost_savings(arm_cost, x86_cost)
 
-                    # Determine winner (lowest cost for same workload)
-                    winner = "🏆 ARM64" if arm_cost < x86_cost else "🏆 x86"
+def total_duration_stat(agg: dict[str, Any], stat: str) -> float:
+    """
+    Return a duration statistic, adding the matching init statistic when present.
 
-                    f.write(
-                        f"| {memory:>11} | ${arm_cost:>12.4f} | ${x86_cost:>10.4f} | "
-                        f"{savings['savings_percentage']:>+11.1f}% | {winner} |\n"
-                    )
-                elif arm_agg:
-                    arm_billed = arm_agg["billedDurationStats"]["mean"]
-                    arm_cost = calculate_cost_per_million(arm_billed, memory, "arm64", region)
-                    f.write(
-                        f"| {memory:>11} | ${arm_cost:>12.4f} | {'N/A':>11} | "
-                        f"{'N/A':>12} | {'ARM64':^6} |\n"
-                    )
-                elif x86_agg:
-                    x86_billed = x86_agg["billedDurationStats"]["mean"]
-                    x86_cost = calculate_cost_per_million(x86_billed, memory, "x86", region)
-                    f.write(
-                        f"| {memory:>11} | {'N/A':>13} | ${x86_cost:>10.4f} | "
-                        f"{'N/A':>12} | {'x86':^6} |\n"
-                    )
+    Only cold-start aggregates carry initDurationStats, so warm aggregates (and cold ones
+    whose init stats were not recorded) return the plain duration statistic.
 
-            f.write("\n")
+    Args:
+        agg: Aggregate statistics item
+        stat: Statistic name (e.g., "mean", "p99")
 
-            # Add cold start init duration table if applicable
-            if invocation_type == "cold":
-                f.write(f"### {runtime} - Init Duration (Cold Starts)\n\n")
-                f.write(
-                    "| Memory (MB) | ARM64 Init (ms) | x86 Init (ms) | Improvement | ARM64 P99 (ms) | x86 P99 (ms) |\n"
-                )
-                f.write(
-                    "|------------:|----------------:|--------------:|------------:|---------------:|-------------:|\n"
-                )
+    Returns:
+        Duration statistic in milliseconds, including init time for cold starts
+    """
+    total = agg["durationStats"][stat]
+    init_stats = agg.get("initDurationStats")
+    if init_stats:
+        total += init_stats[stat]
+    return total
 
-                for memory in sorted(data[runtime].keys()):
-                    arm_agg = data[runtime][memory].get("arm64")
-                    x86_agg = data[runtime][memory].get("x86")
 
-                    if arm_agg and x86_agg and "initDurationStats" in arm_agg:
-                        arm_init = arm_agg["initDurationStats"]["mean"]
-                        x86_init = x86_agg["initDurationStats"]["mean"]
-                        arm_p99 = arm_agg["initDurationStats"]["p99"]
-                        x86_p99 = x86_agg["initDurationStats"]["p99"]
-                        improvement = ((x86_init - arm_init) / x86_init) * 100
+def group_memory_series(
+    aggregates: list[dict[str, Any]], value: Callable[[dict[str, Any]], float]
+) -> dict[tuple[str, str], tuple[list[int], list[float]]]:
+    """
+    Group aggregates into one memory-sorted series per runtime-architecture combination.
 
-                        f.write(
-                            f"| {memory:>11} | {arm_init:>15.2f} | {x86_init:>13.2f} | "
-                            f"{improvement:>+10.1f}% | {arm_p99:>14.2f} | {x86_p99:>12.2f} |\n"
-                        )
-                    elif arm_agg and "initDurationStats" in arm_agg:
-                        arm_init = arm_agg["initDurationStats"]["mean"]
-                        arm_p99 = arm_agg["initDurationStats"]["p99"]
-                        f.write(
-                            f"| {memory:>11} | {arm_init:>15.2f} | {'N/A':>13} | "
-                            f"{'N/A':>11} | {arm_p99:>14.2f} | {'N/A':>12} |\n"
-                        )
-                    elif x86_agg and "initDurationStats" in x86_agg:
-                        x86_init = x86_agg["initDurationStats"]["mean"]
-                        x86_p99 = x86_agg["initDurationStats"]["p99"]
-                        f.write(
-                            f"| {memory:>11} | {'N/A':>15} | {x86_init:>13.2f} | "
-                            f"{'N/A':>11} | {'N/A':>14} | {x86_p99:>12.2f} |\n"
-                        )
 
-                f.write("\n")
+    Args:
+        aggregates: Aggregates already filtered to one workload and invocation type
+        value: Extracts the plotted y-value from an aggregate
+
+    Returns:
+        Dictionary mapping (runtime, architecture) keys to (memory sizes, values) sorted by
+        memory, ordered newest runtime first (arm64 before x86)
+    """
+    points = defaultdict(list)
+    for agg in aggregates:
+        points[agg["runtime"], agg["architecture"]].append((agg["memorySizeMB"], value(agg)))
+
+    series = {}
+    for key in sort_runtime_keys_newest_first(list(points)):
+        key_points = points[key]
+        # Memory sizes are unique within a series, so plain tuple ordering sorts by memory
+        key_points.sort()
+        memory, values = zip(*key_points, strict=True)
+        series[key] = (list(memory), list(values))
+    return series
+
+
+def render_memory_line_chart(
+    series_data: dict[tuple[str, str], tuple[list[int], list[float]]],
+    title: str,
+    y_label: str,
+    chart_path: Path,
+    legend_fontsize: int = 9,
+) -> None:
+    """
+    Plot memory series as one line per runtime-architecture combination and save the chart.
+
+    ARM64 series are drawn solid with circle markers and x86 series dashed with square
+    markers, on a log2 memory axis labelled with the actual MB values.
+
+    Args:
+        series_data: Output of group_memory_series
+        title: Chart title
+        y_label: Y-axis label
+        chart_path: Destination PNG path
+        legend_fontsize: Font size for the legend entries
+    """
+    fig, ax = plt.subplots(figsize=(14, 8))
+
+    for (runtime, arch), (memory, values) in series_data.items():
+        ax.plot(
+            memory,
+            values,
+            label=f"{runtime}-{arch}",
+            color=RUNTIME_COLORS.get(runtime, "#000000"),
+            markersize=7,
+            alpha=0.8,
+            **ARCH_LINE_STYLES.get(arch, ARCH_LINE_STYLES["x86"]),
+        )
+
+    ax.set_xlabel("Memory Configuration (MB)", fontsize=13, fontweight="bold")
+    ax.set_ylabel(y_label, fontsize=13, fontweight="bold")
+    ax.set_title(title, fontsize=15, fontweight="bold")
+    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=legend_fontsize)
+    ax.grid(alpha=0.3, which="both", linestyle=":")
+    ax.set_xscale("log", base=2)  # Log scale for memory makes scaling clearer
+
+    # Set custom tick labels to show actual MB values instead of powers of 2
+    # (per chart: each chart plots a different runtime subset, whose memory sizes may differ)
+    all_memory_values = sorted(set().union(*(memory for memory, _ in series_data.values())))
+    ax.xaxis.set_major_locator(FixedLocator(all_memory_values))
+    ax.xaxis.set_major_formatter(FuncFormatter(lambda value, _pos: str(int(value))))
+
+    plt.tight_layout()
+    plt.savefig(chart_path, bbox_inches="tight", pil_kwargs=CHART_PNG_OPTIONS)
+    plt.close()
 
 
 # =============================================================================
@@ -678,92 +988,23 @@ def create_memory_scaling_chart(
     if not filtered:
         return
 
-    # Group data by runtime+architecture combination
-    series_data = defaultdict(lambda: {"memory": [], "duration": [], "p99": []})
-
-    for agg in filtered:
-        key = f"{agg['runtime']}-{agg['architecture']}"
-        series_data[key]["memory"].append(agg["memorySizeMB"])
-
-        # For cold starts, include init time in total duration
-        duration = agg["durationStats"]["mean"]
-        p99 = agg["durationStats"]["p99"]
-
-        if invocation_type == "cold" and "initDurationStats" in agg:
-            duration += agg["initDurationStats"]["mean"]
-            p99 += agg["initDurationStats"]["p99"]
-
-        series_data[key]["duration"].append(duration)
-        series_data[key]["p99"].append(p99)
-
-    # Sort memory values for each series
-    for key in series_data:
-        # Combine and sort by memory
-        combined = list(
-            zip(
-                series_data[key]["memory"],
-                series_data[key]["duration"],
-                series_data[key]["p99"],
-                strict=False,
-            )
-        )
-        combined.sort(key=lambda x: x[0])
-        series_data[key]["memory"] = [x[0] for x in combined]
-        series_data[key]["duration"] = [x[1] for x in combined]
-        series_data[key]["p99"] = [x[2] for x in combined]
-
-    fig, ax = plt.subplots(figsize=(14, 8))
-
-    for key in sort_runtime_keys_newest_first(list(series_data.keys())):
-        runtime = key.rsplit("-", 1)[0]
-        arch = key.rsplit("-", 1)[1]
-
-        color = RUNTIME_COLORS.get(runtime, "#000000")
-        linestyle = "-" if arch == "arm64" else "--"
-        marker = "o" if arch == "arm64" else "s"
-
-        ax.plot(
-            series_data[key]["memory"],
-            series_data[key]["duration"],
-            label=key,
-            color=color,
-            linestyle=linestyle,
-            marker=marker,
-            linewidth=2.5 if arch == "arm64" else 2,
-            markersize=7,
-            alpha=0.8,
-        )
+    # Group by runtime + architecture, sorted by memory
+    # For cold starts, include init time in total duration
+    series_data = group_memory_series(filtered, lambda agg: total_duration_stat(agg, "mean"))
 
-    ax.set_xlabel("Memory Configuration (MB)", fontsize=13, fontweight="bold")
     y_label = (
         "Total Time (init+duration, ms)" if invocation_type == "cold" else "Mean Duration (ms)"
     )
-    ax.set_ylabel(y_label, fontsize=13, fontweight="bold")
     subtitle = "(init+duration)" if invocation_type == "cold" else ""
-    ax.set_title(
-        f"Memory Scaling: {format_workload_name(workload)} - {invocation_type.title()} Starts {subtitle}\n"
-        f"Solid lines = ARM64, Dashed lines = x86",
-        fontsize=15,
-        fontweight="bold",
+    render_memory_line_chart(
+        series_data,
+        title=(
+            f"Memory Scaling: {format_workload_name(workload)} - {invocation_type.title()} Starts {subtitle}\n"
+            f"Solid lines = ARM64, Dashed lines = x86"
+        ),
+        y_label=y_label,
+        chart_path=output_dir / "charts" / workload / f"memory-scaling-{invocation_type}.png",
     )
-    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=9)
-    ax.grid(alpha=0.3, which="both", linestyle=":")
-    ax.set_xscale("log", base=2)  # Log scale for memory makes scaling clearer
-
-    # Set custom tick labels to show actual MB values instead of powers of 2
-    all_memory_values = sorted(
-        {mem for series in series_data.values() for mem in series["memory"]}
-    )
-    ax.set_xticks(all_memory_values)
-    ax.set_xticklabels([f"{int(m)}" for m in all_memory_values])
-
-    plt.tight_layout()
-    plt.savefig(
-        output_dir / "charts" / workload / f"memory-scaling-{invocation_type}.png",
-        dpi=CHART_DPI,
-        bbox_inches="tight",
-    )
-    plt.close()
 
 
 def create_nodejs_rust_comparison_chart(
@@ -790,95 +1031,26 @@ def create_nodejs_rust_comparison_chart(
     if not filtered:
         return
 
-    # Group by runtime + architecture
-    series_data = defaultdict(lambda: {"memory": [], "duration": [], "p99": []})
-
-    for agg in filtered:
-        runtime = agg["runtime"]
-        arch = agg["architecture"]
-        memory_mb = agg["memorySizeMB"]
-
-        key = f"{runtime}-{arch}"
-
-        # Calculate total time (init + duration for cold, just duration for warm)
-        if invocation_type == "cold":
-            init_mean = agg["initDurationStats"]["mean"]
-            duration_mean = agg["durationStats"]["mean"]
-            total_time = init_mean + duration_mean
-        else:
-            total_time = agg["durationStats"]["mean"]
-
-        p99 = agg["durationStats"].get("p99", 0)
-
-        series_data[key]["memory"].append(memory_mb)
-        series_data[key]["duration"].append(total_time)
-        series_data[key]["p99"].append(p99)
-
-    # Sort memory values for each series
-    for key in series_data:
-        combined = list(
-            zip(
-                series_data[key]["memory"],
-                series_data[key]["duration"],
-                series_data[key]["p99"],
-                strict=False,
-            )
-        )
-        combined.sort(key=lambda x: x[0])
-        series_data[key]["memory"] = [x[0] for x in combined]
-        series_data[key]["duration"] = [x[1] for x in combined]
-        series_data[key]["p99"] = [x[2] for x in combined]
-
-    fig, ax = plt.subplots(figsize=(14, 8))
-
-    for key in sort_runtime_keys_newest_first(list(series_data.keys())):
-        runtime = key.rsplit("-", 1)[0]
-        arch = key.rsplit("-", 1)[1]
-
-        color = RUNTIME_COLORS.get(runtime, "#000000")
-        linestyle = "-" if arch == "arm64" else "--"
-        marker = "o" if arch == "arm64" else "s"
+    # Group by runtime + architecture, sorted by memory
+    # Calculate total time (init + duration for cold, just duration for warm)
+    series_data = group_memory_series(filtered, lambda agg: total_duration_stat(agg, "mean"))
 
-        ax.plot(
-            series_data[key]["memory"],
-            series_data[key]["duration"],
-            label=key,
-            color=color,
-            linestyle=linestyle,
-            marker=marker,
-            linewidth=2.5 if arch == "arm64" else 2,
-            markersize=7,
-            alpha=0.8,
-        )
-
-    ax.set_xlabel("Memory Configuration (MB)", fontsize=13, fontweight="bold")
     y_label = (
         "Total Time (init+duration, ms)" if invocation_type == "cold" else "Mean Duration (ms)"
     )
-    ax.set_ylabel(y_label, fontsize=13, fontweight="bold")
     subtitle = "(init+duration)" if invocation_type == "cold" else ""
-    ax.set_title(
-        f"Node.js & Rust Comparison: {format_workload_name(workload)} - {invocation_type.title()} Starts {subtitle}\n"
-        f"Solid lines = ARM64, Dashed lines = x86",
-        fontsize=15,
-        fontweight="bold",
+    render_memory_line_chart(
+        series_data,
+        title=(
+            f"Node.js & Rust Comparison: {format_workload_name(workload)} - {invocation_type.title()} Starts {subtitle}\n"
+            f"Solid lines = ARM64, Dashed lines = x86"
+        ),
+        y_label=y_label,
+        chart_path=(
+            output_dir / "charts" / workload / f"nodejs-rust-comparison-{invocation_type}.png"
+        ),
+        legend_fontsize=10,
     )
-    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=10)
-    ax.grid(alpha=0.3, which="both", linestyle=":")
-    ax.set_xscale("log", base=2)
-
-    # Set custom tick labels
-    all_memory_values = sorted(
-        {mem for series in series_data.values() for mem in series["memory"]}
-    )
-    ax.set_xticks(all_memory_values)
-    ax.set_xticklabels([f"{int(m)}" for m in all_memory_values])
-
-    plt.tight_layout()
-    chart_path = output_dir / "charts" / workload / f"nodejs-rust-comparison-{invocation_type}.png"
-    chart_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(chart_path, dpi=CHART_DPI, bbox_inches="tight")
-    plt.close()
 
 
 def create_python_comparison_chart(
@@ -905,95 +1077,24 @@ def create_python_comparison_chart(
     if not filtered:
         return
 
-    # Group by runtime + architecture
-    series_data = defaultdict(lambda: {"memory": [], "duration": [], "p99": []})
-
-    for agg in filtered:
-        runtime = agg["runtime"]
-        arch = agg["architecture"]
-        memory_mb = agg["memorySizeMB"]
-
-        key = f"{runtime}-{arch}"
-
-        # Calculate total time (init + duration for cold, just duration for warm)
-        if invocation_type == "cold":
-            init_mean = agg["initDurationStats"]["mean"]
-            duration_mean = agg["durationStats"]["mean"]
-            total_time = init_mean + duration_mean
-        else:
-            total_time = agg["durationStats"]["mean"]
-
-        p99 = agg["durationStats"].get("p99", 0)
-
-        series_data[key]["memory"].append(memory_mb)
-        series_data[key]["duration"].append(total_time)
-        series_data[key]["p99"].append(p99)
-
-    # Sort memory values for each series
-    for key in series_data:
-        combined = list(
-            zip(
-                series_data[key]["memory"],
-                series_data[key]["duration"],
-                series_data[key]["p99"],
-                strict=False,
-            )
-        )
-        combined.sort(key=lambda x: x[0])
-        series_data[key]["memory"] = [x[0] for x in combined]
-        series_data[key]["duration"] = [x[1] for x in combined]
-        series_data[key]["p99"] = [x[2] for x in combined]
-
-    fig, ax = plt.subplots(figsize=(14, 8))
-
-    for key in sort_runtime_keys_newest_first(list(series_data.keys())):
-        runtime = key.rsplit("-", 1)[0]
-        arch = key.rsplit("-", 1)[1]
-
-        color = RUNTIME_COLORS.get(runtime, "#000000")
-        linestyle = "-" if arch == "arm64" else "--"
-        marker = "o" if arch == "arm64" else "s"
+    # Group by runtime + architecture, sorted by memory
+    # Calculate total time (init + duration for cold, just duration for warm)
+    series_data = group_memory_series(filtered, lambda agg: total_duration_stat(agg, "mean"))
 
-        ax.plot(
-            series_data[key]["memory"],
-            series_data[key]["duration"],
-            label=key,
-            color=color,
-            linestyle=linestyle,
-            marker=marker,
-            linewidth=2.5 if arch == "arm64" else 2,
-            markersize=7,
-            alpha=0.8,
-        )
-
-    ax.set_xlabel("Memory Configuration (MB)", fontsize=13, fontweight="bold")
     y_label = (
         "Total Time (init+duration, ms)" if invocation_type == "cold" else "Mean Duration (ms)"
     )
-    ax.set_ylabel(y_label, fontsize=13, fontweight="bold")
     subtitle = "(init+duration)" if invocation_type == "cold" else ""
-    ax.set_title(
-        f"Python Version Comparison: {format_workload_name(workload)} - {invocation_type.title()} Starts {subtitle}\n"
-        f"Solid lines = ARM64, Dashed lines = x86",
-        fontsize=15,
-        fontweight="bold",
+    render_memory_line_chart(
+        series_data,
+        title=(
+            f"Python Version Comparison: {format_workload_name(workload)} - {invocation_type.title()} Starts {subtitle}\n"
+            f"Solid lines = ARM64, Dashed lines = x86"
+        ),
+        y_label=y_label,
+        chart_path=output_dir / "charts" / workload / f"python-comparison-{invocation_type}.png",
+        legend_fontsize=10,
     )
-    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=10)
-    ax.grid(alpha=0.3, which="both", linestyle=":")
-    ax.set_xscale("log", base=2)
-
-    # Set custom tick labels
-    all_memory_values = sorted(
-        {mem for series in series_data.values() for mem in series["memory"]}
-    )
-    ax.set_xticks(all_memory_values)
-    ax.set_xticklabels([f"{int(m)}" for m in all_memory_values])
-
-    plt.tight_layout()
-    chart_path = output_dir / "charts" / workload / f"python-comparison-{invocation_type}.png"
-    chart_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(chart_path, dpi=CHART_DPI, bbox_inches="tight")
-    plt.close()
 
 
 def create_nodejs_comparison_chart(
@@ -1019,95 +1120,24 @@ def create_nodejs_comparison_chart(
     if not filtered:
         return
 
-    # Group by runtime + architecture
-    series_data = defaultdict(lambda: {"memory": [], "duration": [], "p99": []})
-
-    for agg in filtered:
-        runtime = agg["runtime"]
-        arch = agg["architecture"]
-        memory_mb = agg["memorySizeMB"]
-
-        key = f"{runtime}-{arch}"
-
-        # Calculate total time (init + duration for cold, just duration for warm)
-        if invocation_type == "cold":
-            init_mean = agg["initDurationStats"]["mean"]
-            duration_mean = agg["durationStats"]["mean"]
-            total_time = init_mean + duration_mean
-        else:
-            total_time = agg["durationStats"]["mean"]
-
-        p99 = agg["durationStats"].get("p99", 0)
-
-        series_data[key]["memory"].append(memory_mb)
-        series_data[key]["duration"].append(total_time)
-        series_data[key]["p99"].append(p99)
-
-    # Sort memory values for each series
-    for key in series_data:
-        combined = list(
-            zip(
-                series_data[key]["memory"],
-                series_data[key]["duration"],
-                series_data[key]["p99"],
-                strict=False,
-            )
-        )
-        combined.sort(key=lambda x: x[0])
-        series_data[key]["memory"] = [x[0] for x in combined]
-        series_data[key]["duration"] = [x[1] for x in combined]
-        series_data[key]["p99"] = [x[2] for x in combined]
-
-    fig, ax = plt.subplots(figsize=(14, 8))
-
-    for key in sort_runtime_keys_newest_first(list(series_data.keys())):
-        runtime = key.rsplit("-", 1)[0]
-        arch = key.rsplit("-", 1)[1]
+    # Group by runtime + architecture, sorted by memory
+    # Calculate total time (init + duration for cold, just duration for warm)
+    series_data = group_memory_series(filtered, lambda agg: total_duration_stat(agg, "mean"))
 
-        color = RUNTIME_COLORS.get(runtime, "#000000")
-        linestyle = "-" if arch == "arm64" else "--"
-        marker = "o" if arch == "arm64" else "s"
-
-        ax.plot(
-            series_data[key]["memory"],
-            series_data[key]["duration"],
-            label=key,
-            color=color,
-            linestyle=linestyle,
-            marker=marker,
-            linewidth=2.5 if arch == "arm64" else 2,
-            markersize=7,
-            alpha=0.8,
-        )
-
-    ax.set_xlabel("Memory Configuration (MB)", fontsize=13, fontweight="bold")
     y_label = (
         "Total Time (init+duration, ms)" if invocation_type == "cold" else "Mean Duration (ms)"
     )
-    ax.set_ylabel(y_label, fontsize=13, fontweight="bold")
     subtitle = "(init+duration)" if invocation_type == "cold" else ""
-    ax.set_title(
-        f"Node.js Version Comparison: {format_workload_name(workload)} - {invocation_type.title()} Starts {subtitle}\n"
-        f"Solid lines = ARM64, Dashed lines = x86",
-        fontsize=15,
-        fontweight="bold",
-    )
-    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=10)
-    ax.grid(alpha=0.3, which="both", linestyle=":")
-    ax.set_xscale("log", base=2)
-
-    # Set custom tick labels
-    all_memory_values = sorted(
-        {mem for series in series_data.values() for mem in series["memory"]}
+    render_memory_line_chart(
+        series_data,
+        title=(
+            f"Node.js Version Comparison: {format_workload_name(workload)} - {invocation_type.title()} Starts {subtitle}\n"
+            f"Solid lines = ARM64, Dashed lines = x86"
+        ),
+        y_label=y_label,
+        chart_path=output_dir / "charts" / workload / f"nodejs-comparison-{invocation_type}.png",
+        legend_fontsize=10,
     )
-    ax.set_xticks(all_memory_values)
-    ax.set_xticklabels([f"{int(m)}" for m in all_memory_values])
-
-    plt.tight_layout()
-    chart_path = output_dir / "charts" / workload / f"nodejs-comparison-{invocation_type}.png"
-    chart_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(chart_path, dpi=CHART_DPI, bbox_inches="tight")
-    plt.close()
 
 
 def create_p99_scaling_chart(
@@ -1128,79 +1158,23 @@ def create_p99_scaling_chart(
     if not filtered:
         return
 
-    # Group data by runtime+architecture combination
-    series_data = defaultdict(lambda: {"memory": [], "p99": []})
+    # Group by runtime + architecture, sorted by memory
+    # For cold starts, include init time in P99
+    series_data = group_memory_series(filtered, lambda agg: total_duration_stat(agg, "p99"))
 
-    for agg in filtered:
-        key = f"{agg['runtime']}-{agg['architecture']}"
-        series_data[key]["memory"].append(agg["memorySizeMB"])
-
-        # For cold starts, include init time in P99
-        p99 = agg["durationStats"]["p99"]
-        if invocation_type == "cold" and "initDurationStats" in agg:
-            p99 += agg["initDurationStats"]["p99"]
-
-        series_data[key]["p99"].append(p99)
-
-    # Sort memory values for each series
-    for key in series_data:
-        combined = list(zip(series_data[key]["memory"], series_data[key]["p99"], strict=False))
-        combined.sort(key=lambda x: x[0])
-        series_data[key]["memory"] = [x[0] for x in combined]
-        series_data[key]["p99"] = [x[1] for x in combined]
-
-    fig, ax = plt.subplots(figsize=(14, 8))
-
-    for key in sort_runtime_keys_newest_first(list(series_data.keys())):
-        runtime = key.rsplit("-", 1)[0]
-        arch = key.rsplit("-", 1)[1]
-
-        color = RUNTIME_COLORS.get(runtime, "#000000")
-        linestyle = "-" if arch == "arm64" else "--"
-        marker = "o" if arch == "arm64" else "s"
-
-        ax.plot(
-            series_data[key]["memory"],
-            series_data[key]["p99"],
-            label=key,
-            color=color,
-            linestyle=linestyle,
-            marker=marker,
-            linewidth=2.5 if arch == "arm64" else 2,
-            markersize=7,
-            alpha=0.8,
-        )
-
-    ax.set_xlabel("Memory Configuration (MB)", fontsize=13, fontweight="bold")
     y_label = (
         "P99 Total Time (init+duration, ms)" if invocation_type == "cold" else "P99 Duration (ms)"
     )
-    ax.set_ylabel(y_label, fontsize=13, fontweight="bold")
     subtitle = "(init+duration)" if invocation_type == "cold" else ""
-    ax.set_title(
-        f"P99 Duration Scaling: {format_workload_name(workload)} - {invocation_type.title()} Starts {subtitle}\n"
-        f"Solid lines = ARM64, Dashed lines = x86",
-        fontsize=15,
-        fontweight="bold",
+    render_memory_line_chart(
+        series_data,
+        title=(
+            f"P99 Duration Scaling: {format_workload_name(workload)} - {invocation_type.title()} Starts {subtitle}\n"
+            f"Solid lines = ARM64, Dashed lines = x86"
+        ),
+        y_label=y_label,
+        chart_path=output_dir / "charts" / workload / f"p99-scaling-{invocation_type}.png",
     )
-    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=9)
-    ax.grid(alpha=0.3, which="both", linestyle=":")
-    ax.set_xscale("log", base=2)
-
-    # Set custom tick labels to show actual MB values instead of powers of 2
-    all_memory_values = sorted(
-        {mem for series in series_data.values() for mem in series["memory"]}
-    )
-    ax.set_xticks(all_memory_values)
-    ax.set_xticklabels([f"{int(m)}" for m in all_memory_values])
-
-    plt.tight_layout()
-    plt.savefig(
-        output_dir / "charts" / workload / f"p99-scaling-{invocation_type}.png",
-        dpi=CHART_DPI,
-        bbox_inches="tight",
-    )
-    plt.close()
 
 
 def create_cost_effectiveness_chart(
@@ -1222,75 +1196,25 @@ def create_cost_effectiveness_chart(
     if not filtered:
         return
 
-    # Group data by runtime+architecture combination
-    series_data = defaultdict(lambda: {"memory": [], "cost": []})
+    # Group by runtime + architecture, sorted by memory. Costs go through the shared
+    # calculate_cost_per_million so the chart always matches the cost tables.
 
-    for agg in filtered:
-        key = f"{agg['runtime']}-{agg['architecture']}"
-        memory = agg["memorySizeMB"]
-        billed_duration = agg["billedDurationStats"]["mean"]
-        arch = agg["architecture"]
-
-        cost_per_million = calculate_cost_per_million(billed_duration, memory, arch, region)
-
-        series_data[key]["memory"].append(memory)
-        series_data[key]["cost"].append(cost_per_million)
-
-    # Sort memory values for each series
-    for key in series_data:
-        combined = list(zip(series_data[key]["memory"], series_data[key]["cost"], strict=False))
-        combined.sort(key=lambda x: x[0])
-        series_data[key]["memory"] = [x[0] for x in combined]
-        series_data[key]["cost"] = [x[1] for x in combined]
-
-    fig, ax = plt.subplots(figsize=(14, 8))
-
-    for key in sort_runtime_keys_newest_first(list(series_data.keys())):
-        runtime = key.rsplit("-", 1)[0]
-        arch = key.rsplit("-", 1)[1]
-
-        color = RUNTIME_COLORS.get(runtime, "#000000")
-        linestyle = "-" if arch == "arm64" else "--"
-        marker = "o" if arch == "arm64" else "s"
-
-        ax.plot(
-            series_data[key]["memory"],
-            series_data[key]["cost"],
-            label=key,
-            color=color,
-            linestyle=linestyle,
-            marker=marker,
-            linewidth=2.5 if arch == "arm64" else 2,
-            markersize=7,
-            alpha=0.8,
+    def cost_per_million(agg: dict[str, Any]) -> float:
+        return calculate_cost_per_million(
+            agg["billedDurationStats"]["mean"], agg["memorySizeMB"], agg["architecture"], region
         )
 
-    ax.set_xlabel("Memory Configuration (MB)", fontsize=13, fontweight="bold")
-    ax.set_ylabel("Cost per 1M Invocations ($)", fontsize=13, fontweight="bold")
-    ax.set_title(
-        f"Cost Effectiveness: {format_workload_name(workload)} - {invocation_type.title()} Starts\n"
-        f"Solid lines = ARM64 (20% cheaper), Dashed lines = x86 | Region: {region}",
-        fontsize=15,
-        fontweight="bold",
-    )
-    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=9)
-    ax.grid(alpha=0.3, which="both", linestyle=":")
-    ax.set_xscale("log", base=2)
+    series_data = group_memory_series(filtered, cost_per_million)
 
-    # Set custom tick labels to show actual MB values instead of powers of 2
-    all_memory_values = sorted(
-        {mem for series in series_data.values() for mem in series["memory"]}
+    render_memory_line_chart(
+        series_data,
+        title=(
+            f"Cost Effectiveness: {format_workload_name(workload)} - {invocation_type.title()} Starts\n"
+            f"Solid lines = ARM64 (20% cheaper), Dashed lines = x86 | Region: {region}"
+        ),
+        y_label="Cost per 1M Invocations ($)",
+        chart_path=output_dir / "charts" / workload / f"cost-effectiveness-{invocation_type}.png",
     )
-    ax.set_xticks(all_memory_values)
-    ax.set_xticklabels([f"{int(m)}" for m in all_memory_values])
-
-    plt.tight_layout()
-    plt.savefig(
-        output_dir / "charts" / workload / f"cost-effectiveness-{invocation_type}.png",
-        dpi=CHART_DPI,
-        bbox_inches="tight",
-    )
-    plt.close()
 
 
 def create_runtime_family_p99_chart(
@@ -1315,48 +1239,28 @@ def create_runtime_family_p99_chart(
     if not filtered:
         return
 
-    # Group data by runtime family and architecture
-    family_data = defaultdict(lambda: {"arm64": {}, "x86": {}})
-
+    # Collect P99 per (family, architecture, runtime) across all memory configs
+    p99_values = defaultdict(list)
+    runtimes_by_family = defaultdict(set)
     for agg in filtered:
         runtime = agg["runtime"]
-        arch = agg["architecture"]
-
         # Get runtime family (e.g., "nodejs20" -> "Node.js")
         family = RUNTIME_FAMILIES.get(runtime, runtime)
-
-        # Get P99 across all memory configs for this runtime
-        if runtime not in family_data[family][arch]:
-            family_data[family][arch][runtime] = []
-
-        family_data[family][arch][runtime].append(agg["durationStats"]["p99"])
-
-    # Calculate average P99 for each runtime (across memory configs)
-    chart_data = defaultdict(lambda: {"arm64": [], "x86": [], "labels": []})
-
-    for family in sorted(family_data.keys()):
-        for runtime in sort_runtimes_newest_first(
-            list(set(list(family_data[family]["arm64"].keys()) + list(family_data[family]["x86"].keys())))
-        ):
-            chart_data[family]["labels"].append(runtime)
-
-            # ARM64
-            if runtime in family_data[family]["arm64"]:
-                avg_p99_arm = sum(family_data[family]["arm64"][runtime]) / len(
-                    family_data[family]["arm64"][runtime]
-                )
-                chart_data[family]["arm64"].append(avg_p99_arm)
-            else:
-                chart_data[family]["arm64"].append(0)
-
-            # x86
-            if runtime in family_data[family]["x86"]:
-                avg_p99_x86 = sum(family_data[family]["x86"][runtime]) / len(
-                    family_data[family]["x86"][runtime]
-                )
-                chart_data[family]["x86"].append(avg_p99_x86)
-            else:
-                chart_data[family]["x86"].append(0)
+        p99_values[family, agg["architecture"], runtime].append(agg["durationStats"]["p99"])
+        runtimes_by_family[family].add(runtime)
+
+    # Average P99 for each runtime (across memory configs); 0 marks a missing architecture
+    chart_data = {}
+    for family in sorted(runtimes_by_family):
+        labels = sort_runtimes_newest_first(list(runtimes_by_family[family]))
+        data = {"labels": labels}
+        for arch in ("arm64", "x86"):
+            averages = []
+            for runtime in labels:
+                values = p99_values.get((family, arch, runtime))
+                averages.append(fmean(values) if values else 0)
+            data[arch] = averages
+        chart_data[family] = data
 
     if not chart_data:
         return
@@ -1365,6 +1269,9 @@ def create_runtime_family_p99_chart(
 
     num_families = len(chart_data)
     bar_width = BAR_WIDTH_STANDARD
+    show_value_labels = (
+        sum(len(data["labels"]) for data in chart_data.values()) <= MAX_VALUE_LABELED_RUNTIMES
+    )
 
     current_x = 0
     xtick_positions = []
@@ -1402,19 +1309,19 @@ def create_runtime_family_p99_chart(
         )
 
         # Add value labels on bars
-        for bars in [arm64_bars, x86_bars]:
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(
-                        bar.get_x() + bar.get_width() / 2.0,
-                        height,
-                        f"{height:.0f}",
-                        ha="center",
-                        va="bottom",
-                        fontsize=8,
-                        fontweight="bold",
-                    )
+        if show_value_labels:
+            for bars in [arm64_bars, x86_bars]:
+                for bar in bars:
+                    height = bar.get_height()
+                    if height > 0:
+                        ax.text(
+                            bar.get_x() + bar.get_width() / 2.0,
+                            height,
+                            f"{height:.0f}",
+                            ha="center",
+                            va="bottom",
+                            fontproperties=VALUE_LABEL_FONT,
+                        )
 
         # Store tick positions and labels
         xtick_positions.extend(x_positions)
@@ -1449,8 +1356,8 @@ def create_runtime_family_p99_chart(
     plt.tight_layout()
     plt.savefig(
         output_dir / "charts" / workload / "runtime-family-p99-warm.png",
-        dpi=CHART_DPI,
         bbox_inches="tight",
+        pil_kwargs=CHART_PNG_OPTIONS,
     )
     plt.close()
 
@@ -1474,51 +1381,34 @@ def create_architecture_comparison_chart(
     # Group by runtime
     runtimes = sort_runtimes_newest_first(list({a["runtime"] for a in filtered}))
 
-    # Calculate average improvements
-    improvements = []
-    for runtime in runtimes:
-        runtime_data = filter_aggregates(filtered, runtime=runtime)
-        runtime_improvements = []
-
-        for agg in runtime_data:
-            if agg["architecture"] == "arm64":
-                # Find matching x86 config
-                x86_match = next(
-                    (
-                        a
-                        for a in runtime_data
-                        if a["architecture"] == "x86" and a["memorySizeMB"] == agg["memorySizeMB"]
-                    ),
-                    None,
-                )
-                if x86_match:
-                    arm_duration = agg["durationStats"]["mean"]
-                    x86_duration = x86_match["durationStats"]["mean"]
-                    improvement = ((x86_duration - arm_duration) / x86_duration) * 100
-                    runtime_improvements.append(improvement)
-
-        if runtime_improvements:
-            improvements.append(sum(runtime_improvements) / len(runtime_improvements))
-        else:
-            improvements.append(0)
+    # Index x86 durations by (runtime, memory) so each ARM64 config finds its match directly
+    x86_durations = {
+        (a["runtime"], a["memorySizeMB"]): a["durationStats"]["mean"]
+        for a in filtered
+        if a["architecture"] == "x86"
+    }
+    improvements_by_runtime = defaultdict(list)
+    for agg in filtered:
+        if agg["architecture"] == "arm64":
+            x86_duration = x86_durations.get((agg["runtime"], agg["memorySizeMB"]))
+            if x86_duration is not None:
+                arm_duration = agg["durationStats"]["mean"]
+                improvement = ((x86_duration - arm_duration) / x86_duration) * 100
+                improvements_by_runtime[agg["runtime"]].append(improvement)
+
+    # Calculate average improvements (0 for runtimes missing one architecture)
+    improvements = [
+        fmean(improvements_by_runtime[runtime]) if runtime in improvements_by_runtime else 0
+        for runtime in runtimes
+    ]
 
     # Create bar chart
     fig, ax = plt.subplots(figsize=(10, 6))
     colors = ["#28a745" if x > 0 else "#dc3545" for x in improvements]
     bars = ax.bar(runtimes, improvements, color=colors, alpha=0.7, edgecolor="black")
 
-    # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(
-            bar.get_x() + bar.get_width() / 2.0,
-            height,
-            f"{height:+.1f}%",
-            ha="center",
-            va="bottom" if height > 0 else "top",
-            fontsize=10,
-            fontweight="bold",
-        )
+    # Add value labels on bars (bar_label puts negative values below their bar)
+    ax.bar_label(bars, fmt="{:+.1f}%", fontsize=10, fontweight="bold")
 
     ax.axhline(y=0, color="black", linestyle="-", linewidth=0.5)
     ax.set_xlabel("Runtime", fontsize=12, fontweight="bold")
@@ -1534,7 +1424,8 @@ def create_architecture_comparison_chart(
     plt.xticks(rotation=45, ha="right")
     plt.tight_layout()
     plt.savefig(
-        output_dir / "charts" / f"arch-comparison-{workload}-{invocation_type}.png", dpi=300
+        output_dir / "charts" / f"arch-comparison-{workload}-{invocation_type}.png",
+        pil_kwargs=CHART_PNG_OPTIONS,
     )
     plt.close()
 
@@ -1555,14 +1446,13 @@ def create_runtime_comparison_chart(
     runtimes = sort_runtimes_newest_first(list({a["runtime"] for a in filtered}))
 
     # Calculate average duration for each runtime/workload combo
+    by_workload_runtime = group_aggregates(filtered, "workloadType", "runtime")
     data = defaultdict(list)
     for workload in workloads:
         for runtime in runtimes:
-            runtime_data = filter_aggregates(filtered, runtime=runtime, workload_type=workload)
+            runtime_data = by_workload_runtime.get((workload, runtime))
             if runtime_data:
-                avg_duration = sum(a["durationStats"]["mean"] for a in runtime_data) / len(
-                    runtime_data
-                )
+                avg_duration = fmean(a["durationStats"]["mean"] for a in runtime_data)
                 data[workload].append(avg_duration)
             else:
                 data[workload].append(0)
@@ -1584,18 +1474,8 @@ def create_runtime_comparison_chart(
             edgecolor="black",
         )
 
-        # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(
-                    bar.get_x() + bar.get_width() / 2.0,
-                    height,
-                    f"{height:.1f}",
-                    ha="center",
-                    va="bottom",
-                    fontsize=8,
-                )
+        # Add value labels, leaving runtimes without data for this workload unlabelled
+        ax.bar_label(bars, labels=[f"{v:.1f}" if v > 0 else "" for v in values], fontsize=8)
 
     ax.set_xlabel("Runtime", fontsize=12, fontweight="bold")
     ax.set_ylabel("Average Duration (ms)", fontsize=12, fontweight="bold")
@@ -1613,7 +1493,7 @@ def create_runtime_comparison_chart(
     plt.tight_layout()
     plt.savefig(
         output_dir / "charts" / f"runtime-comparison-{architecture}-{invocation_type}.png",
-        dpi=CHART_DPI,
+        pil_kwargs=CHART_PNG_OPTIONS,
     )
     plt.close()
 
@@ -1625,26 +1505,25 @@ def create_cold_start_analysis_chart(aggregates: list[dict[str, Any]], output_di
     if not cold_starts:
         return
 
-    # Group by runtime and architecture
-    data = defaultdict(lambda: defaultdict(list))
+    # Group init means by (runtime, architecture) in one flat dict
+    init_means = defaultdict(list)
     for agg in cold_starts:
         if "initDurationStats" in agg:
-            runtime = agg["runtime"]
-            arch = agg["architecture"]
-            init_mean = agg["initDurationStats"]["mean"]
-            data[runtime][arch].append(init_mean)
+            init_means[agg["runtime"], agg["architecture"]].append(
+                agg["initDurationStats"]["mean"]
+            )
 
     # Calculate averages
-    runtimes = sort_runtimes_newest_first(list(data.keys()))
+    runtimes = sort_runtimes_newest_first(list({runtime for runtime, _ in init_means}))
     arm64_inits = []
     x86_inits = []
 
     for runtime in runtimes:
-        arm64_values = data[runtime].get("arm64", [])
-        x86_values = data[runtime].get("x86", [])
+        arm64_values = init_means.get((runtime, "arm64"), [])
+        x86_values = init_means.get((runtime, "x86"), [])
 
-        arm64_inits.append(sum(arm64_values) / len(arm64_values) if arm64_values else 0)
-        x86_inits.append(sum(x86_values) / len(x86_values) if x86_values else 0)
+        arm64_inits.append(fmean(arm64_values) if arm64_values else 0)
+        x86_inits.append(fmean(x86_values) if x86_values else 0)
 
     fig, ax = plt.subplots(figsize=(10, 6))
     x = range(len(runtimes))
@@ -1669,19 +1548,9 @@ def create_cold_start_analysis_chart(aggregates: list[dict[str, Any]], output_di
         edgecolor="black",
     )
 
-    # Add value labels
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(
-                    bar.get_x() + bar.get_width() / 2.0,
-                    height,
-                    f"{height:.1f}",
-                    ha="center",
-                    va="bottom",
-                    fontsize=9,
-                )
+    # Add value labels, leaving architectures without cold start data unlabelled
+    for bars, values in [(bars1, arm64_inits), (bars2, x86_inits)]:
+        ax.bar_label(bars, labels=[f"{v:.1f}" if v > 0 else "" for v in values], fontsize=9)
 
     ax.set_xlabel("Runtime", fontsize=12, fontweight="bold")
     ax.set_ylabel("Average Init Duration (ms)", fontsize=12, fontweight="bold")
@@ -1692,7 +1561,7 @@ def create_cold_start_analysis_chart(aggregates: list[dict[str, Any]], output_di
     ax.grid(axis="y", alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig(output_dir / "charts" / "cold-start-analysis.png", dpi=300)
+    plt.savefig(output_dir / "charts" / "cold-start-analysis.png", pil_kwargs=CHART_PNG_OPTIONS)
     plt.close()
 
 
@@ -1707,21 +1576,18 @@ def create_memory_impact_chart(
     if not filtered:
         return
 
-    # Group by architecture and memory
-    data = defaultdict(lambda: defaultdict(float))
+    # Collect (memory, duration) points per architecture in one pass
+    points = defaultdict(list)
     for agg in filtered:
-        memory = agg["memorySizeMB"]
-        arch = agg["architecture"]
-        duration = agg["durationStats"]["mean"]
-        data[arch][memory] = duration
+        points[agg["architecture"]].append((agg["memorySizeMB"], agg["durationStats"]["mean"]))
 
     # Create line chart
     fig, ax = plt.subplots(figsize=(10, 6))
 
     for arch, color in [("arm64", "#28a745"), ("x86", "#007bff")]:
-        if arch in data:
-            memories = sorted(data[arch].keys())
-            durations = [data[arch][m] for m in memories]
+        if arch in points:
+            # Memory sizes are unique per architecture, so sorting the pairs sorts by memory
+            memories, durations = zip(*sorted(points[arch]), strict=True)
 
             ax.plot(
                 memories,
@@ -1734,7 +1600,7 @@ def create_memory_impact_chart(
             )
 
             # Add value labels
-            for x, y in zip(memories, durations, strict=False):
+            for x, y in zip(memories, durations, strict=True):
                 ax.annotate(
                     f"{y:.1f}",
                     xy=(x, y),
@@ -1755,7 +1621,10 @@ def create_memory_impact_chart(
     ax.grid(alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig(output_dir / "charts" / f"memory-impact-{workload}-{runtime}.png", dpi=300)
+    plt.savefig(
+        output_dir / "charts" / f"memory-impact-{workload}-{runtime}.png",
+        pil_kwargs=CHART_PNG_OPTIONS,
+    )
     plt.close()
 
 
@@ -1779,17 +1648,22 @@ def create_cost_vs_performance_scatter(
 
     fig, ax = plt.subplots(figsize=(12, 8))
 
-    # Plot each configuration as a point
+    # Collect every point in one pass, split by marker shape: a scatter call takes a single
+    # marker, so each architecture becomes one call with per-point colors
+    points: dict[str, tuple[list[float], list[float], list[str]]] = {
+        "arm64": ([], [], []),
+        "x86": ([], [], []),
+    }
+    families_present = set()
     for agg in filtered:
         runtime = agg["runtime"]
         arch = agg["architecture"]
         memory = agg["memorySizeMB"]
 
         # Calculate cost per 1M invocations
-        cost = calculate_invocation_cost(
+        cost_per_million = calculate_cost_per_million(
             agg["billedDurationStats"]["mean"], memory, arch, region
         )
-        cost_per_million = cost * 1_000_000
 
         # Get duration (include init for cold starts)
         duration = agg["durationStats"]["mean"]
@@ -1798,23 +1672,12 @@ def create_cost_vs_performance_scatter(
 
         # Get runtime family for coloring
         family = RUNTIME_FAMILIES.get(runtime, "Unknown")
-        color = FAMILY_COLORS.get(family, "#999999")
+        families_present.add(family)
 
-        # Use different markers for architectures
-        marker = "o" if arch == "arm64" else "s"
-        alpha = 0.7 if arch == "arm64" else 0.5
-
-        ax.scatter(
-            duration,
-            cost_per_million,
-            color=color,
-            marker=marker,
-            s=100,
-            alpha=alpha,
-            edgecolors="black",
-            linewidths=1,
-            label=f"{family} {arch.upper()}" if agg == filtered[0] else "",
-        )
+        durations, costs, colors = points["arm64" if arch == "arm64" else "x86"]
+        durations.append(duration)
+        costs.append(cost_per_million)
+        colors.append(FAMILY_COLORS.get(family, "#999999"))
 
         # Annotate with memory size (only for extreme values to avoid clutter)
         if memory in [128, 8192] or (memory == 1769 and duration < 100):
@@ -1827,18 +1690,32 @@ def create_cost_vs_performance_scatter(
                 alpha=0.6,
             )
 
+    # Use different markers for architectures
+    for arch, marker, alpha in (("arm64", "o", 0.7), ("x86", "s", 0.5)):
+        durations, costs, colors = points[arch]
+        if durations:
+            ax.scatter(
+                durations,
+                costs,
+                c=colors,
+                marker=marker,
+                s=100,
+                alpha=alpha,
+                edgecolors="black",
+                linewidths=1,
+            )
+
     # Create custom legend
     from matplotlib.lines import Line2D
     legend_elements = []
-    for family in sorted(set(RUNTIME_FAMILIES.values())):
-        if any(RUNTIME_FAMILIES.get(a["runtime"]) == family for a in filtered):
-            color = FAMILY_COLORS.get(family, "#999999")
-            legend_elements.append(Line2D([0], [0], marker="o", color="w",
-                                         markerfacecolor=color, markersize=10,
-                                         label=f"{family} ARM64", markeredgecolor="black"))
-            legend_elements.append(Line2D([0], [0], marker="s", color="w",
-                                         markerfacecolor=color, markersize=10, alpha=0.5,
-                                         label=f"{family} x86", markeredgecolor="black"))
+    for family in sorted(set(RUNTIME_FAMILIES.values()) & families_present):
+        color = FAMILY_COLORS.get(family, "#999999")
+        legend_elements.append(Line2D([0], [0], marker="o", color="w",
+                                     markerfacecolor=color, markersize=10,
+                                     label=f"{family} ARM64", markeredgecolor="black"))
+        legend_elements.append(Line2D([0], [0], marker="s", color="w",
+                                     markerfacecolor=color, markersize=10, alpha=0.5,
+                                     label=f"{family} x86", markeredgecolor="black"))
 
     ax.legend(handles=legend_elements, loc="upper right", fontsize=9)
 
@@ -1855,8 +1732,7 @@ def create_cost_vs_performance_scatter(
 
     plt.tight_layout()
     chart_path = output_dir / "charts" / workload / f"cost-vs-performance-{invocation_type}.png"
-    chart_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(chart_path, dpi=CHART_DPI, bbox_inches="tight")
+    plt.savefig(chart_path, bbox_inches="tight", pil_kwargs=CHART_PNG_OPTIONS)
     plt.close()
 
 
@@ -1885,45 +1761,41 @@ def create_cost_savings_heatmap(
     runtimes = sort_runtimes_newest_first(list({a["runtime"] for a in filtered}))
     memories = sorted({a["memorySizeMB"] for a in filtered})
 
-    # Create matrix: rows=runtimes, cols=memories, values=% savings
-    matrix = []
-    for runtime in runtimes:
-        row = []
-        for memory in memories:
-            # Get ARM64 and x86 costs for this config
-            arm64_agg = next(
-                (a for a in filtered
-                 if a["runtime"] == runtime and a["memorySizeMB"] == memory and a["architecture"] == "arm64"),
-                None,
-            )
-            x86_agg = next(
-                (a for a in filtered
-                 if a["runtime"] == runtime and a["memorySizeMB"] == memory and a["architecture"] == "x86"),
-                None,
-            )
-
+    # Index aggregates by configuration so each cell is two dict lookups, not two scans
+    by_config = {(a["runtime"], a["memorySizeMB"], a["architecture"]): a for a in filtered}
+
+    # Costs per 1M invocations, rows=runtimes, cols=memories; NaN where an architecture is
+    # missing. Pricing stays in calculate_cost_per_million, the savings math is one expression.
+    arm64_costs = np.full((len(runtimes), len(memories)), np.nan)
+    x86_costs = np.full_like(arm64_costs, np.nan)
+    for i, runtime in enumerate(runtimes):
+        for j, memory in enumerate(memories):
+            arm64_agg = by_config.get((runtime, memory, "arm64"))
+            x86_agg = by_config.get((runtime, memory, "x86"))
             if arm64_agg and x86_agg:
-                # Calculate costs
-                arm64_cost = calculate_invocation_cost(
+                arm64_costs[i, j] = calculate_cost_per_million(
                     arm64_agg["billedDurationStats"]["mean"], memory, "arm64", region
-                ) * 1_000_000
-                x86_cost = calculate_invocation_cost(
+                )
+                x86_costs[i, j] = calculate_cost_per_million(
                     x86_agg["billedDurationStats"]["mean"], memory, "x86", region
-                ) * 1_000_000
+                )
 
-                # Calculate savings: positive = ARM64 cheaper, negative = x86 cheaper
-                savings_pct = ((x86_cost - arm64_cost) / x86_cost) * 100
-                row.append(savings_pct)
-            else:
-                row.append(float("nan"))
-        matrix.append(row)
+    # Savings %: positive = ARM64 cheaper, negative = x86 cheaper (NaN cells stay NaN)
+    matrix_array = ((x86_costs - arm64_costs) / x86_costs) * 100
 
     # Create heatmap
     fig, ax = plt.subplots(figsize=(14, 7))
-    matrix_array = np.array(matrix)
 
-    # Use diverging colormap: green for ARM64 wins, red for x86 wins
-    im = ax.imshow(matrix_array, cmap="RdYlGn", aspect="auto", vmin=-30, vmax=30)
+    # Use diverging colormap: green for ARM64 wins, red for x86 wins. NaN cells stay unpainted.
+    im = ax.pcolormesh(
+        np.arange(len(memories) + 1) - 0.5,
+        np.arange(len(runtimes) + 1) - 0.5,
+        matrix_array,
+        cmap="RdYlGn",
+        vmin=-30,
+        vmax=30,
+    )
+    ax.invert_yaxis()
 
     # Set ticks
     ax.set_xticks(range(len(memories)))
@@ -1931,23 +1803,21 @@ def create_cost_savings_heatmap(
     ax.set_xticklabels([f"{m}MB" for m in memories], rotation=45, ha="right")
     ax.set_yticklabels(runtimes)
 
-    # Add percentage values to cells
-    for i in range(len(runtimes)):
-        for j in range(len(memories)):
-            if not np.isnan(matrix_array[i, j]):
-                value = matrix_array[i, j]
-                # Use white text on dark cells, black on light cells
-                text_color = "white" if abs(value) > 15 else "black"
-                ax.text(
-                    j,
-                    i,
-                    f"{value:+.1f}%",
-                    ha="center",
-                    va="center",
-                    color=text_color,
-                    fontsize=9,
-                    fontweight="bold" if abs(value) > 10 else "normal",
-                )
+    # Add percentage values to cells (row-major, skipping cells without both architectures)
+    for i, j in np.argwhere(~np.isnan(matrix_array)).tolist():
+        value = matrix_array[i, j]
+        # Use white text on dark cells, black on light cells
+        text_color = "white" if abs(value) > 15 else "black"
+        ax.text(
+            j,
+            i,
+            f"{value:+.1f}%",
+            ha="center",
+            va="center",
+            color=text_color,
+            fontsize=9,
+            fontweight="bold" if abs(value) > 10 else "normal",
+        )
 
     # Colorbar
     cbar = plt.colorbar(im, ax=ax)
@@ -1966,8 +1836,7 @@ def create_cost_savings_heatmap(
 
     plt.tight_layout()
     chart_path = output_dir / "charts" / workload / f"cost-savings-{invocation_type}.png"
-    chart_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(chart_path, dpi=CHART_DPI, bbox_inches="tight")
+    plt.savefig(chart_path, bbox_inches="tight", pil_kwargs=CHART_PNG_OPTIONS)
     plt.close()
 
 
@@ -1987,54 +1856,48 @@ def create_memory_scaling_efficiency_chart(
 
     fig, ax = plt.subplots(figsize=(14, 8))
 
-    # Process each runtime/arch combo
-    for runtime in sort_runtimes_newest_first(list({a["runtime"] for a in filtered})):
-        for arch in ["arm64", "x86"]:
-            combo_data = filter_aggregates(filtered, runtime=runtime, architecture=arch)
-            if not combo_data:
-                continue
-
-            # Sort by memory
-            combo_data = sorted(combo_data, key=lambda x: x["memorySizeMB"])
-
-            # Calculate efficiency between consecutive memory levels
-            efficiencies = []
-            memory_labels = []
-
-            for i in range(len(combo_data) - 1):
-                curr = combo_data[i]
-                next_item = combo_data[i + 1]
-
-                curr_dur = curr["durationStats"]["mean"]
-                next_dur = next_item["durationStats"]["mean"]
-
-                # Performance improvement (%)
-                improvement = ((curr_dur - next_dur) / curr_dur) * 100
-
-                # Memory multiplier
-                memory_mult = next_item["memorySizeMB"] / curr["memorySizeMB"]
-
-                # Efficiency = improvement per memory multiplier
-                efficiency = improvement / memory_mult
-
-                efficiencies.append(efficiency)
-                memory_labels.append(f"{curr['memorySizeMB']}→{next_item['memorySizeMB']}")
-
-            if efficiencies:
-                label = f"{runtime} {arch}"
-                color = RUNTIME_COLORS.get(runtime, "#999999")
-                linestyle = "-" if arch == "arm64" else "--"
-
-                ax.plot(
-                    range(len(efficiencies)),
-                    efficiencies,
-                    marker="o",
-                    label=label,
-                    color=color,
-                    linestyle=linestyle,
-                    linewidth=2,
-                    markersize=6,
-                )
+    # Process each runtime/arch combo, newest runtime first and arm64 before x86; the group
+    # keys already hold every combination present, so no separate runtime scan is needed
+    by_combo = group_aggregates(filtered, "runtime", "architecture")
+    for runtime, arch in sort_runtime_keys_newest_first(list(by_combo)):
+        # Sort by memory
+        combo_data = sorted(by_combo[runtime, arch], key=itemgetter("memorySizeMB"))
+
+        # Calculate efficiency between consecutive memory levels
+        efficiencies = []
+        memory_labels = []
+
+        for curr, next_item in pairwise(combo_data):
+            curr_dur = curr["durationStats"]["mean"]
+            next_dur = next_item["durationStats"]["mean"]
+
+            # Performance improvement (%)
+            improvement = ((curr_dur - next_dur) / curr_dur) * 100
+
+            # Memory multiplier
+            memory_mult = next_item["memorySizeMB"] / curr["memorySizeMB"]
+
+            # Efficiency = improvement per memory multiplier
+            efficiency = improvement / memory_mult
+
+            efficiencies.append(efficiency)
+            memory_labels.append(f"{curr['memorySizeMB']}→{next_item['memorySizeMB']}")
+
+        if efficiencies:
+            label = f"{runtime} {arch}"
+            color = RUNTIME_COLORS.get(runtime, "#999999")
+            linestyle = "-" if arch == "arm64" else "--"
+
+            ax.plot(
+                range(len(efficiencies)),
+                efficiencies,
+                marker="o",
+                label=label,
+                color=color,
+                linestyle=linestyle,
+                linewidth=2,
+                markersize=6,
+            )
 
     ax.set_xticks(range(len(memory_labels)))
     ax.set_xticklabels(memory_labels, rotation=45, ha="right")
@@ -2051,8 +1914,7 @@ def create_memory_scaling_efficiency_chart(
 
     plt.tight_layout()
     chart_path = output_dir / "charts" / workload / f"scaling-efficiency-{invocation_type}.png"
-    chart_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(chart_path, dpi=CHART_DPI, bbox_inches="tight")
+    plt.savefig(chart_path, bbox_inches="tight", pil_kwargs=CHART_PNG_OPTIONS)
     plt.close()
 
 
@@ -2070,30 +1932,30 @@ def create_runtime_version_comparison_chart(
     python_runtimes = ["python3.11", "python3.12", "python3.13"]
     rust_runtimes = ["rust"]
 
+    # One pass over the warm aggregates; every family and subplot then reads its cells directly
+    by_workload_runtime = group_aggregates(warm_aggs, "workloadType", "runtime")
+
     for family_name, runtimes in [("Node.js", nodejs_runtimes), ("Python", python_runtimes), ("Rust", rust_runtimes)]:
-        # Get all workloads and memory sizes for this family
-        family_data = [a for a in warm_aggs if a["runtime"] in runtimes]
-        if not family_data:
+        # Get all workloads with data for this family
+        workloads = sorted(
+            {workload for workload, runtime in by_workload_runtime if runtime in runtimes}
+        )
+        if not workloads:
             continue
 
-        workloads = sorted({a["workloadType"] for a in family_data})
-
         fig, axes = plt.subplots(1, len(workloads), figsize=(16, 6))
         if len(workloads) == 1:
             axes = [axes]
 
         for idx, workload in enumerate(workloads):
             ax = axes[idx]
-            workload_data = [a for a in family_data if a["workloadType"] == workload]
 
             # For each runtime version, calculate average duration across all memory sizes/archs
             runtime_avgs = {}
             for runtime in runtimes:
-                runtime_data = [a for a in workload_data if a["runtime"] == runtime]
+                runtime_data = by_workload_runtime.get((workload, runtime))
                 if runtime_data:
-                    avg_dur = sum(a["durationStats"]["mean"] for a in runtime_data) / len(
-                        runtime_data
-                    )
+                    avg_dur = fmean(a["durationStats"]["mean"] for a in runtime_data)
                     runtime_avgs[runtime] = avg_dur
 
             if runtime_avgs:
@@ -2103,17 +1965,7 @@ def create_runtime_version_comparison_chart(
                 bars = ax.bar(x, y, color=[RUNTIME_COLORS.get(r, "#999") for r in x])
 
                 # Add value labels
-                for bar in bars:
-                    height = bar.get_height()
-                    ax.text(
-                        bar.get_x() + bar.get_width() / 2.0,
-                        height,
-                        f"{height:.1f}ms",
-                        ha="center",
-                        va="bottom",
-                        fontsize=10,
-                        fontweight="bold",
-                    )
+                ax.bar_label(bars, fmt="{:.1f}ms", fontsize=10, fontweight="bold")
 
                 ax.set_ylabel("Avg Duration (ms)", fontsize=10, fontweight="bold")
                 ax.set_title(format_workload_name(workload), fontsize=12, fontweight="bold")
@@ -2124,7 +1976,7 @@ def create_runtime_version_comparison_chart(
         )
         plt.tight_layout()
         chart_path = output_dir / "charts" / f"runtime-version-comparison-{family_name.lower()}.png"
-        plt.savefig(chart_path, dpi=CHART_DPI, bbox_inches="tight")
+        plt.savefig(chart_path, bbox_inches="tight", pil_kwargs=CHART_PNG_OPTIONS)
         plt.close()
 
 
@@ -2144,43 +1996,40 @@ def create_performance_consistency_chart(
 
     fig, ax = plt.subplots(figsize=(14, 8))
 
-    # Process each runtime/arch combo
-    for runtime in sort_runtimes_newest_first(list({a["runtime"] for a in filtered})):
-        for arch in ["arm64", "x86"]:
-            combo_data = filter_aggregates(filtered, runtime=runtime, architecture=arch)
-            if not combo_data:
-                continue
-
-            # Sort by memory
-            combo_data = sorted(combo_data, key=lambda x: x["memorySizeMB"])
-
-            memories = []
-            consistency_ratios = []
-
-            for agg in combo_data:
-                mean = agg["durationStats"].get("mean")
-                p99 = agg["durationStats"].get("p99")
-
-                if mean and p99 and mean > 0:
-                    ratio = p99 / mean
-                    memories.append(agg["memorySizeMB"])
-                    consistency_ratios.append(ratio)
-
-            if consistency_ratios:
-                label = f"{runtime} {arch}"
-                color = RUNTIME_COLORS.get(runtime, "#999999")
-                linestyle = "-" if arch == "arm64" else "--"
-
-                ax.plot(
-                    memories,
-                    consistency_ratios,
-                    marker="o",
-                    label=label,
-                    color=color,
-                    linestyle=linestyle,
-                    linewidth=2,
-                    markersize=6,
-                )
+    # Process each runtime/arch combo, newest runtime first and arm64 before x86; the group
+    # keys already hold every combination present, so no separate runtime scan is needed
+    by_combo = group_aggregates(filtered, "runtime", "architecture")
+    for runtime, arch in sort_runtime_keys_newest_first(list(by_combo)):
+        # Sort by memory
+        combo_data = sorted(by_combo[runtime, arch], key=itemgetter("memorySizeMB"))
+
+        memories = []
+        consistency_ratios = []
+
+        for agg in combo_data:
+            mean = agg["durationStats"].get("mean")
+            p99 = agg["durationStats"].get("p99")
+
+            if mean and p99 and mean > 0:
+                ratio = p99 / mean
+                memories.append(agg["memorySizeMB"])
+                consistency_ratios.append(ratio)
+
+        if consistency_ratios:
+            label = f"{runtime} {arch}"
+            color = RUNTIME_COLORS.get(runtime, "#999999")
+            linestyle = "-" if arch == "arm64" else "--"
+
+            ax.plot(
+                memories,
+                consistency_ratios,
+                marker="o",
+                label=label,
+                color=color,
+                linestyle=linestyle,
+                linewidth=2,
+                markersize=6,
+            )
 
     ax.set_xlabel("Memory (MB)", fontsize=12, fontweight="bold")
     ax.set_ylabel("Consistency Ratio (P99/Mean)", fontsize=12, fontweight="bold")
@@ -2195,11 +2044,59 @@ def create_performance_consistency_chart(
 
     plt.tight_layout()
     chart_path = output_dir / "charts" / workload / f"consistency-{invocation_type}.png"
-    chart_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(chart_path, dpi=CHART_DPI, bbox_inches="tight")
+    plt.savefig(chart_path, bbox_inches="tight", pil_kwargs=CHART_PNG_OPTIONS)
     plt.close()
 
 
+# =============================================================================
+# Parallel Chart Rendering
+# =============================================================================
+
+# A chart function plus every argument after the aggregates list it is called with
+ChartJob = tuple[Callable[..., None], tuple[Any, ...]]
+
+# Aggregates for the current worker process, set once by init_chart_worker
+_worker_aggregates: list[dict[str, Any]] = []
+
+
+def init_chart_worker(aggregates: list[dict[str, Any]], dpi: int) -> None:
+    """Receive the aggregates once per worker instead of pickling them with every job."""
+    global _worker_aggregates
+    _worker_aggregates = aggregates
+    # Spawned or forkserver workers do not inherit the backend chosen in main()
+    plt.switch_backend("Agg")
+    plt.rcParams["savefig.dpi"] = dpi
+
+
+def run_chart_job(job: ChartJob) -> None:
+    """Render one chart in a worker process."""
+    chart_fn, args = job
+    chart_fn(_worker_aggregates, *args)
+
+
+def render_charts(
+    aggregates: list[dict[str, Any]], jobs: list[ChartJob], dpi: int = CHART_DPI
+) -> None:
+    """
+    Render charts in parallel worker processes.
+
+    Each chart is independent and almost entirely CPU-bound Agg rasterization and PNG
+    encoding, so processes (not threads) are used to spread them across cores.
+
+    Args:
+        aggregates: Aggregates shared by every chart
+        jobs: Chart functions and their remaining arguments
+        dpi: Resolution to save every chart at
+    """
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=init_chart_worker, initargs=(aggregates, dpi)
+    ) as executor:
+        # Consume the results so an exception raised by any chart surfaces here
+        for _ in executor.map(run_chart_job, jobs):
+            pass
+
+
 def main() -> None:
     """Main entry point for benchmark results analysis."""
     parser = argparse.ArgumentParser(
@@ -2212,34 +2109,59 @@ def main() -> None:
         help="Filter by workload type (cpu-intensive, memory-intensive, light)",
     )
     parser.add_argument("--architecture", help="Filter by architecture (arm64, x86)")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-query DynamoDB instead of using cached results from a previous analysis",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=CHART_DPI,
+        help=f"Chart resolution; lower values render faster for quick looks (default: {CHART_DPI})",
+    )
 
     args = parser.parse_args()
 
+    # Charts are only ever written to files. Select Agg before any figure exists so no GUI
+    # backend is initialised here and then inherited by forked chart workers.
+    plt.switch_backend("Agg")
+
     log.info(f"Analyzing test run: {args.test_run_id}")
     log.info("=" * 80)
 
-    # Get test run info
-    test_run_info = get_test_run_info(args.test_run_id)
-
-    # Fetch aggregates
-    log.info("Fetching aggregate statistics from DynamoDB...")
-    aggregates = get_all_aggregates(args.test_run_id)
-    log.info(f"Retrieved {len(aggregates)} aggregate items")
-
-    if not aggregates:
-        log.error("No aggregates found for this test run.")
-        sys.exit(1)
-
-    # Apply filters if specified
-    original_count = len(aggregates)
-    if args.runtime or args.workload or args.architecture:
+    cached = None if args.refresh else load_cached_results(args.test_run_id)
+    if cached:
+        log.info(f"Using cached results from {CACHE_DIR} (pass --refresh to re-query DynamoDB)")
+        test_run_info, aggregates = cached
         aggregates = filter_aggregates(
             aggregates,
             runtime=args.runtime,
             workload_type=args.workload,
             architecture=args.architecture,
         )
-        log.info(f"Filtered to {len(aggregates)} aggregates (from {original_count})")
+    else:
+        # Get test run info
+        test_run_info = get_test_run_info(args.test_run_id)
+
+        # Fetch aggregates (filters are applied by DynamoDB)
+        log.info("Fetching aggregate statistics from DynamoDB...")
+        aggregates = get_all_aggregates(
+            args.test_run_id,
+            runtime=args.runtime,
+            architecture=args.architecture,
+            workload_type=args.workload,
+        )
+
+        # Only complete, unfiltered runs are cached; in-progress runs are always re-read
+        unfiltered = not (args.runtime or args.workload or args.architecture)
+        if unfiltered and aggregates and test_run_info and test_run_info["status"] == "completed":
+            save_cached_results(args.test_run_id, test_run_info, aggregates)
+    log.info(f"Retrieved {len(aggregates)} aggregate items")
+
+    if not aggregates:
+        log.error("No aggregates found for this test run.")
+        sys.exit(1)
 
     # Get region from test run info with fallback
     if test_run_info:
@@ -2266,71 +2188,97 @@ def main() -> None:
     log.info("Generating summary...")
     generate_summary_markdown(test_run_info, aggregates, output_dir)
 
-    # Generate comparison tables
+    # Only (workload, invocation type) pairs with data get tables and charts; a filtered or
+    # in-progress run may lack some, and their jobs would only filter to nothing and return
+    present = {(a["workloadType"], a["invocationType"]) for a in aggregates}
+    combos = [
+        (workload, invocation_type)
+        for workload in workloads
+        for invocation_type in ["cold", "warm"]
+        if (workload, invocation_type) in present
+    ]
+    invocation_types = {invocation_type for _, invocation_type in combos}
+
+    # Generate comparison tables (in-process: each table renders in milliseconds, far less
+    # than the cost of starting worker processes and pickling aggregates to them)
     log.info("Generating comparison tables with cost analysis...")
-    for workload in workloads:
-        for invocation_type in ["cold", "warm"]:
-            generate_comparison_table(
-                aggregates, workload, invocation_type, output_dir, effective_region
-            )
+    for workload, invocation_type in combos:
+        generate_comparison_table(
+            aggregates, workload, invocation_type, output_dir, effective_region
+        )
 
-    # Generate charts
+    # Queue charts, then render them across worker processes
     log.info("Generating charts...")
+    chart_jobs: list[ChartJob] = []
+
     log.info("  - Memory scaling charts (6 charts: all runtimes/architectures on one chart)")
-    for workload in workloads:
-        for invocation_type in ["cold", "warm"]:
-            create_memory_scaling_chart(aggregates, workload, invocation_type, output_dir)
+    for workload, invocation_type in combos:
+        chart_jobs.append((create_memory_scaling_chart, (workload, invocation_type, output_dir)))
 
     log.info("  - Node.js & Rust comparison charts (6 charts: focused view without Python)")
-    for workload in workloads:
-        for invocation_type in ["cold", "warm"]:
-            create_nodejs_rust_comparison_chart(aggregates, workload, invocation_type, output_dir)
+    for workload, invocation_type in combos:
+        chart_jobs.append(
+            (create_nodejs_rust_comparison_chart, (workload, invocation_type, output_dir))
+        )
 
     log.info("  - Python version comparison charts (6 charts: all Python versions)")
-    for workload in workloads:
-        for invocation_type in ["cold", "warm"]:
-            create_python_comparison_chart(aggregates, workload, invocation_type, output_dir)
+    for workload, invocation_type in combos:
+        chart_jobs.append((create_python_comparison_chart, (workload, invocation_type, output_dir)))
 
     log.info("  - Node.js version comparison charts (6 charts: Node.js 20 vs 22)")
-    for workload in workloads:
-        for invocation_type in ["cold", "warm"]:
-            create_nodejs_comparison_chart(aggregates, workload, invocation_type, output_dir)
+    for workload, invocation_type in combos:
+        chart_jobs.append((create_nodejs_comparison_chart, (workload, invocation_type, output_dir)))
 
     log.info("  - P99 duration scaling charts (6 charts: cold and warm starts)")
-    for workload in workloads:
-        for invocation_type in ["cold", "warm"]:
-            create_p99_scaling_chart(aggregates, workload, invocation_type, output_dir)
+    for workload, invocation_type in combos:
+        chart_jobs.append((create_p99_scaling_chart, (workload, invocation_type, output_dir)))
 
     log.info("  - Runtime family P99 charts (3 charts: clustered by Node.js vs Python)")
     for workload in workloads:
-        create_runtime_family_p99_chart(aggregates, workload, output_dir)
+        if (workload, "warm") in present:
+            chart_jobs.append((create_runtime_family_p99_chart, (workload, output_dir)))
 
     log.info("  - Cold start analysis")
-    create_cold_start_analysis_chart(aggregates, output_dir)
+    if "cold" in invocation_types:
+        chart_jobs.append((create_cold_start_analysis_chart, (output_dir,)))
 
     # New advanced analysis charts
     log.info("  - Cost vs Performance scatter plots (value analysis)")
-    for workload in workloads:
-        for invocation_type in ["cold", "warm"]:
-            create_cost_vs_performance_scatter(aggregates, workload, invocation_type, output_dir, effective_region)
+    for workload, invocation_type in combos:
+        chart_jobs.append(
+            (
+                create_cost_vs_performance_scatter,
+                (workload, invocation_type, output_dir, effective_region),
+            )
+        )
 
     log.info("  - Cost savings heatmaps (ARM64 vs x86 comparison)")
-    for workload in workloads:
-        for invocation_type in ["cold", "warm"]:
-            create_cost_savings_heatmap(aggregates, workload, invocation_type, output_dir, effective_region)
+    for workload, invocation_type in combos:
+        chart_jobs.append(
+            (
+                create_cost_savings_heatmap,
+                (workload, invocation_type, output_dir, effective_region),
+            )
+        )
 
     log.info("  - Memory scaling efficiency charts (diminishing returns analysis)")
-    for workload in workloads:
-        for invocation_type in ["cold", "warm"]:
-            create_memory_scaling_efficiency_chart(aggregates, workload, invocation_type, output_dir)
+    for workload, invocation_type in combos:
+        chart_jobs.append(
+            (create_memory_scaling_efficiency_chart, (workload, invocation_type, output_dir))
+        )
 
     log.info("  - Runtime version comparison (Node.js 20 vs 22, Python 3.11-3.13)")
-    create_runtime_version_comparison_chart(aggregates, output_dir)
+    if "warm" in invocation_types:
+        chart_jobs.append((create_runtime_version_comparison_chart, (output_dir,)))
 
     log.info("  - Performance consistency charts (P99/Mean ratio)")
-    for workload in workloads:
-        for invocation_type in ["cold", "warm"]:
-            create_performance_consistency_chart(aggregates, workload, invocation_type, output_dir)
+    for workload, invocation_type in combos:
+        chart_jobs.append(
+            (create_performance_consistency_chart, (workload, invocation_type, output_dir))
+        )
+
+    log.info(f"Rendering {len(chart_jobs)} charts...")
+    render_charts(aggregates, chart_jobs, dpi=args.dpi)
 
     # REMOVED: Architecture comparison charts - replaced by memory scaling charts
     # REMOVED: Runtime comparison charts - replaced by memory scaling charts
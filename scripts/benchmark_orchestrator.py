@@ -13,17 +13,20 @@ Key Features:
 - Test and production modes for quick validation vs comprehensive analysis
 """
 
-import base64
+import array
+import binascii
+import functools
 import json
 import logging
 import os
+import random
 import re
 import threading
 import time
 import uuid
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
 from typing import Any
 
 import boto3
@@ -45,10 +48,13 @@ logging.basicConfig(
 log = logging.getLogger(__name__)
 
 
+@functools.cache
 def get_aws_region() -> str:
     """
     Get AWS region from multiple sources with fallback.
 
+    Resolved once per process, so new thread-local clients do not rebuild a boto3 Session.
+
     Checks (in order):
     1. AWS_REGION environment variable (set by EC2 user data)
     2. AWS_DEFAULT_REGION environment variable
@@ -76,10 +82,11 @@ def get_boto_config() -> Config:
     """
     return Config(
         region_name=get_aws_region(),
-        retries={"max_attempts": 10, "mode": "standard"},
+        retries={"max_attempts": 10, "mode": "adaptive"},  # Back off client-side when throttled
         max_pool_connections=50,  # High limit for parallel execution (up to 12 workers)
         read_timeout=250,  # Must exceed Lambda timeout (240s) to handle slow executions at low memory
         connect_timeout=20,
+        tcp_keepalive=True,  # Keep pooled connections alive through long synchronous invokes
     )
 
 
@@ -101,6 +108,13 @@ def get_dynamodb_resource():
     return thread_local.dynamodb
 
 
+def get_results_table():
+    """Get thread-local handle to the results table, built once per thread."""
+    if not hasattr(thread_local, "results_table"):
+        thread_local.results_table = get_dynamodb_resource().Table(RESULTS_TABLE_NAME)
+    return thread_local.results_table
+
+
 def get_cloudformation_client():
     """Get thread-local CloudFormation client for thread-safe parallel execution."""
     if not hasattr(thread_local, "cfn_client"):
@@ -109,7 +123,6 @@ def get_cloudformation_client():
 
 
 # Constants
-AWS_REGION = get_aws_region()  # Get region using robust fallback logic
 STACK_NAME = "LambdaBenchmarkStack"
 
 # =============================================================================
@@ -129,6 +142,35 @@ COLD_START_STABILIZATION_DELAY_SECONDS = (
 LAMBDA_INVOKE_MAX_RETRIES = 3
 LAMBDA_INVOKE_BACKOFF_BASE_SECONDS = 1  # Base for exponential backoff (1s, 2s, 4s)
 
+# Memory updates usually settle in under 2s; poll every second instead of the 5s default,
+# keeping the default 300s budget for slow updates
+LAMBDA_UPDATE_WAITER_CONFIG = {"Delay": 1, "MaxAttempts": 300}
+
+# Function discovery: concurrent GetFunctionConfiguration calls (well within the client pool)
+DISCOVERY_MAX_WORKERS = 12
+
+# Result writes: DynamoDB flushes run on these threads so invocation workers never wait on them
+RESULT_WRITE_MAX_WORKERS = 8
+RESULT_BATCH_SIZE = 25  # BatchWriteItem maximum
+RESULT_BATCH_MAX_ATTEMPTS = 8
+RESULT_BATCH_BACKOFF_BASE_SECONDS = 0.05  # Doubles per attempt, plus up to 1s of jitter
+result_write_executor = ThreadPoolExecutor(
+    max_workers=RESULT_WRITE_MAX_WORKERS, thread_name_prefix="ddb-writer"
+)
+
+# Parsers: compiled once, used on every invocation. The REPORT pattern is bytes so
+# decoded log tails can be searched without a UTF-8 decode, and captures every
+# field in a single pass (Init Duration only appears on cold starts).
+_FUNC_NAME_RE = re.compile(r"^(python\d+-\d+|nodejs\d+|rust)-(arm64|x86)-([\w-]+)$")
+_REPORT_RE = re.compile(
+    rb"REPORT RequestId:\s+(?P<rid>[a-f0-9-]+)"
+    rb"\s+Duration:\s+(?P<dur>[\d.]+)\s+ms"
+    rb"\s+Billed Duration:\s+(?P<bill>\d+)\s+ms"
+    rb"\s+Memory Size:\s+\d+\s+MB"
+    rb"\s+Max Memory Used:\s+(?P<mem>\d+)\s+MB"
+    rb"(?:\s+Init Duration:\s+(?P<init>[\d.]+)\s+ms)?"
+)
+
 
 # =============================================================================
 # Configuration
@@ -176,39 +218,26 @@ def build_test_matrix(test_configs: list[tuple[dict[str, str], int]]) -> dict[st
     Groups configurations by (runtime, architecture, workloadType) and aggregates
     memory sizes for each unique combination.
     """
-    config_groups = defaultdict(list)
-    runtimes = set()
-    architectures = set()
-    workload_types = set()
-
+    config_groups = defaultdict(set)
     for func_info, memory_mb in test_configs:
-        runtime = func_info["runtime"]
-        architecture = func_info["architecture"]
-        workload_type = func_info["workloadType"]
-
-        runtimes.add(runtime)
-        architectures.add(architecture)
-        workload_types.add(workload_type)
-
-        key = (runtime, architecture, workload_type)
-        if memory_mb not in config_groups[key]:
-            config_groups[key].append(memory_mb)
-
-    configurations = []
-    for (runtime, architecture, workload_type), memory_sizes in sorted(config_groups.items()):
-        configurations.append(
-            {
-                "runtime": runtime,
-                "architecture": architecture,
-                "workloadType": workload_type,
-                "memorySizes": sorted(memory_sizes),
-            }
-        )
+        key = (func_info["runtime"], func_info["architecture"], func_info["workloadType"])
+        config_groups[key].add(memory_mb)
+
+    configurations = [
+        {
+            "runtime": runtime,
+            "architecture": architecture,
+            "workloadType": workload_type,
+            "memorySizes": sorted(memory_sizes),
+        }
+        for (runtime, architecture, workload_type), memory_sizes in sorted(config_groups.items())
+    ]
 
+    # Dimension values come from the unique group keys rather than every test config
     return {
-        "runtimes": sorted(runtimes),
-        "architectures": sorted(architectures),
-        "workloadTypes": sorted(workload_types),
+        "runtimes": sorted({key[0] for key in config_groups}),
+        "architectures": sorted({key[1] for key in config_groups}),
+        "workloadTypes": sorted({key[2] for key in config_groups}),
         "configurations": configurations,
     }
 
@@ -227,8 +256,20 @@ def parse_function_name(name: str) -> tuple[str, str, str]:
     Raises:
         ValueError: If function name doesn't match expected pattern
     """
-    pattern = r"^(python\d+-\d+|nodejs\d+|rust)-(arm64|x86)-([\w-]+)$"
-    match = re.match(pattern, name)
+    # Fast path: locate the architecture token directly; regex only for odd names
+    for arch_token in ("-arm64-", "-x86-"):
+        arch_start = name.find(arch_token)
+        if arch_start > 0:
+            runtime_raw = name[:arch_start]
+            workload = name[arch_start + len(arch_token) :]
+            if not workload:
+                break
+            if runtime_raw.startswith("python"):
+                return runtime_raw.replace("-", "."), arch_token[1:-1], workload
+            if runtime_raw.startswith("nodejs") or runtime_raw == "rust":
+                return runtime_raw, arch_token[1:-1], workload
+
+    match = _FUNC_NAME_RE.match(name)
 
     if not match:
         # Fallback to legacy parsing for backward compatibility
@@ -258,55 +299,65 @@ def parse_cloudwatch_report(log_result: str) -> dict[str, Any]:
     - Memory Used (MB)
     - Init Duration (ms, cold starts only)
     - Lambda Request ID
+
+    The base64 log tail is decoded to bytes and matched there; it is never decoded to str.
     """
     if not log_result:
         return {}
 
-    log_text = base64.b64decode(log_result).decode("utf-8")
+    # a2b_base64 is what base64.b64decode wraps, minus its argument normalization
+    log_bytes = binascii.a2b_base64(log_result)
 
-    report_match = re.search(r"REPORT RequestId:\s+([a-f0-9-]+).*", log_text)
+    report_match = _REPORT_RE.search(log_bytes)
     if not report_match:
         return {}
 
-    report_line = report_match.group(0)
-    result = {"lambda_request_id": report_match.group(1)}
-
-    duration_match = re.search(r"Duration:\s+([\d.]+)\s+ms", report_line)
-    if duration_match:
-        result["duration_ms"] = float(duration_match.group(1))
-
-    billed_match = re.search(r"Billed Duration:\s+(\d+)\s+ms", report_line)
-    if billed_match:
-        result["billed_duration_ms"] = int(billed_match.group(1))
-
-    memory_match = re.search(r"Max Memory Used:\s+(\d+)\s+MB", report_line)
-    if memory_match:
-        result["memory_used_mb"] = int(memory_match.group(1))
-
-    init_match = re.search(r"Init Duration:\s+([\d.]+)\s+ms", report_line)
-    if init_match:
-        result["init_duration_ms"] = float(init_match.group(1))
+    rid, duration, billed, memory, init = report_match.groups()
+    result = {
+        "lambda_request_id": rid.decode("ascii"),
+        "duration_ms": float(duration),
+        "billed_duration_ms": int(billed),
+        "memory_used_mb": int(memory),
+    }
+    if init is not None:
+        result["init_duration_ms"] = float(init)
 
     return result
 
 
-def build_workload_payload(workload_type: str, _memory_mb: int) -> dict:
+def build_workload_payload(workload_type: str) -> dict:
     """
     Build invocation payload based on workload type.
 
     Note: memory-intensive workload uses fixed 100 MB array (hardcoded in handlers),
-    so no payload needed. The _memory_mb parameter is kept for API consistency but unused.
+    so no payload needed.
     """
     if workload_type == "cpu-intensive":
         return {"iterations": CPU_INTENSIVE_ITERATIONS}
     return {}
 
 
+@functools.lru_cache(maxsize=4)
+def serialize_workload_payload(workload_type: str) -> str:
+    """
+    Serialize the invocation payload once per workload type.
+
+    The payload does not depend on memory size, so every invocation of a workload
+    reuses the same encoded body and never rebuilds the dict.
+    """
+    return json.dumps(build_workload_payload(workload_type))
+
+
 # =============================================================================
 # AWS Infrastructure Functions (Read State)
 # =============================================================================
 
 
+def _get_function_configuration(function_name: str) -> dict[str, Any]:
+    """Fetch one function's configuration with the calling thread's Lambda client."""
+    return get_lambda_client().get_function_configuration(FunctionName=function_name)
+
+
 def get_deployed_functions(name_filter: str | None = None) -> list[dict[str, str]]:
     """
     Get all deployed Lambda functions from CloudFormation stack.
@@ -334,7 +385,6 @@ def get_deployed_functions(name_filter: str | None = None) -> list[dict[str, str
         log.warning(f"Could not determine credential source: {e}")
 
     cfn_client = get_cloudformation_client()
-    lambda_client = get_lambda_client()
 
     # List all resources in the stack with pagination support
     function_names = set()
@@ -368,12 +418,16 @@ def get_deployed_functions(name_filter: str | None = None) -> list[dict[str, str
         log.warning(f"No Lambda functions found in stack {STACK_NAME}")
         return []
 
-    functions = []
-    for name in sorted(function_names):
-        if name_filter and name_filter not in name:
-            continue
+    selected_names = [
+        name for name in sorted(function_names) if not name_filter or name_filter in name
+    ]
+
+    # Fetch configurations concurrently; each worker thread uses its own thread-local client
+    with ThreadPoolExecutor(max_workers=DISCOVERY_MAX_WORKERS) as executor:
+        configurations = list(executor.map(_get_function_configuration, selected_names))
 
-        response = lambda_client.get_function_configuration(FunctionName=name)
+    functions = []
+    for name, response in zip(selected_names, configurations, strict=True):
         runtime, arch, workload = parse_function_name(name)
 
         functions.append(
@@ -426,7 +480,7 @@ def _update_function_memory_with_retry(
                 FunctionName=function_name, MemorySize=memory_mb
             )
             waiter = lambda_client.get_waiter("function_updated")
-            waiter.wait(FunctionName=function_name)
+            waiter.wait(FunctionName=function_name, WaiterConfig=LAMBDA_UPDATE_WAITER_CONFIG)
             return
         except ClientError as e:
             if e.response["Error"]["Code"] == "ResourceConflictException" and attempt < max_retries - 1:
@@ -440,13 +494,17 @@ def _update_function_memory_with_retry(
                 raise
 
 
-def force_cold_start(function_name: str, memory_mb: int) -> None:
+def force_cold_start(function_name: str, memory_mb: int, current_memory: int | None = None) -> None:
     """
     Force a cold start by updating Lambda function configuration.
+
+    Pass current_memory when the caller already knows it to skip the
+    GetFunctionConfiguration round-trip.
     """
-    lambda_client = get_lambda_client()
-    current_config = lambda_client.get_function_configuration(FunctionName=function_name)
-    current_memory = current_config["MemorySize"]
+    if current_memory is None:
+        lambda_client = get_lambda_client()
+        current_config = lambda_client.get_function_configuration(FunctionName=function_name)
+        current_memory = current_config["MemorySize"]
 
     if current_memory == memory_mb:
         if memory_mb >= LAMBDA_MEMORY_MAX_MB:
@@ -470,13 +528,14 @@ def force_cold_start(function_name: str, memory_mb: int) -> None:
 
 
 def invoke_function_with_retry(
-    function_name: str, payload: dict, max_attempts: int = LAMBDA_INVOKE_MAX_RETRIES
+    function_name: str, payload: str, max_attempts: int = LAMBDA_INVOKE_MAX_RETRIES
 ) -> dict:
     """
     Invoke Lambda function with exponential backoff retry.
 
     Retries on throttling (TooManyRequestsException) and service errors (5xx)
-    with exponential backoff (1s, 2s, 4s).
+    with exponential backoff (1s, 2s, 4s). The client's adaptive retry mode already
+    rate-limits and retries throttles; this is the fallback once those attempts run out.
     """
     lambda_client = get_lambda_client()
     for attempt in range(max_attempts):
@@ -484,7 +543,7 @@ def invoke_function_with_retry(
             response = lambda_client.invoke(
                 FunctionName=function_name,
                 InvocationType="RequestResponse",
-                Payload=json.dumps(payload),
+                Payload=payload,
                 LogType="Tail",
             )
             return response
@@ -504,7 +563,7 @@ def invoke_function_with_retry(
                 raise
 
 
-def invoke_function(function_name: str, workload_type: str, memory_mb: int) -> dict[str, Any]:
+def invoke_function(function_name: str, workload_type: str) -> dict[str, Any]:
     """
     Invoke Lambda function and capture performance metrics.
 
@@ -517,8 +576,10 @@ def invoke_function(function_name: str, workload_type: str, memory_mb: int) -> d
     - memoryUsedMB: Peak memory usage
     - initDurationMs: Initialization time (cold starts only)
     """
-    payload = build_workload_payload(workload_type, memory_mb)
+    payload = serialize_workload_payload(workload_type)
     response = invoke_function_with_retry(function_name, payload)
+    # Handlers catch their own errors and return {"success": false} without a FunctionError,
+    # so success is only known from the payload; it must be parsed on every invocation
     result = json.loads(response["Payload"].read())
 
     metrics = {}
@@ -544,59 +605,167 @@ def invoke_function(function_name: str, workload_type: str, memory_mb: int) -> d
 # =============================================================================
 
 
-def store_result(
-    function_info: dict[str, str],
-    memory_mb: int,
-    is_cold_start: bool,
-    invocation_result: dict[str, Any],
-    test_run_id: str,
-    invocation_number: int,
-) -> None:
-    """Store individual benchmark result in DynamoDB with AWS-reported metrics."""
-    dynamodb = get_dynamodb_resource()
-    table = dynamodb.Table(RESULTS_TABLE_NAME)
-    timestamp = int(time.time() * 1000)
+def write_result_batch(items: list[dict[str, Any]]) -> None:
+    """
+    Write up to RESULT_BATCH_SIZE items to the results table in one BatchWriteItem call.
 
-    config_id = make_config_id(function_info, memory_mb)
-    invocation_type = "cold" if is_cold_start else "warm"
-    pk = f"{test_run_id}#{config_id}"
-    sk = f"{invocation_type}#{invocation_number}"
+    DynamoDB may accept only part of a batch under throttling; the remainder comes back
+    as UnprocessedItems and is resent with jittered exponential backoff.
+    """
+    request_items = {RESULTS_TABLE_NAME: [{"PutRequest": {"Item": item}} for item in items]}
+    for attempt in range(RESULT_BATCH_MAX_ATTEMPTS):
+        response = get_dynamodb_resource().batch_write_item(RequestItems=request_items)
+        request_items = response.get("UnprocessedItems") or {}
+        if not request_items:
+            return
+        time.sleep(RESULT_BATCH_BACKOFF_BASE_SECONDS * (2**attempt) + random.random())
 
-    item = {
-        "pk": pk,
-        "sk": sk,
+    unprocessed = sum(len(requests) for requests in request_items.values())
+    raise RuntimeError(
+        f"{unprocessed} result item(s) still unprocessed after "
+        f"{RESULT_BATCH_MAX_ATTEMPTS} BatchWriteItem attempts"
+    )
+
+
+class QueuedResultWriter:
+    """
+    Result writer that buffers items and flushes them as BatchWriteItem calls on
+    result_write_executor.
+
+    The invocation worker only adds each item to the buffer and moves on to the next
+    invoke; every full batch of 25 is written in the background, overlapping with Lambda
+    calls. Items with the same (pk, sk) replace each other in the buffer, as a batch may
+    not contain duplicate keys. Meant to be used from the one worker thread that owns
+    the configuration. Leaving the context flushes the remainder, also on error, waits
+    for all batches, and re-raises the first write error.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[str, str], dict[str, Any]] = {}
+        self._futures = []
+
+    def __enter__(self) -> "QueuedResultWriter":
+        return self
+
+    def put_item(self, Item: dict[str, Any]) -> None:
+        """Buffer one item; same signature as the boto3 batch writer."""
+        self._pending[(Item["pk"], Item["sk"])] = Item
+        if len(self._pending) >= RESULT_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._pending:
+            batch = list(self._pending.values())
+            self._pending = {}
+            self._futures.append(result_write_executor.submit(write_result_batch, batch))
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._flush()
+        wait(self._futures)
+        if exc_type is None:
+            for future in self._futures:
+                future.result()
+
+
+def build_result_base_item(
+    function_info: dict[str, str], memory_mb: int, config_id: str, test_run_id: str
+) -> dict[str, Any]:
+    """
+    Build the result-item attributes shared by every invocation of one configuration.
+
+    Computed once per configuration and passed to store_result, which only adds the
+    per-invocation fields.
+    """
+    return {
+        "pk": f"{test_run_id}#{config_id}",
         "itemType": "result",
         "testRunId": test_run_id,
-        "timestamp": timestamp,
         "configId": config_id,
         "runtime": function_info["runtime"],
         "architecture": function_info["architecture"],
         "workloadType": function_info["workloadType"],
         "memorySizeMB": memory_mb,
+        "functionName": function_info["name"],
+        "functionVersion": function_info.get("version", "$LATEST"),
+    }
+
+
+def store_result(
+    writer,
+    base_item: dict[str, Any],
+    is_cold_start: bool,
+    invocation_result: dict[str, Any],
+    invocation_number: int,
+) -> None:
+    """
+    Store individual benchmark result in DynamoDB with AWS-reported metrics.
+
+    The item goes through writer: a QueuedResultWriter, or a Table for a direct put.
+    base_item comes from build_result_base_item for this configuration.
+    """
+    invocation_type = "cold" if is_cold_start else "warm"
+
+    sample = {
+        "sk": f"{invocation_type}#{invocation_number}",
+        "timestamp": int(time.time() * 1000),
         "invocationType": invocation_type,
         "invocationNumber": invocation_number,
         "durationMs": to_decimal(invocation_result.get("durationMs")),
         "billedDurationMs": invocation_result.get("billedDurationMs"),
         "maxMemoryUsedMB": invocation_result.get("memoryUsedMB"),
-        "functionName": function_info["name"],
-        "functionVersion": function_info.get("version", "$LATEST"),
         "lambdaRequestId": invocation_result.get("lambdaRequestId", "unknown"),
         "success": invocation_result.get("success", False),
     }
 
     if is_cold_start and invocation_result.get("initDurationMs") is not None:
-        item["initDurationMs"] = to_decimal(invocation_result.get("initDurationMs"))
+        sample["initDurationMs"] = to_decimal(invocation_result.get("initDurationMs"))
 
-    item = {k: v for k, v in item.items() if v is not None}
+    item = {**base_item, **{k: v for k, v in sample.items() if v is not None}}
 
-    table.put_item(Item=item)
+    writer.put_item(Item=item)
+
+
+@dataclass(slots=True)
+class SampleMetrics:
+    """
+    Metric values for one configuration, collected as each invocation completes.
+
+    Only the numbers the aggregate needs are kept, not the full invocation results,
+    in typed arrays rather than lists of boxed floats/ints. Failed invocations are
+    counted but contribute no metrics.
+    """
+
+    success_count: int = 0
+    failed_count: int = 0
+    durations: array.array = field(default_factory=lambda: array.array("d"))
+    billed_durations: array.array = field(default_factory=lambda: array.array("q"))
+    memory_usage: array.array = field(default_factory=lambda: array.array("q"))
+    init_durations: array.array = field(default_factory=lambda: array.array("d"))
+
+    def add(self, invocation_result: dict[str, Any]) -> None:
+        """Record one invocation result."""
+        if not invocation_result.get("success", False):
+            self.failed_count += 1
+            return
+
+        self.success_count += 1
+        if (duration := invocation_result.get("durationMs")) is not None:
+            self.durations.append(duration)
+        if (billed := invocation_result.get("billedDurationMs")) is not None:
+            self.billed_durations.append(billed)
+        if (memory := invocation_result.get("memoryUsedMB")) is not None:
+            self.memory_usage.append(memory)
+        if (init := invocation_result.get("initDurationMs")) is not None:
+            self.init_durations.append(init)
 
 
 def write_aggregate(
+    writer,
     function_info: dict[str, str],
     memory_mb: int,
+    config_id: str,
     invocation_type: str,
-    samples: list[dict[str, Any]],
+    metrics: SampleMetrics,
     test_run_id: str,
 ) -> None:
     """
@@ -605,28 +774,10 @@ def write_aggregate(
     Pre-calculates statistics (mean, median, percentiles) for fast analysis
     without querying individual result items. Only successful samples are used
     for statistical calculations.
-    """
-    dynamodb = get_dynamodb_resource()
-    table = dynamodb.Table(RESULTS_TABLE_NAME)
-    config_id = make_config_id(function_info, memory_mb)
-
-    # Split samples into successful and failed
-    successful_samples = [s for s in samples if s.get("success", False)]
-    failed_count = len(samples) - len(successful_samples)
-    all_successful = failed_count == 0
-
-    # Extract metrics from successful samples only
-    durations = [s["durationMs"] for s in successful_samples if s.get("durationMs") is not None]
-    billed_durations = [
-        s["billedDurationMs"] for s in successful_samples if s.get("billedDurationMs") is not None
-    ]
-    memory_usage = [
-        s["memoryUsedMB"] for s in successful_samples if s.get("memoryUsedMB") is not None
-    ]
-    init_durations = [
-        s["initDurationMs"] for s in successful_samples if s.get("initDurationMs") is not None
-    ]
 
+    Like store_result, the item goes through writer, so aggregates are batched together
+    with the configuration's individual results.
+    """
     timestamp = int(time.time() * 1000)
 
     item = {
@@ -641,18 +792,18 @@ def write_aggregate(
         "workloadType": function_info["workloadType"],
         "memorySizeMB": memory_mb,
         "invocationType": invocation_type,
-        "sampleCount": len(successful_samples),
-        "allSuccessful": all_successful,
-        "failedCount": failed_count,
-        "durationMsStats": map_decimal(calculate_statistics(durations)),
-        "billedDurationMsStats": map_decimal(calculate_statistics(billed_durations)),
-        "memoryMBStats": map_decimal(calculate_statistics(memory_usage)),
+        "sampleCount": metrics.success_count,
+        "allSuccessful": metrics.failed_count == 0,
+        "failedCount": metrics.failed_count,
+        "durationMsStats": map_decimal(calculate_statistics(metrics.durations)),
+        "billedDurationMsStats": map_decimal(calculate_statistics(metrics.billed_durations)),
+        "memoryMBStats": map_decimal(calculate_statistics(metrics.memory_usage)),
     }
 
-    if invocation_type == "cold" and init_durations:
-        item["initDurationMsStats"] = map_decimal(calculate_statistics(init_durations))
+    if invocation_type == "cold" and metrics.init_durations:
+        item["initDurationMsStats"] = map_decimal(calculate_statistics(metrics.init_durations))
 
-    table.put_item(Item=item)
+    writer.put_item(Item=item)
 
 
 def create_test_run_item(
@@ -669,8 +820,7 @@ def create_test_run_item(
 
     Stores execution metadata and complete test matrix for analysis scripts.
     """
-    dynamodb = get_dynamodb_resource()
-    table = dynamodb.Table(RESULTS_TABLE_NAME)
+    table = get_results_table()
     timestamp = int(time.time() * 1000)
     total_invocations = total_configurations * (cold_starts_per_config + warm_starts_per_config)
 
@@ -683,7 +833,7 @@ def create_test_run_item(
         "status": "in_progress",
         "startTime": timestamp,
         "mode": mode,
-        "region": AWS_REGION,
+        "region": get_aws_region(),
         "totalConfigurations": total_configurations,
         "totalInvocations": total_invocations,
         "coldStartsPerConfig": cold_starts_per_config,
@@ -702,8 +852,7 @@ def update_test_run_status(
     test_run_id: str, status: str, failed_invocations: int = 0, error_summary: str | None = None
 ) -> None:
     """Update test-run item with final status and completion time."""
-    dynamodb = get_dynamodb_resource()
-    table = dynamodb.Table(RESULTS_TABLE_NAME)
+    table = get_results_table()
     end_time = int(time.time() * 1000)
 
     update_expr = "SET #status = :status, endTime = :end_time, failedInvocations = :failed"
@@ -728,44 +877,59 @@ def update_test_run_status(
 
 
 def benchmark_function_single_memory(
-    function_info: dict[str, str], memory_mb: int, config: BenchmarkConfig, test_run_id: str
+    function_info: dict[str, str],
+    memory_mb: int,
+    config: BenchmarkConfig,
+    test_run_id: str,
+    current_memory: int | None = None,
 ) -> tuple[str, int, bool, str | None]:
     """
     Run complete benchmark for a single function at a specific memory configuration.
 
+    current_memory is the function's memory before this run, if the caller knows it;
+    None makes the first cold start read it from Lambda.
+
     Returns:
         Tuple of (function_name, memory_mb, success, error_message)
     """
     function_name = function_info["name"]
     workload_type = function_info["workloadType"]
+    config_id = make_config_id(function_info, memory_mb)
+    base_item = build_result_base_item(function_info, memory_mb, config_id, test_run_id)
 
     try:
         log.info(f"  {function_name} @ {memory_mb}MB - Starting")
 
-        force_cold_start(function_name, memory_mb)
-
-        cold_samples = []
-        for i in range(config.cold_starts_per_config):
-            result = invoke_function(function_name, workload_type, memory_mb)
-            cold_samples.append(result)
-            store_result(
-                function_info, memory_mb, True, result, test_run_id, invocation_number=i + 1
-            )
+        force_cold_start(function_name, memory_mb, current_memory)
 
-            if i < config.cold_starts_per_config - 1:
-                force_cold_start(function_name, memory_mb)
+        # Results for this configuration share one queued batch writer; samples already
+        # queued are still written if a later invocation raises
+        with QueuedResultWriter() as results:
+            cold_metrics = SampleMetrics()
+            for i in range(config.cold_starts_per_config):
+                result = invoke_function(function_name, workload_type)
+                cold_metrics.add(result)
+                store_result(results, base_item, True, result, invocation_number=i + 1)
 
-        write_aggregate(function_info, memory_mb, "cold", cold_samples, test_run_id)
+                if i < config.cold_starts_per_config - 1:
+                    # The previous cold start left the function at memory_mb
+                    force_cold_start(function_name, memory_mb, current_memory=memory_mb)
 
-        warm_samples = []
-        for i in range(config.warm_starts_per_config):
-            result = invoke_function(function_name, workload_type, memory_mb)
-            warm_samples.append(result)
-            store_result(
-                function_info, memory_mb, False, result, test_run_id, invocation_number=i + 1
+            write_aggregate(
+                results, function_info, memory_mb, config_id, "cold", cold_metrics, test_run_id
             )
 
-        write_aggregate(function_info, memory_mb, "warm", warm_samples, test_run_id)
+            # Warm invocations stay sequential: concurrent invokes would each need their own
+            # execution environment, so all but one would be cold starts
+            warm_metrics = SampleMetrics()
+            for i in range(config.warm_starts_per_config):
+                result = invoke_function(function_name, workload_type)
+                warm_metrics.add(result)
+                store_result(results, base_item, False, result, invocation_number=i + 1)
+
+            write_aggregate(
+                results, function_info, memory_mb, config_id, "warm", warm_metrics, test_run_id
+            )
 
         log.info(f"  {function_name} @ {memory_mb}MB - ✓ Complete")
         return (function_name, memory_mb, True, None)
@@ -783,14 +947,23 @@ def benchmark_function_all_memory(
     Run benchmarks for a single function across ALL memory configurations.
 
     Tests all memory configurations sequentially to avoid ResourceConflictException
-    from concurrent Lambda configuration updates.
+    from concurrent Lambda configuration updates. Invocations cannot overlap across
+    memory sizes either: memory is a property of the function's single $LATEST
+    configuration, so any reconfiguration for one memory size would change (and
+    cold-start) the function another memory size is still sampling.
     """
     memory_configs = get_memory_configs_for_workload(function_info["workloadType"], config)
     results = []
 
+    # This worker is the only one updating the function, so the memory it last applied is
+    # current; discovery supplies the starting value. After a failure the state is unknown.
+    current_memory = function_info.get("currentMemoryMB")
     for memory_mb in memory_configs:
-        result = benchmark_function_single_memory(function_info, memory_mb, config, test_run_id)
+        result = benchmark_function_single_memory(
+            function_info, memory_mb, config, test_run_id, current_memory
+        )
         results.append(result)
+        current_memory = memory_mb if result[2] else None
 
     return results
 
@@ -830,11 +1003,16 @@ def run_benchmark(
 
     functions = get_deployed_functions(name_filter)
 
-    test_configs = []
-    for func in functions:
-        memory_configs = get_memory_configs_for_workload(func["workloadType"], config)
-        for memory_mb in memory_configs:
-            test_configs.append((func, memory_mb))
+    # Memory configs depend only on workload type; resolve each once for the whole run
+    memory_configs_by_workload = {
+        workload: get_memory_configs_for_workload(workload, config)
+        for workload in {func["workloadType"] for func in functions}
+    }
+    test_configs = [
+        (func, memory_mb)
+        for func in functions
+        for memory_mb in memory_configs_by_workload[func["workloadType"]]
+    ]
 
     total_tests = len(test_configs)
     log.info(f"Total test configurations: {total_tests}")
@@ -863,11 +1041,12 @@ def run_benchmark(
     log.info("✓")
     log.info("")
 
+    # Progress is tracked in memory only; the test-run item is written once here at the
+    # start and once at the end, so there are no per-configuration writes to its key
     completed = 0
     failed = 0
     start_time = time.time()
     aborted = False
-    progress_lock = threading.Lock()
 
     try:
         # Parallelize by FUNCTION to avoid ResourceConflictException
@@ -877,36 +1056,35 @@ def run_benchmark(
                 for func in functions
             }
 
+            # Only this thread touches the counters: workers report through their futures,
+            # so progress tracking needs no lock and never blocks a worker
             for future in as_completed(future_to_function):
                 func = future_to_function[future]
 
                 try:
                     results = future.result()
 
-                    with progress_lock:
-                        for _function_name, _memory_mb, success, _error_msg in results:
-                            if success:
-                                completed += 1
-                            else:
-                                failed += 1
-
-                            elapsed = time.time() - start_time
-                            total_done = completed + failed
-                            if total_done > 0:
-                                avg_time = elapsed / total_done
-                                remaining = (total_tests - total_done) * avg_time
-
-                                log.info(
-                                    f"Progress: {total_done}/{total_tests} ({100 * total_done / total_tests:.1f}%) "
-                                    f"| Completed: {completed} | Failed: {failed} "
-                                    f"| Est. remaining: {remaining / 60:.1f}min"
-                                )
+                    for _function_name, _memory_mb, success, _error_msg in results:
+                        if success:
+                            completed += 1
+                        else:
+                            failed += 1
+
+                        elapsed = time.time() - start_time
+                        total_done = completed + failed
+                        if total_done > 0:
+                            avg_time = elapsed / total_done
+                            remaining = (total_tests - total_done) * avg_time
+
+                            log.info(
+                                f"Progress: {total_done}/{total_tests} ({100 * total_done / total_tests:.1f}%) "
+                                f"| Completed: {completed} | Failed: {failed} "
+                                f"| Est. remaining: {remaining / 60:.1f}min"
+                            )
 
                 except Exception as e:
-                    memory_configs = get_memory_configs_for_workload(func["workloadType"], config)
-                    with progress_lock:
-                        failed += len(memory_configs)
-                        log.error(f"Task failed for {func['name']}: {e}")
+                    failed += len(memory_configs_by_workload[func["workloadType"]])
+                    log.error(f"Task failed for {func['name']}: {e}")
 
     except KeyboardInterrupt:
         log.warning("")
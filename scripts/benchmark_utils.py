@@ -8,6 +8,7 @@ code duplication.
 """
 
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
 # =============================================================================
@@ -99,41 +100,29 @@ AGGREGATE_STATS_FIELDS = {
 # =============================================================================
 
 
-def to_decimal(value: float | int | None) -> Decimal | None:
+@lru_cache(maxsize=4096, typed=True)
+def _decimal_from_number(value: float | int) -> Decimal:
     """
-    Convert numeric value to Decimal for DynamoDB storage.
-
-    Args:
-        value: Numeric value to convert
+    Decimal(str(value)), memoized since durations and memory values repeat across samples.
 
-    Returns:
-        Decimal representation or None if input is None
+    typed=True keeps 1 and 1.0 apart; they hash equal but format differently.
     """
-    if value is None:
-        return None
     return Decimal(str(value))
 
 
-def decimal_to_float(value: Any) -> Any:
+def to_decimal(value: float | int | None) -> Decimal | None:
     """
-    Recursively convert Decimal values to float for display.
-
-    Handles DynamoDB responses that use Decimal for numeric values.
+    Convert numeric value to Decimal for DynamoDB storage.
 
     Args:
-        value: Value to convert (can be dict, list, Decimal, or primitive)
+        value: Numeric value to convert
 
     Returns:
-        Value with all Decimals converted to floats
+        Decimal representation or None if input is None
     """
-    if isinstance(value, dict):
-        return {k: decimal_to_float(v) for k, v in value.items()}
-    elif isinstance(value, list):
-        return [decimal_to_float(v) for v in value]
-    elif isinstance(value, Decimal):
-        return float(value)
-    else:
-        return value
+    if value is None:
+        return None
+    return _decimal_from_number(value)
 
 
 def map_decimal(d: dict[str, float | int | bool]) -> dict[str, Any]:
@@ -154,39 +143,12 @@ def map_decimal(d: dict[str, float | int | bool]) -> dict[str, Any]:
         if isinstance(v, (bool, int)):
             result[k] = v
         elif isinstance(v, (float,)):
-            result[k] = Decimal(str(v))
+            result[k] = _decimal_from_number(v)
         else:
             result[k] = v
     return result
 
 
-# =============================================================================
-# Field Name Helpers
-# =============================================================================
-
-
-def get_field_name(item: dict, preferred: str, fallback: str) -> str | None:
-    """
-    Get field name with fallback for backward compatibility.
-
-    Useful when field names change over time and you need to support
-    reading both old and new formats.
-
-    Args:
-        item: DynamoDB item
-        preferred: Preferred field name (new format)
-        fallback: Fallback field name (old format)
-
-    Returns:
-        Field name to use, or None if neither field exists
-    """
-    if preferred in item:
-        return preferred
-    if fallback in item:
-        return fallback
-    return None
-
-
 # =============================================================================
 # Cost Calculation
 # =============================================================================
@@ -334,37 +296,40 @@ def calculate_statistics(values: list[float], remove_outliers: bool = True) -> d
     if not values:
         return {}
 
-    import statistics
+    import math
     from collections import Counter
 
+    # Sort once; min, max, median and percentiles all read from the sorted list
     sorted_values = sorted(values)
     n = len(sorted_values)
+    trimmed = remove_outliers and n >= 5
 
-    original_min = min(values)
-    original_max = max(values)
+    sorted_calc = sorted_values[1:-1] if trimmed else sorted_values
 
-    calc_values = sorted_values[1:-1] if remove_outliers and n >= 5 else values
-
-    rounded_values = [round(v, 2) for v in calc_values]
-    mode_value = (
-        Counter(rounded_values).most_common(1)[0][0] if rounded_values else sorted_values[0]
-    )
+    # Untrimmed mode keeps input order so ties resolve as before
+    rounded_values = [round(v, 2) for v in (sorted_calc if trimmed else values)]
+    mode_value = Counter(rounded_values).most_common(1)[0][0]
 
-    sorted_calc = sorted(calc_values)
+    # Float mean/stdev over the already-sorted values; statistics.stdev's exact rational
+    # arithmetic gives the same result at 2 decimal places for far more work per sample
+    k = len(sorted_calc)
+    mean = math.fsum(sorted_calc) / k
+    stdev = math.sqrt(math.fsum((v - mean) ** 2 for v in sorted_calc) / (k - 1)) if k > 1 else 0.0
+    median = round(percentile(sorted_calc, 0.50), 2)
 
     return {
-        "mean": round(statistics.mean(calc_values), 2),
-        "median": round(statistics.median(calc_values), 2),
+        "mean": round(mean, 2),
+        "median": median,
         "mode": mode_value,
-        "min": round(original_min, 2),
-        "max": round(original_max, 2),
-        "stdev": round(statistics.stdev(calc_values), 2) if len(calc_values) > 1 else 0.0,
-        "p50": round(percentile(sorted_calc, 0.50), 2),
+        "min": round(sorted_values[0], 2),
+        "max": round(sorted_values[-1], 2),
+        "stdev": round(stdev, 2),
+        "p50": median,
         "p90": round(percentile(sorted_calc, 0.90), 2),
         "p95": round(percentile(sorted_calc, 0.95), 2),
         "p99": round(percentile(sorted_calc, 0.99), 2),
         "sampleCount": n,
-        "outliersRemoved": remove_outliers and n >= 5,
+        "outliersRemoved": trimmed,
     }
 
 
@@ -373,6 +338,14 @@ def calculate_statistics(values: list[float], remove_outliers: bool = True) -> d
 # =============================================================================
 
 
+# Display names for the known workloads; built once rather than on every chart title
+WORKLOAD_DISPLAY_NAMES = {
+    "cpu-intensive": "CPU Intensive Workload",
+    "memory-intensive": "Memory Intensive Workload",
+    "light": "Light Workload",
+}
+
+
 def format_workload_name(workload: str) -> str:
     """
     Format workload name for display with proper capitalization.
@@ -383,12 +356,11 @@ def format_workload_name(workload: str) -> str:
     Returns:
         Formatted name (e.g., "CPU Intensive Workload")
     """
-    name_map = {
-        "cpu-intensive": "CPU Intensive Workload",
-        "memory-intensive": "Memory Intensive Workload",
-        "light": "Light Workload",
-    }
-    return name_map.get(workload, workload.replace("-", " ").title() + " Workload")
+    name = WORKLOAD_DISPLAY_NAMES.get(workload)
+    if name is None:
+        # Only unknown workloads pay for the string formatting
+        name = workload.replace("-", " ").title() + " Workload"
+    return name
 
 
 # =============================================================================
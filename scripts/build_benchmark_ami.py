@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Benchmark Runner AMI Builder
+
+Bakes the EC2 benchmark runner's setup (system packages, uv, repository clone, Python
+dependencies) into a private AMI, so run_benchmark_on_ec2.py can skip several minutes of
+installation on every launch.
+
+Steps:
+- Launches a t4g.micro builder from the latest Amazon Linux 2023 ARM64 AMI
+- Runs the same setup the runner's user data performs, then stops itself
+- Creates an AMI tagged Name=lambda-benchmark-runner and Version=<commit SHA> and terminates
+  the builder
+
+run_benchmark_on_ec2.py uses the newest AMI with that tag when one exists; runners still
+`git pull` and `uv sync` on boot, so an older AMI only costs a slower update. Rebuild after
+dependency changes to keep launches fast.
+
+Usage:
+    python scripts/build_benchmark_ami.py
+    python scripts/build_benchmark_ami.py --region us-west-2
+"""
+
+import argparse
+import logging
+import subprocess
+import sys
+import time
+
+import boto3
+from botocore.exceptions import ClientError, WaiterError
+from run_benchmark_on_ec2 import (
+    FRESH_SETUP_SCRIPT,
+    INSTANCE_TYPE,
+    PREBUILT_AMI_TAG,
+    REPOSITORY_URL,
+    create_security_group,
+    get_default_vpc_id,
+    get_latest_al2023_ami,
+)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+)
+log = logging.getLogger(__name__)
+
+BUILDER_NAME_TAG = "LambdaBenchmarkAmiBuilder"
+BUILDER_CONSOLE_TAIL_LINES = 40
+
+# Setup takes 3-6 minutes; allow up to 30 before giving up on the builder stopping itself
+BUILDER_STOPPED_WAITER_CONFIG = {"Delay": 15, "MaxAttempts": 120}
+IMAGE_AVAILABLE_WAITER_CONFIG = {"Delay": 15, "MaxAttempts": 80}
+
+# The builder stops (not terminates) itself once setup succeeds, so its volume can be imaged.
+# If the branch moved after the SHA was resolved, it resets to that SHA so the Version tag
+# matches; reset (not checkout) keeps the branch for the runner's git pull. Output is left to
+# cloud-init, which copies it to the serial console so a failed build can be read remotely.
+BUILDER_USER_DATA_TEMPLATE = """#!/bin/bash
+set -e
+
+echo "Building Lambda benchmark runner image..."
+
+{setup}
+if [ "$(git rev-parse HEAD)" != "{commit_sha}" ]; then
+    git fetch --depth 1 origin {commit_sha}
+    git reset --hard {commit_sha}
+    /root/.local/bin/uv sync --all-extras
+fi
+echo "Runner setup baked at {commit_sha}. Stopping for imaging."
+shutdown -h now
+"""
+
+
+def get_repository_head() -> str:
+    """Get the commit SHA the builder's clone of the default branch will check out."""
+    output = subprocess.run(
+        ["git", "ls-remote", REPOSITORY_URL, "HEAD"], capture_output=True, text=True, check=True
+    ).stdout
+    return output.split()[0]
+
+
+def launch_builder(ec2_client, ami_id: str, security_group_id: str, commit_sha: str) -> str:
+    """Launch the builder instance and return its ID."""
+    log.info(f"Launching {INSTANCE_TYPE} builder instance...")
+
+    user_data = BUILDER_USER_DATA_TEMPLATE.format_map(
+        {"setup": FRESH_SETUP_SCRIPT, "commit_sha": commit_sha}
+    )
+
+    response = ec2_client.run_instances(
+        ImageId=ami_id,
+        InstanceType=INSTANCE_TYPE,
+        MinCount=1,
+        MaxCount=1,
+        SecurityGroupIds=[security_group_id],
+        UserData=user_data,
+        InstanceInitiatedShutdownBehavior="stop",
+        TagSpecifications=[
+            {
+                "ResourceType": "instance",
+                "Tags": [
+                    {"Key": "Name", "Value": BUILDER_NAME_TAG},
+                    {"Key": "Purpose", "Value": "Lambda Benchmark Runner AMI build"},
+                ],
+            }
+        ],
+    )
+
+    instance_id = response["Instances"][0]["InstanceId"]
+    log.info(f"Launched builder: {instance_id}")
+    return instance_id
+
+
+def create_runner_image(ec2_client, instance_id: str, commit_sha: str) -> str:
+    """Create a tagged runner AMI from the stopped builder and wait until it is available."""
+    image_name = f"{PREBUILT_AMI_TAG}-{time.strftime('%Y%m%d-%H%M%S')}"
+    log.info(f"Creating AMI: {image_name}")
+
+    response = ec2_client.create_image(
+        InstanceId=instance_id,
+        Name=image_name,
+        Description="Lambda benchmark runner with dependencies preinstalled",
+        TagSpecifications=[
+            {
+                "ResourceType": "image",
+                "Tags": [
+                    {"Key": "Name", "Value": PREBUILT_AMI_TAG},
+                    {"Key": "Version", "Value": commit_sha},
+                    {"Key": "BuiltAt", "Value": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())},
+                ],
+            }
+        ],
+    )
+    image_id = response["ImageId"]
+
+    log.info("Waiting for AMI to become available...")
+    ec2_client.get_waiter("image_available").wait(
+        ImageIds=[image_id], WaiterConfig=IMAGE_AVAILABLE_WAITER_CONFIG
+    )
+    return image_id
+
+
+def log_builder_console_tail(ec2_client, instance_id: str) -> None:
+    """Log the end of the builder's console output, which includes its setup output."""
+    try:
+        response = ec2_client.get_console_output(InstanceId=instance_id, Latest=True)
+    except ClientError as e:
+        log.error(f"Could not read builder console output: {e}")
+        return
+
+    output = response.get("Output", "")
+    if not output:
+        log.error("Builder console output is empty")
+        return
+    tail = "\n".join(output.splitlines()[-BUILDER_CONSOLE_TAIL_LINES:])
+    log.error(f"Builder console output (last {BUILDER_CONSOLE_TAIL_LINES} lines):\n{tail}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build a prebuilt AMI for the EC2 benchmark runner",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--region",
+        default="us-east-2",
+        help="AWS region (default: us-east-2)",
+    )
+
+    args = parser.parse_args()
+
+    session = boto3.Session(region_name=args.region)
+    ec2_client = session.client("ec2")
+    sts_client = session.client("sts")
+    ssm_client = session.client("ssm")
+
+    account_id = sts_client.get_caller_identity()["Account"]
+    log.info(f"AWS Account: {account_id}, Region: {args.region}")
+
+    vpc_id = get_default_vpc_id(ec2_client, account_id, args.region)
+    base_ami_id = get_latest_al2023_ami(ssm_client, args.region)
+    security_group_id = create_security_group(ec2_client, vpc_id)
+
+    commit_sha = get_repository_head()
+    log.info(f"Building from commit: {commit_sha}")
+
+    instance_id = launch_builder(ec2_client, base_ami_id, security_group_id, commit_sha)
+
+    try:
+        log.info("Waiting for builder to finish setup and stop (3-6 minutes)...")
+        ec2_client.get_waiter("instance_stopped").wait(
+            InstanceIds=[instance_id], WaiterConfig=BUILDER_STOPPED_WAITER_CONFIG
+        )
+        image_id = create_runner_image(ec2_client, instance_id, commit_sha)
+    except (ClientError, WaiterError) as e:
+        log.error(f"AMI build failed: {e}")
+        # The builder is terminated below and has no instance profile for SSM, so read its
+        # setup output from the console now
+        log_builder_console_tail(ec2_client, instance_id)
+        sys.exit(1)
+    finally:
+        log.info(f"Terminating builder: {instance_id}")
+        ec2_client.terminate_instances(InstanceIds=[instance_id])
+
+    print("\n" + "=" * 80)
+    print("BENCHMARK RUNNER AMI READY")
+    print("=" * 80)
+    print(f"AMI ID:  {image_id}")
+    print(f"Version: {commit_sha}")
+    print(f"Region:  {args.region}")
+    print("\nrun_benchmark_on_ec2.py will use this AMI automatically.")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    main()
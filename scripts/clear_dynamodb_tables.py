@@ -7,6 +7,11 @@ This script clears:
 - BenchmarkTestData (test data for Light workload)
 """
 
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
 from botocore.config import Config
 
@@ -15,56 +20,85 @@ boto_config = Config(
     retries={"max_attempts": 10, "mode": "standard"},
 )
 
-dynamodb = boto3.resource("dynamodb", config=boto_config)
+# Parallel scan segments; each segment deletes what it finds on its own thread
+SCAN_SEGMENTS = 16
+BATCH_SIZE = 25  # BatchWriteItem maximum
+BATCH_MAX_ATTEMPTS = 8
+BATCH_BACKOFF_BASE_SECONDS = 0.05  # Doubles per attempt, plus up to 1s of jitter
+
+
+def delete_batch(dynamodb, table_name: str, keys: list[dict]) -> None:
+    """
+    Delete up to 25 items with one BatchWriteItem call.
+
+    Throttled deletes come back as UnprocessedItems and are resent with jittered
+    exponential backoff.
+    """
+    request_items = {table_name: [{"DeleteRequest": {"Key": key}} for key in keys]}
+    for attempt in range(BATCH_MAX_ATTEMPTS):
+        response = dynamodb.batch_write_item(RequestItems=request_items)
+        request_items = response.get("UnprocessedItems") or {}
+        if not request_items:
+            return
+        time.sleep(BATCH_BACKOFF_BASE_SECONDS * (2**attempt) + random.random())
+
+    raise RuntimeError(f"Deletes still unprocessed after {BATCH_MAX_ATTEMPTS} attempts")
 
 
 def clear_table(table_name: str, key_attrs: list[str]) -> None:
     """
     Clear all items from a DynamoDB table.
 
+    Runs a parallel scan with SCAN_SEGMENTS segments. Each segment's thread deletes the
+    keys from every page it scans in 25-item batches, so scanning and deleting overlap
+    across segments.
+
     Args:
         table_name: Name of the table to clear
         key_attrs: List of key attribute names (e.g., ['pk', 'sk'] or ['itemId'])
     """
-    table = dynamodb.Table(table_name)
-
     print(f"\nClearing table: {table_name}")
     print(f"Key attributes: {key_attrs}")
 
-    response = table.scan(ProjectionExpression=",".join(key_attrs))
-    items = response.get("Items", [])
-
-    while "LastEvaluatedKey" in response:
-        response = table.scan(
-            ProjectionExpression=",".join(key_attrs),
-            ExclusiveStartKey=response["LastEvaluatedKey"],
-        )
-        items.extend(response.get("Items", []))
-
-    total_items = len(items)
-    print(f"Found {total_items} items to delete")
-
-    if total_items == 0:
+    deleted = 0
+    progress_lock = threading.Lock()
+
+    def clear_segment(segment: int) -> None:
+        nonlocal deleted
+        # boto3 resources are not thread-safe, so each segment gets its own
+        dynamodb = boto3.resource("dynamodb", config=boto_config)
+        table = dynamodb.Table(table_name)
+        scan_kwargs = {
+            "ProjectionExpression": ",".join(key_attrs),
+            "Segment": segment,
+            "TotalSegments": SCAN_SEGMENTS,
+        }
+
+        while True:
+            response = table.scan(**scan_kwargs)
+            keys = [{attr: item[attr] for attr in key_attrs} for item in response.get("Items", [])]
+
+            for i in range(0, len(keys), BATCH_SIZE):
+                batch = keys[i : i + BATCH_SIZE]
+                delete_batch(dynamodb, table_name, batch)
+                with progress_lock:
+                    deleted += len(batch)
+                    if deleted % 1000 < len(batch):
+                        print(f"  Deleted {deleted} items...")
+
+            if "LastEvaluatedKey" not in response:
+                return
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    with ThreadPoolExecutor(max_workers=SCAN_SEGMENTS) as executor:
+        # list() re-raises the first segment failure
+        list(executor.map(clear_segment, range(SCAN_SEGMENTS)))
+
+    if deleted == 0:
         print("Table is already empty")
         return
 
-    deleted = 0
-    batch_size = 25
-
-    for i in range(0, len(items), batch_size):
-        batch = items[i : i + batch_size]
-
-        with table.batch_writer() as writer:
-            for item in batch:
-                # Extract only the key attributes
-                key = {attr: item[attr] for attr in key_attrs}
-                writer.delete_item(Key=key)
-                deleted += 1
-
-        if deleted % 100 == 0 or deleted == total_items:
-            print(f"  Deleted {deleted}/{total_items} items ({100 * deleted / total_items:.1f}%)")
-
-    print(f"✓ Successfully deleted all {total_items} items from {table_name}")
+    print(f"✓ Successfully deleted all {deleted} items from {table_name}")
 
 
 def main() -> None:
@@ -10,25 +10,30 @@ Features:
 - Installs dependencies and runs benchmark
 - Auto-terminates instance after completion
 - Optional S3 upload for results
-- Uses t4g.micro (ARM Graviton) for cost efficiency (~$0.20/day)
+- Uses ARM Graviton t4g instances for cost efficiency (t4g.small: ~$0.40/day)
 
 Prerequisites:
 - LambdaBenchmarkStack must be deployed in the target region
 - Repository must be public OR EC2 instance must have git credentials configured
-- IAM permissions to create EC2 instances, IAM roles, and security groups
+- IAM permissions to create EC2 instances, IAM roles, security groups, and CloudWatch log groups
 
 Usage:
     python scripts/run_benchmark_on_ec2.py --mode balanced
     python scripts/run_benchmark_on_ec2.py --mode production --keep-alive
     python scripts/run_benchmark_on_ec2.py --mode test --s3-bucket my-results-bucket
+    python scripts/run_benchmark_on_ec2.py --mode production --instance-type c7g.large
 """
 
 import argparse
-import base64
+import hashlib
 import json
 import logging
+import string
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
 
 import boto3
@@ -41,45 +46,143 @@ log = logging.getLogger(__name__)
 
 # Configuration
 INSTANCE_TYPE = "t4g.micro"  # ARM Graviton, ~$0.0084/hour
-AMI_OWNER = "amazon"  # Amazon Linux 2023
-AMI_NAME_FILTER = "al2023-ami-2023.*-arm64"  # Latest AL2023 ARM64
+# Multi-hour runs outlast a t4g.micro's CPU credits (10% baseline); t4g.small has a 20% baseline
+INSTANCE_TYPE_BY_MODE = {
+    "test": INSTANCE_TYPE,
+    "balanced": "t4g.small",  # ~$0.0168/hour
+    "production": "t4g.small",
+}
+# Public SSM parameter AWS keeps pointed at the latest Amazon Linux 2023 ARM64 AMI
+AMI_SSM_PARAMETER = "/aws/service/ami-amazon-linux-latest/al2023-ami-kernel-default-arm64"
+# Tag on runner AMIs built by build_benchmark_ami.py; preferred over stock AL2023 when present
+PREBUILT_AMI_TAG = "lambda-benchmark-runner"
+# Prebuilt AMIs get no package updates at boot; older than this, rebuild for security fixes
+PREBUILT_AMI_MAX_AGE_DAYS = 30
 SECURITY_GROUP_NAME = "lambda-benchmark-runner"
 IAM_ROLE_NAME = "LambdaBenchmarkRunnerRole"
 IAM_POLICY_NAME = "LambdaBenchmarkRunnerPolicy"
+STACK_PROJECT_TAG = "LambdaARMvsx86Benchmark"  # Project tag set in cdk/bin/cdk.ts
+# Instance profile tag recording the SHA-256 of the inline policy last applied to the role
+POLICY_HASH_TAG = "PolicySha256"
 INSTANCE_NAME_TAG = "LambdaBenchmarkRunner"
+REPOSITORY_URL = "https://github.com/cebert/aws-lambda-performance-benchmarks.git"
+LOG_GROUP_NAME = "/aws/ec2/benchmark-runner"
+LOG_RETENTION_DAYS = 30
+RUNNER_LOG_FILE = "/var/log/benchmark.log"
 
+# RunInstances retries while a newly created instance profile propagates through IAM
+LAUNCH_MAX_ATTEMPTS = 8
+LAUNCH_BACKOFF_MAX_SECONDS = 8  # 1s, 2s, 4s, then 8s per attempt
 
-def get_latest_al2023_ami(ec2_client) -> str:
-    """Get the latest Amazon Linux 2023 ARM64 AMI ID."""
-    log.info("Finding latest Amazon Linux 2023 ARM64 AMI...")
+# A t4g instance is usually running in ~20s; poll every 5s instead of the waiter's 15s default
+INSTANCE_RUNNING_WAITER_CONFIG = {"Delay": 5, "MaxAttempts": 60}
 
+# Local cache for launch-time lookups that rarely change
+CACHE_FILE = Path.home() / ".cache" / "lambda-bench" / "meta.json"
+VPC_CACHE_TTL_SECONDS = 30 * 24 * 3600
+AMI_CACHE_TTL_SECONDS = 24 * 3600
+_cache_lock = threading.Lock()  # Setup lookups run concurrently and share the cache file
+
+
+def _cached(key: str, ttl_seconds: float, fetch):
+    """
+    Return the cached value for key if younger than ttl_seconds, else fetch and store it.
+
+    The cache is best effort: an unreadable or unwritable cache file just means a fetch.
+    The fetch itself runs outside the lock so concurrent lookups do not wait on each other.
+    """
+    with _cache_lock:
+        try:
+            entry = json.loads(CACHE_FILE.read_text()).get(key)
+        except (OSError, ValueError):
+            entry = None
+    if entry and time.time() - entry["storedAt"] < ttl_seconds:
+        return entry["value"]
+
+    value = fetch()
+    with _cache_lock:
+        try:
+            cache = json.loads(CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            cache = {}
+        cache[key] = {"storedAt": time.time(), "value": value}
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CACHE_FILE.write_text(json.dumps(cache, indent=2))
+        except OSError as e:
+            log.debug(f"Could not write cache file {CACHE_FILE}: {e}")
+    return value
+
+
+def get_latest_al2023_ami(ssm_client, region: str) -> str:
+    """Get the latest Amazon Linux 2023 ARM64 AMI ID (cached for a day per region)."""
+
+    def fetch() -> str:
+        log.info("Finding latest Amazon Linux 2023 ARM64 AMI...")
+        try:
+            return ssm_client.get_parameter(Name=AMI_SSM_PARAMETER)["Parameter"]["Value"]
+        except ClientError as e:
+            log.error(f"No Amazon Linux 2023 ARM64 AMI found: {e}")
+            sys.exit(1)
+
+    ami_id = _cached(f"ami:{region}", AMI_CACHE_TTL_SECONDS, fetch)
+    log.info(f"Using AMI: {ami_id}")
+
+    return ami_id
+
+
+def find_prebuilt_ami(ec2_client) -> str | None:
+    """Get the newest runner AMI built by build_benchmark_ami.py, if any."""
     response = ec2_client.describe_images(
-        Owners=[AMI_OWNER],
+        Owners=["self"],
         Filters=[
-            {"Name": "name", "Values": [AMI_NAME_FILTER]},
+            {"Name": "tag:Name", "Values": [PREBUILT_AMI_TAG]},
             {"Name": "state", "Values": ["available"]},
-            {"Name": "architecture", "Values": ["arm64"]},
         ],
     )
-
     if not response["Images"]:
-        log.error("No Amazon Linux 2023 ARM64 AMI found")
-        sys.exit(1)
+        return None
 
-    # Sort by creation date and get the latest
-    latest_ami = sorted(response["Images"], key=lambda x: x["CreationDate"], reverse=True)[0]
-    ami_id = latest_ami["ImageId"]
-    log.info(f"Using AMI: {ami_id} ({latest_ami['Name']})")
+    latest = max(response["Images"], key=lambda image: image["CreationDate"])
+    log.info(f"Using prebuilt runner AMI: {latest['ImageId']} ({latest['Name']})")
 
-    return ami_id
+    age_days = (datetime.now(UTC) - datetime.fromisoformat(latest["CreationDate"])).days
+    if age_days > PREBUILT_AMI_MAX_AGE_DAYS:
+        log.warning(
+            f"Prebuilt runner AMI is {age_days} days old and missing recent package updates; "
+            "rebuild it with scripts/build_benchmark_ami.py"
+        )
+    return latest["ImageId"]
 
 
-def create_iam_role(iam_client, region: str, account_id: str) -> str:
-    """Create IAM role with instance profile for EC2 benchmark runner."""
-    log.info(f"Creating IAM role: {IAM_ROLE_NAME}")
+def get_runner_ami(ec2_client, ssm_client, region: str) -> tuple[str, bool]:
+    """
+    Get the AMI to launch the runner from.
+
+    Returns (ami_id, prebuilt): a prebuilt runner AMI when one exists, else stock AL2023.
+    """
+    prebuilt_ami = find_prebuilt_ami(ec2_client)
+    if prebuilt_ami:
+        return prebuilt_ami, True
+    return get_latest_al2023_ami(ssm_client, region), False
 
-    # Trust policy for EC2
-    trust_policy = {
+
+def get_default_vpc_id(ec2_client, account_id: str, region: str) -> str:
+    """Get the default VPC ID (cached per account and region)."""
+
+    def fetch() -> str:
+        vpcs = ec2_client.describe_vpcs(Filters=[{"Name": "is-default", "Values": ["true"]}])
+        if not vpcs["Vpcs"]:
+            log.error("No default VPC found. Please create one or specify a VPC ID.")
+            sys.exit(1)
+        return vpcs["Vpcs"][0]["VpcId"]
+
+    return _cached(f"vpc:{account_id}:{region}", VPC_CACHE_TTL_SECONDS, fetch)
+
+
+# Trust policy for EC2 (static, so serialized once)
+_TRUST_POLICY_JSON = json.dumps(
+    {
         "Version": "2012-10-17",
         "Statement": [
             {
@@ -89,66 +192,122 @@ def create_iam_role(iam_client, region: str, account_id: str) -> str:
             }
         ],
     }
+)
 
-    # IAM policy with required permissions
-    policy_document = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Effect": "Allow",
-                "Action": [
-                    "lambda:InvokeFunction",
-                    "lambda:GetFunction",
-                    "lambda:UpdateFunctionConfiguration",
-                    "lambda:GetFunctionConfiguration",
-                ],
-                "Resource": f"arn:aws:lambda:{region}:{account_id}:function:*",
-            },
-            {
-                "Effect": "Allow",
-                "Action": [
-                    "dynamodb:PutItem",
-                    "dynamodb:GetItem",
-                    "dynamodb:Query",
-                    "dynamodb:BatchWriteItem",
-                    "dynamodb:UpdateItem",
-                ],
-                "Resource": f"arn:aws:dynamodb:{region}:{account_id}:table/Benchmark*",
-            },
-            {
-                "Effect": "Allow",
-                "Action": [
-                    "cloudformation:DescribeStacks",
-                    "cloudformation:ListStackResources",
-                ],
-                "Resource": f"arn:aws:cloudformation:{region}:{account_id}:stack/LambdaBenchmarkStack/*",
-            },
-            {
-                "Effect": "Allow",
-                "Action": [
-                    "logs:CreateLogGroup",
-                    "logs:CreateLogStream",
-                    "logs:PutLogEvents",
-                ],
-                "Resource": f"arn:aws:logs:{region}:{account_id}:log-group:/aws/ec2/benchmark-runner:*",
-            },
-            {
-                "Effect": "Allow",
-                "Action": [
-                    "s3:PutObject",
-                    "s3:PutObjectAcl",
-                ],
-                "Resource": "arn:aws:s3:::lambda-benchmark-results-*/*",
-            },
-        ],
-    }
+# IAM policy with required permissions, serialized once with ${region} and ${account_id}
+# left to fill per launch. sort_keys makes the filled text the same canonical form
+# _policy_hash produces, so it can be hashed as is.
+_RUNNER_POLICY_TEMPLATE = string.Template(
+    json.dumps(
+        {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Action": [
+                        "lambda:InvokeFunction",
+                        "lambda:GetFunction",
+                        "lambda:UpdateFunctionConfiguration",
+                        "lambda:GetFunctionConfiguration",
+                    ],
+                    "Resource": "arn:aws:lambda:${region}:${account_id}:function:*",
+                    # Only functions tagged by LambdaBenchmarkStack (stack tags propagate)
+                    "Condition": {"StringEquals": {"aws:ResourceTag/Project": STACK_PROJECT_TAG}},
+                },
+                {
+                    "Effect": "Allow",
+                    "Action": [
+                        "dynamodb:PutItem",
+                        "dynamodb:GetItem",
+                        "dynamodb:Query",
+                        "dynamodb:BatchWriteItem",
+                        "dynamodb:UpdateItem",
+                    ],
+                    "Resource": "arn:aws:dynamodb:${region}:${account_id}:table/Benchmark*",
+                },
+                {
+                    "Effect": "Allow",
+                    "Action": [
+                        "cloudformation:DescribeStacks",
+                        "cloudformation:ListStackResources",
+                    ],
+                    "Resource": (
+                        "arn:aws:cloudformation:${region}:${account_id}"
+                        ":stack/LambdaBenchmarkStack/*"
+                    ),
+                },
+                {
+                    "Effect": "Allow",
+                    "Action": [
+                        "logs:CreateLogGroup",
+                        "logs:CreateLogStream",
+                        "logs:PutLogEvents",
+                        "logs:DescribeLogStreams",
+                    ],
+                    "Resource": (
+                        "arn:aws:logs:${region}:${account_id}"
+                        f":log-group:{LOG_GROUP_NAME}:*"
+                    ),
+                },
+                {
+                    "Effect": "Allow",
+                    "Action": [
+                        "s3:PutObject",
+                        "s3:PutObjectAcl",
+                    ],
+                    "Resource": "arn:aws:s3:::lambda-benchmark-results-*/*",
+                },
+            ],
+        },
+        sort_keys=True,
+    )
+)
+
+
+def _policy_hash(policy_document: dict) -> str:
+    """Key-order-independent SHA-256 of an IAM policy document."""
+    return hashlib.sha256(json.dumps(policy_document, sort_keys=True).encode()).hexdigest()
 
+
+def _ensure_role_policy(iam_client, policy_json: str, policy_hash: str) -> None:
+    """Attach the runner's inline policy unless the role already has an identical one."""
     try:
+        existing = iam_client.get_role_policy(RoleName=IAM_ROLE_NAME, PolicyName=IAM_POLICY_NAME)
+        if _policy_hash(existing["PolicyDocument"]) == policy_hash:
+            log.info(f"Inline policy {IAM_POLICY_NAME} is up to date")
+            return
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "NoSuchEntity":
+            raise
+
+    iam_client.put_role_policy(
+        RoleName=IAM_ROLE_NAME,
+        PolicyName=IAM_POLICY_NAME,
+        PolicyDocument=policy_json,
+    )
+    log.info(f"Attached inline policy: {IAM_POLICY_NAME}")
+
+
+def _tag_policy_hash(iam_client, policy_hash: str) -> None:
+    """Record the applied policy's hash on the instance profile for later runs."""
+    iam_client.tag_instance_profile(
+        InstanceProfileName=IAM_ROLE_NAME, Tags=[{"Key": POLICY_HASH_TAG, "Value": policy_hash}]
+    )
+
+
+def create_iam_role(iam_client, region: str, account_id: str) -> str:
+    """Create IAM role with instance profile for EC2 benchmark runner."""
+    log.info(f"Creating IAM role: {IAM_ROLE_NAME}")
+
+    policy_json = _RUNNER_POLICY_TEMPLATE.substitute(region=region, account_id=account_id)
+    policy_hash = hashlib.sha256(policy_json.encode()).hexdigest()
+
+    def create_role_with_policy():
         # Create role
         try:
             iam_client.create_role(
                 RoleName=IAM_ROLE_NAME,
-                AssumeRolePolicyDocument=json.dumps(trust_policy),
+                AssumeRolePolicyDocument=_TRUST_POLICY_JSON,
                 Description="Role for EC2 instance running Lambda benchmarks",
             )
             log.info(f"Created IAM role: {IAM_ROLE_NAME}")
@@ -159,18 +318,9 @@ def create_iam_role(iam_client, region: str, account_id: str) -> str:
                 raise
 
         # Create and attach inline policy
-        try:
-            iam_client.put_role_policy(
-                RoleName=IAM_ROLE_NAME,
-                PolicyName=IAM_POLICY_NAME,
-                PolicyDocument=json.dumps(policy_document),
-            )
-            log.info(f"Attached inline policy: {IAM_POLICY_NAME}")
-        except ClientError as e:
-            if e.response["Error"]["Code"] != "EntityAlreadyExists":
-                raise
+        _ensure_role_policy(iam_client, policy_json, policy_hash)
 
-        # Create instance profile
+    def create_instance_profile():
         try:
             iam_client.create_instance_profile(InstanceProfileName=IAM_ROLE_NAME)
             log.info(f"Created instance profile: {IAM_ROLE_NAME}")
@@ -180,6 +330,39 @@ def create_iam_role(iam_client, region: str, account_id: str) -> str:
             else:
                 raise
 
+    try:
+        # Probe first: on repeat runs the profile already holds the role, so only the policy
+        # needs checking and no create call (or write that restarts propagation) is made
+        try:
+            profile = iam_client.get_instance_profile(InstanceProfileName=IAM_ROLE_NAME)
+            profile_roles = {role["RoleName"] for role in profile["InstanceProfile"]["Roles"]}
+            profile_tags = {
+                tag["Key"]: tag["Value"] for tag in profile["InstanceProfile"].get("Tags", [])
+            }
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "NoSuchEntity":
+                raise
+            profile_roles = None
+            profile_tags = {}
+
+        if profile_roles is not None and IAM_ROLE_NAME in profile_roles:
+            log.info(f"IAM role {IAM_ROLE_NAME} and instance profile already exist")
+            # A matching hash tag on the profile skips even the get_role_policy read
+            if profile_tags.get(POLICY_HASH_TAG) == policy_hash:
+                log.info(f"Inline policy {IAM_POLICY_NAME} is up to date")
+            else:
+                _ensure_role_policy(iam_client, policy_json, policy_hash)
+                _tag_policy_hash(iam_client, policy_hash)
+            return IAM_ROLE_NAME
+
+        # The role (then its policy) and the instance profile are independent; only
+        # add_role_to_instance_profile needs both
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            role_future = executor.submit(create_role_with_policy)
+            if profile_roles is None:
+                executor.submit(create_instance_profile).result()
+            role_future.result()
+
         # Add role to instance profile
         try:
             iam_client.add_role_to_instance_profile(
@@ -190,10 +373,9 @@ def create_iam_role(iam_client, region: str, account_id: str) -> str:
             if e.response["Error"]["Code"] != "LimitExceeded":
                 raise
 
-        # Wait for instance profile to be ready
-        log.info("Waiting for instance profile to propagate...")
-        time.sleep(10)
+        _tag_policy_hash(iam_client, policy_hash)
 
+        # Propagation of a new instance profile is handled by launch_instance's retry loop
         return IAM_ROLE_NAME
 
     except ClientError as e:
@@ -201,89 +383,150 @@ def create_iam_role(iam_client, region: str, account_id: str) -> str:
         sys.exit(1)
 
 
-def create_security_group(ec2_client, vpc_id: str) -> str:
-    """Create security group for benchmark runner (egress-only)."""
-    log.info(f"Creating security group: {SECURITY_GROUP_NAME}")
+def _find_security_group(ec2_client, vpc_id: str) -> str | None:
+    """Return the runner security group's ID in the VPC, or None if it does not exist."""
+    response = ec2_client.describe_security_groups(
+        Filters=[
+            {"Name": "group-name", "Values": [SECURITY_GROUP_NAME]},
+            {"Name": "vpc-id", "Values": [vpc_id]},
+        ]
+    )
+    groups = response["SecurityGroups"]
+    return groups[0]["GroupId"] if groups else None
 
+
+def create_security_group(ec2_client, vpc_id: str) -> str:
+    """Create security group for benchmark runner (egress-only), reusing an existing one."""
     try:
+        # Repeat runs find the group with one read instead of a failing create plus a read
+        sg_id = _find_security_group(ec2_client, vpc_id)
+        if sg_id:
+            log.info(f"Security group {SECURITY_GROUP_NAME} already exists: {sg_id}")
+            return sg_id
+
+        log.info(f"Creating security group: {SECURITY_GROUP_NAME}")
         response = ec2_client.create_security_group(
             GroupName=SECURITY_GROUP_NAME,
             Description="Security group for Lambda benchmark runner (egress only)",
             VpcId=vpc_id,
+            TagSpecifications=[
+                {
+                    "ResourceType": "security-group",
+                    "Tags": [{"Key": "Name", "Value": SECURITY_GROUP_NAME}],
+                }
+            ],
         )
         sg_id = response["GroupId"]
         log.info(f"Created security group: {sg_id}")
 
-        # Add tags
-        ec2_client.create_tags(
-            Resources=[sg_id],
-            Tags=[{"Key": "Name", "Value": SECURITY_GROUP_NAME}],
-        )
-
         return sg_id
 
     except ClientError as e:
+        # Another launch created the group between the probe and the create
         if e.response["Error"]["Code"] == "InvalidGroup.Duplicate":
             log.info(f"Security group {SECURITY_GROUP_NAME} already exists")
-            # Get existing security group ID
-            response = ec2_client.describe_security_groups(
-                Filters=[
-                    {"Name": "group-name", "Values": [SECURITY_GROUP_NAME]},
-                    {"Name": "vpc-id", "Values": [vpc_id]},
-                ]
-            )
-            return response["SecurityGroups"][0]["GroupId"]
+            return _find_security_group(ec2_client, vpc_id)
         else:
             log.error(f"Failed to create security group: {e}")
             sys.exit(1)
 
 
-def get_user_data_script(mode: str, s3_bucket: str | None, region: str, keep_alive: bool) -> str:
-    """Generate user data script for EC2 instance."""
-
-    # Determine shutdown behavior
-    shutdown_cmd = "" if keep_alive else "sudo shutdown -h now"
-
-    # S3 upload command (optional)
-    s3_upload = ""
-    if s3_bucket:
-        s3_upload = f"""
-    # Upload results to S3
-    echo "Uploading results to S3..."
-    TIMESTAMP=$(date +%Y%m%d-%H%M%S)
-    aws s3 cp /tmp/benchmark-results.log s3://{s3_bucket}/benchmark-results-${{TIMESTAMP}}.log || true
-"""
-
-    user_data = f"""#!/bin/bash
-set -e
+def create_log_group(logs_client) -> None:
+    """Create the runner log group the CloudWatch agent ships to, with a retention period."""
+    try:
+        logs_client.create_log_group(logGroupName=LOG_GROUP_NAME)
+        log.info(f"Created log group: {LOG_GROUP_NAME}")
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ResourceAlreadyExistsException":
+            log.error(f"Failed to create log group: {e}")
+            sys.exit(1)
 
-# Configure logging
-exec > >(tee /var/log/benchmark-setup.log)
-exec 2>&1
+    # Idempotent, and also applies the retention to a group created by an older launcher
+    logs_client.put_retention_policy(
+        logGroupName=LOG_GROUP_NAME, retentionInDays=LOG_RETENTION_DAYS
+    )
 
-echo "Starting Lambda benchmark runner setup..."
 
-# Update system
-dnf update -y
+# Full runner setup on a stock AL2023 image; also what build_benchmark_ami.py bakes into an AMI
+FRESH_SETUP_SCRIPT = f"""# Install uv (Python package manager) in the background; it only needs
+# curl and astral.sh, so it overlaps with the dnf install below. There is no full dnf
+# update: the stock AL2023 AMI is refreshed regularly, and prebuilt AMIs get no updates
+# at boot, so find_prebuilt_ami warns when the newest one is stale.
+curl -LsSf https://astral.sh/uv/install.sh | sh &
+UV_INSTALL_PID=$!
 
-# Install dependencies (Git, Python, Node.js)
-dnf install -y git python3.11 python3.11-pip nodejs npm
+# Install dependencies (Git, Python, Node.js, and the CloudWatch agent so AMIs bake it in)
+dnf install -y git python3.11 python3.11-pip nodejs npm amazon-cloudwatch-agent
 
-# Install uv (Python package manager)
-curl -LsSf https://astral.sh/uv/install.sh | sh
+# wait returns the installer's exit status, so set -e still stops on a failed install
+wait $UV_INSTALL_PID
 export PATH="/root/.local/bin:$PATH"
 
 # Clone repository
 cd /root
 echo "Cloning repository..."
-# Note: Using HTTPS clone to avoid SSH key issues
-git clone https://github.com/cebert/aws-lambda-performance-benchmarks.git
+# Note: Using HTTPS clone to avoid SSH key issues; only the default branch's tip is needed
+git clone --depth 1 --single-branch {REPOSITORY_URL}
 cd aws-lambda-performance-benchmarks
 
 # Install Python dependencies
 echo "Installing Python dependencies..."
 /root/.local/bin/uv sync --all-extras
+"""
+
+# Setup on a prebuilt runner AMI: dependencies and the clone are already in place
+_PREBUILT_SETUP_SCRIPT = """# Prebuilt runner AMI: update the existing clone and dependencies
+export PATH="/root/.local/bin:$PATH"
+cd /root/aws-lambda-performance-benchmarks
+echo "Updating repository..."
+git pull --ff-only
+/root/.local/bin/uv sync --all-extras
+"""
+
+# User data templates, filled with str.format_map per launch ({{ }} are literal braces)
+_S3_UPLOAD_TEMPLATE = """
+    # Upload results to S3
+    echo "Uploading results to S3..."
+    TIMESTAMP=$(date +%Y%m%d-%H%M%S)
+    aws s3 cp {log_file} s3://{s3_bucket}/benchmark-results-${{TIMESTAMP}}.log || true
+"""
+
+# CloudWatch agent config shipping the runner log; {instance_id} is resolved by the agent
+_CLOUDWATCH_AGENT_CONFIG = json.dumps(
+    {
+        "logs": {
+            "logs_collected": {
+                "files": {
+                    "collect_list": [
+                        {
+                            "file_path": RUNNER_LOG_FILE,
+                            "log_group_name": LOG_GROUP_NAME,
+                            "log_stream_name": "{instance_id}",
+                        }
+                    ]
+                }
+            }
+        }
+    }
+)
 
+_USER_DATA_TEMPLATE = """#!/bin/bash
+set -e
+
+# Configure logging: everything goes to one file, which the CloudWatch agent tails
+exec &>{log_file}
+
+echo "Starting Lambda benchmark runner setup..."
+
+# Ship the log to CloudWatch Logs (prebuilt AMIs already have the agent, so skip dnf there)
+rpm -q amazon-cloudwatch-agent || dnf install -y amazon-cloudwatch-agent
+cat > /opt/aws/amazon-cloudwatch-agent/etc/benchmark-logs.json <<'EOF'
+{cloudwatch_agent_config}
+EOF
+/opt/aws/amazon-cloudwatch-agent/bin/amazon-cloudwatch-agent-ctl -a fetch-config -m ec2 -s \\
+    -c file:/opt/aws/amazon-cloudwatch-agent/etc/benchmark-logs.json
+
+{setup}
 # Set region (both variables for maximum compatibility)
 export AWS_REGION={region}
 export AWS_DEFAULT_REGION={region}
@@ -291,21 +534,94 @@ echo "AWS Region configured: {region}"
 
 # Run benchmark
 echo "Starting benchmark in {mode} mode..."
-/root/.local/bin/uv run python scripts/benchmark_orchestrator.py --{mode} --yes 2>&1 | tee /tmp/benchmark-results.log
+BENCHMARK_EXIT=0
+/root/.local/bin/uv run python scripts/benchmark_orchestrator.py --{mode} --yes{workers_arg} \\
+    || BENCHMARK_EXIT=$?
 
 # Check exit status
-if [ ${{PIPESTATUS[0]}} -eq 0 ]; then
+if [ $BENCHMARK_EXIT -eq 0 ]; then
     echo "Benchmark completed successfully!"
 else
-    echo "Benchmark failed with exit code ${{PIPESTATUS[0]}}"
+    echo "Benchmark failed with exit code $BENCHMARK_EXIT"
 fi
 {s3_upload}
 # Cleanup and shutdown
-echo "Benchmark runner finished. Logs available in CloudWatch and /var/log/benchmark-setup.log"
+echo "Benchmark runner finished. Logs available in CloudWatch ({log_group}) and {log_file}"
 {shutdown_cmd}
 """
 
-    return base64.b64encode(user_data.encode()).decode()
+
+def get_user_data_script(
+    mode: str,
+    s3_bucket: str | None,
+    region: str,
+    keep_alive: bool,
+    workers: int | None = None,
+    prebuilt: bool = False,
+) -> str:
+    """
+    Generate user data script for EC2 instance.
+
+    prebuilt skips package installation and the clone, which a prebuilt runner AMI
+    already contains.
+    """
+
+    # Determine shutdown behavior
+    shutdown_cmd = "" if keep_alive else "sudo shutdown -h now"
+
+    # S3 upload command (optional)
+    s3_upload = (
+        _S3_UPLOAD_TEMPLATE.format_map({"s3_bucket": s3_bucket, "log_file": RUNNER_LOG_FILE})
+        if s3_bucket
+        else ""
+    )
+
+    # Orchestrator worker count (functions benchmarked in parallel); omitted uses its default
+    workers_arg = f" --workers {workers}" if workers else ""
+
+    user_data = _USER_DATA_TEMPLATE.format_map(
+        {
+            "setup": _PREBUILT_SETUP_SCRIPT if prebuilt else FRESH_SETUP_SCRIPT,
+            "mode": mode,
+            "region": region,
+            "s3_upload": s3_upload,
+            "shutdown_cmd": shutdown_cmd,
+            "workers_arg": workers_arg,
+            "log_file": RUNNER_LOG_FILE,
+            "log_group": LOG_GROUP_NAME,
+            "cloudwatch_agent_config": _CLOUDWATCH_AGENT_CONFIG,
+        }
+    )
+
+    # Plain text: botocore base64-encodes RunInstances UserData itself
+    return user_data
+
+
+def _is_instance_profile_propagation_error(error: ClientError) -> bool:
+    """Whether RunInstances failed only because the instance profile is not visible yet."""
+    code = error.response["Error"]["Code"]
+    message = error.response["Error"].get("Message", "")
+    return code == "InvalidInstanceProfile.NotFound" or (
+        code == "InvalidParameterValue" and "Invalid IAM Instance Profile" in message
+    )
+
+
+def _run_instances_with_profile_retry(ec2_client, **run_kwargs) -> dict:
+    """
+    Call RunInstances, retrying while a new instance profile propagates.
+
+    Replaces a fixed sleep after creating the profile: an existing profile launches on the
+    first attempt, a new one is retried with backoff until EC2 can see it.
+    """
+    for attempt in range(LAUNCH_MAX_ATTEMPTS):
+        try:
+            return ec2_client.run_instances(**run_kwargs)
+        except ClientError as e:
+            if not _is_instance_profile_propagation_error(e) or attempt == LAUNCH_MAX_ATTEMPTS - 1:
+                raise
+            delay = min(2**attempt, LAUNCH_BACKOFF_MAX_SECONDS)
+            log.info(f"Instance profile not propagated yet, retrying launch in {delay}s...")
+            time.sleep(delay)
 
 
 def launch_instance(
@@ -318,17 +634,32 @@ def launch_instance(
     s3_bucket: str | None,
     region: str,
     keep_alive: bool,
-) -> str:
-    """Launch EC2 instance with benchmark runner."""
+    workers: int | None = None,
+    prebuilt: bool = False,
+    instance_type: str = INSTANCE_TYPE,
+) -> tuple[str, dict]:
+    """
+    Launch EC2 instance with benchmark runner.
+
+    Returns the instance ID and the instance description from the RunInstances response,
+    which already includes launch-time details such as the private IP.
+    """
 
-    log.info(f"Launching {INSTANCE_TYPE} instance...")
+    log.info(f"Launching {instance_type} instance...")
 
-    user_data = get_user_data_script(mode, s3_bucket, region, keep_alive)
+    user_data = get_user_data_script(mode, s3_bucket, region, keep_alive, workers, prebuilt)
+
+    # Burstable types default to unlimited credits on T4g; standard mode makes credit
+    # exhaustion show up as throttling instead of silently billed surplus credits
+    credit_kwargs = {}
+    if instance_type.startswith("t"):
+        credit_kwargs["CreditSpecification"] = {"CpuCredits": "standard"}
 
     try:
-        response = ec2_client.run_instances(
+        response = _run_instances_with_profile_retry(
+            ec2_client,
             ImageId=ami_id,
-            InstanceType=INSTANCE_TYPE,
+            InstanceType=instance_type,
             MinCount=1,
             MaxCount=1,
             IamInstanceProfile={"Name": instance_profile_name},
@@ -347,12 +678,17 @@ def launch_instance(
             ],
             # Enable detailed monitoring for better CloudWatch metrics
             Monitoring={"Enabled": False},  # Keep costs low
+            # The closing `shutdown -h now` terminates rather than stops, so the EBS volume is
+            # released; --keep-alive instances keep the default so they can be stopped and resumed
+            InstanceInitiatedShutdownBehavior="stop" if keep_alive else "terminate",
+            **credit_kwargs,
         )
 
-        instance_id = response["Instances"][0]["InstanceId"]
+        instance = response["Instances"][0]
+        instance_id = instance["InstanceId"]
         log.info(f"Launched instance: {instance_id}")
 
-        return instance_id
+        return instance_id, instance
 
     except ClientError as e:
         log.error(f"Failed to launch instance: {e}")
@@ -383,34 +719,54 @@ def main():
         action="store_true",
         help="Keep instance running after benchmark completes (for debugging)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Functions the orchestrator benchmarks in parallel (default: orchestrator default)",
+    )
+    parser.add_argument(
+        "--instance-type",
+        help=(
+            "ARM64 (Graviton) instance type for the runner "
+            "(default: t4g.micro for test, t4g.small otherwise; e.g. c7g.large for production)"
+        ),
+    )
 
     args = parser.parse_args()
+    instance_type = args.instance_type or INSTANCE_TYPE_BY_MODE[args.mode]
 
     # Initialize AWS clients
     session = boto3.Session(region_name=args.region)
     ec2_client = session.client("ec2")
     iam_client = session.client("iam")
     sts_client = session.client("sts")
-
-    # Get account ID
-    account_id = sts_client.get_caller_identity()["Account"]
-    log.info(f"AWS Account: {account_id}, Region: {args.region}")
-
-    # Get default VPC
-    vpcs = ec2_client.describe_vpcs(Filters=[{"Name": "is-default", "Values": ["true"]}])
-    if not vpcs["Vpcs"]:
-        log.error("No default VPC found. Please create one or specify a VPC ID.")
-        sys.exit(1)
-    vpc_id = vpcs["Vpcs"][0]["VpcId"]
-    log.info(f"Using VPC: {vpc_id}")
-
-    # Setup infrastructure
-    ami_id = get_latest_al2023_ami(ec2_client)
-    instance_profile_name = create_iam_role(iam_client, args.region, account_id)
-    security_group_id = create_security_group(ec2_client, vpc_id)
+    ssm_client = session.client("ssm")
+    logs_client = session.client("logs")
+
+    # Setup infrastructure. Independent lookups run concurrently: the AMI and log group need
+    # nothing, the IAM role needs the account ID, and the security group needs the VPC.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        ami_future = executor.submit(get_runner_ami, ec2_client, ssm_client, args.region)
+        log_group_future = executor.submit(create_log_group, logs_client)
+
+        # Get account ID (always live: it identifies the credentials in use, which can change)
+        account_id = sts_client.get_caller_identity()["Account"]
+        log.info(f"AWS Account: {account_id}, Region: {args.region}")
+        role_future = executor.submit(create_iam_role, iam_client, args.region, account_id)
+
+        # Get default VPC
+        vpc_id = get_default_vpc_id(ec2_client, account_id, args.region)
+        log.info(f"Using VPC: {vpc_id}")
+        security_group_future = executor.submit(create_security_group, ec2_client, vpc_id)
+
+        # result() re-raises a worker's failure, including its sys.exit
+        ami_id, prebuilt = ami_future.result()
+        instance_profile_name = role_future.result()
+        security_group_id = security_group_future.result()
+        log_group_future.result()
 
     # Launch instance
-    instance_id = launch_instance(
+    instance_id, instance = launch_instance(
         ec2_client,
         iam_client,
         ami_id,
@@ -420,54 +776,66 @@ def main():
         args.s3_bucket,
         args.region,
         args.keep_alive,
+        args.workers,
+        prebuilt,
+        instance_type,
     )
 
     # Wait for instance to be running
     log.info("Waiting for instance to start...")
     try:
         waiter = ec2_client.get_waiter("instance_running")
-        waiter.wait(InstanceIds=[instance_id])
+        waiter.wait(InstanceIds=[instance_id], WaiterConfig=INSTANCE_RUNNING_WAITER_CONFIG)
         log.info("Instance is running!")
     except WaiterError as e:
         log.error(f"Instance failed to start: {e}")
+        # The role, profile, and security group are reused by later runs; only the instance
+        # would be left behind (and billed) if it reaches running after we give up
+        log.info(f"Terminating instance: {instance_id}")
+        try:
+            ec2_client.terminate_instances(InstanceIds=[instance_id])
+        except ClientError as terminate_error:
+            log.error(f"Failed to terminate {instance_id}: {terminate_error}")
+            log.error(f"  aws ec2 terminate-instances --instance-ids {instance_id}")
         sys.exit(1)
 
-    # Get instance details
-    response = ec2_client.describe_instances(InstanceIds=[instance_id])
-    instance = response["Reservations"][0]["Instances"][0]
-
-    print("\n" + "="*80)
-    print("EC2 BENCHMARK RUNNER LAUNCHED SUCCESSFULLY")
-    print("="*80)
-    print(f"Instance ID:     {instance_id}")
-    print(f"Instance Type:   {INSTANCE_TYPE}")
-    print(f"Mode:            {args.mode}")
-    print(f"Region:          {args.region}")
-    print(f"Private IP:      {instance.get('PrivateIpAddress', 'N/A')}")
-    print(f"Auto-terminate:  {not args.keep_alive}")
-    print("\n" + "-"*80)
-    print("MONITORING:")
-    print("-"*80)
-    print(f"View logs:       aws logs tail /var/log/cloud-init-output.log --follow")
-    print(f"SSH (if needed): aws ssm start-session --target {instance_id}")
-    print(f"Status:          aws ec2 describe-instance-status --instance-ids {instance_id}")
-    print("\n" + "-"*80)
-    print("ESTIMATED DURATION:")
-    print("-"*80)
+    # Build the summary and write it once rather than one print per line
+    lines = [
+        "\n" + "=" * 80,
+        "EC2 BENCHMARK RUNNER LAUNCHED SUCCESSFULLY",
+        "=" * 80,
+        f"Instance ID:     {instance_id}",
+        f"Instance Type:   {instance_type}",
+        f"Mode:            {args.mode}",
+        f"Region:          {args.region}",
+        f"Private IP:      {instance.get('PrivateIpAddress', 'N/A')}",
+        f"Auto-terminate:  {not args.keep_alive}",
+        "\n" + "-" * 80,
+        "MONITORING:",
+        "-" * 80,
+        f"View logs:       aws logs tail {LOG_GROUP_NAME} --log-stream-names {instance_id}"
+        " --follow",
+        f"SSH (if needed): aws ssm start-session --target {instance_id}",
+        f"Status:          aws ec2 describe-instance-status --instance-ids {instance_id}",
+        "\n" + "-" * 80,
+        "ESTIMATED DURATION:",
+        "-" * 80,
+    ]
     if args.mode == "test":
-        print("  ~10 minutes")
+        lines.append("  ~10 minutes")
     elif args.mode == "balanced":
-        print("  ~6-8 hours")
+        lines.append("  ~6-8 hours")
     else:  # production
-        print("  ~18-24 hours")
+        lines.append("  ~18-24 hours")
 
     if not args.keep_alive:
-        print("\nInstance will auto-terminate when complete.")
+        lines.append("\nInstance will auto-terminate when complete.")
     else:
-        print("\nWARNING: Instance will remain running. Terminate manually when done:")
-        print(f"  aws ec2 terminate-instances --instance-ids {instance_id}")
+        lines.append("\nWARNING: Instance will remain running. Terminate manually when done:")
+        lines.append(f"  aws ec2 terminate-instances --instance-ids {instance_id}")
 
-    print("="*80 + "\n")
+    lines.append("=" * 80 + "\n")
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":